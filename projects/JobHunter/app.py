@@ -3,6 +3,91 @@ import pandas as pd
 import plotly.graph_objects as go
 from src.resume_parser import ResumeParser
 from src.job_search import JobSearcher
+from src.cache import ResultCache
+from src.job_store import JobStore, default_store_path
+from src.refresher import Refresher
+from src.job_match import rank_jobs
+from src.gap_analysis import JobIndex, ResumeProfile, split_descriptions
+from src.aggregator import JobAggregator
+from src.job_table import JobTable, csv_bytes, excel_bytes, parquet_bytes
+from src.metrics import metrics, profile
+import os
+import time
+
+# RSS feeds are re-indexed at most this often; searches in between hit the local index only
+RSS_INDEX_TTL = 15 * 60
+# How long a first-ever search waits for the background refresher to index the feeds
+FIRST_INDEX_WAIT = 15
+
+@st.cache_resource
+def get_result_cache():
+    # Shared across reruns and sessions; set JOBHUNTER_CACHE_DB to also persist to disk
+    return ResultCache(max_items=256, path=os.environ.get("JOBHUNTER_CACHE_DB"))
+
+@st.cache_resource
+def get_gap_cache():
+    # Gap results are one entry per (resume, posting); kept apart so they cannot evict
+    # the uploads' text and analysis from get_result_cache(), and in memory only since
+    # compare() recomputes a result faster than SQLite reads it back
+    return ResultCache(max_items=4096)
+
+@st.cache_resource
+def get_job_store():
+    path = default_store_path()
+    if path != ":memory:" and os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    return JobStore(path)
+
+@st.cache_resource
+def get_refresher():
+    # Keeps the index fresh in a background thread. Set JOBHUNTER_REFRESHER=off when
+    # `python -m src.refresher` runs as its own process against the same database.
+    if os.environ.get("JOBHUNTER_REFRESHER", "").lower() in ("0", "off", "false", "no"):
+        return None
+    return Refresher(get_job_store(), JobSearcher(), rss_interval=RSS_INDEX_TTL).start()
+
+def show_index_status(store):
+    """Freshness of each indexed source, as recorded by whichever process refreshed it."""
+    log = store.refresh_log()
+    if not log:
+        return
+    now = time.time()
+    rows = {source: {"Age (min)": round((now - entry["refreshed_at"]) / 60, 1), "Rows": entry["rows"]}
+            for source, entry in log.items()}
+    with st.expander(f"Index freshness ({len(store)} postings)"):
+        st.dataframe(pd.DataFrame(rows).T, use_container_width=True)
+        refresher = get_refresher()
+        if refresher is not None:
+            failing = [s for s in refresher.status() if s["last_error"]]
+            for s in failing:
+                st.caption(f"⚠️ {s['source']}: {s['last_error']} (retrying in {s['next_run_in_s']}s)")
+
+def debug_controls():
+    """Sidebar switches for the metrics layer; returns True when per-request profiling is on."""
+    if st.sidebar.toggle("Debug metrics", value=metrics.enabled, key="debug_metrics"):
+        metrics.enable()
+    else:
+        metrics.disable()
+    return metrics.enabled and st.sidebar.toggle("Profile requests (cProfile)", value=False, key="debug_profile")
+
+def show_debug_panel(profile_report=None):
+    if not metrics.enabled:
+        return
+    with st.expander("🐞 Debug: pipeline metrics"):
+        snap = metrics.snapshot()
+        if snap["spans"]:
+            st.dataframe(pd.DataFrame(snap["spans"]).T, use_container_width=True)
+        st.json(snap["counters"])
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.download_button("metrics.json", metrics.to_json(), "metrics.json", "application/json")
+        with c2:
+            st.download_button("metrics.prom", metrics.to_prometheus(), "metrics.prom", "text/plain")
+        with c3:
+            if st.button("Reset metrics"):
+                metrics.reset()
+        if profile_report is not None and profile_report.text:
+            st.code(profile_report.text, language="text")
 
 # ... (Previous CSS remains same)
 
@@ -11,17 +96,18 @@ def show_ats_scanner():
     st.subheader("Analyze your resume against industry standards")
     
     uploaded_file = st.file_uploader("Upload your Resume (PDF)", type=["pdf"])
+    profiling = debug_controls()
     
     if uploaded_file is not None:
         with st.spinner("Analyzing Resume..."):
             parser = ResumeParser()
-            text = parser.extract_text_from_pdf(uploaded_file)
+            cache = get_result_cache()
+            with profile(enabled=profiling) as report:
+                text, analysis = parser.analyze_pdf(uploaded_file.getvalue(), cache=cache)
             
-            if "Error" in text:
+            if text.startswith("Error extracting text"):
                 st.error("Could not parse PDF. Please ensure it is not text-locked or encrypted.")
                 return
-
-            analysis = parser.analyze_resume(text)
             
             # Store in session state for Job Search
             if 'skills' in analysis:
@@ -71,6 +157,9 @@ def show_ats_scanner():
             with c1:
                 st.metric("Contact Info", f"{sum(1 for v in analysis['contact_info'].values() if v)} Found")
                 if not analysis['contact_info']['linkedin']: st.caption("⚠️ Add LinkedIn")
+                contacts = analysis.get('contacts') or {}
+                listed = contacts.get('emails', []) + contacts.get('phones', [])
+                if len(listed) > 1: st.caption(" · ".join(listed))
             
             with c2:
                 verb_count = analysis.get('content_quality', {}).get('verb_count', 0)
@@ -98,6 +187,30 @@ def show_ats_scanner():
             else:
                 st.warning("No popular technical skills found.")
 
+            show_gap_analysis(text, analysis, get_gap_cache())
+
+            stats = cache.stats()
+            st.caption(f"Cache: {stats['hits']} hits / {stats['misses']} misses")
+            show_debug_panel(report)
+
+def show_gap_analysis(text, analysis, cache):
+    """Match score and missing skills of the uploaded resume against pasted job descriptions."""
+    st.write("### 🎯 Compare with Job Descriptions")
+    pasted = st.text_area(
+        "Paste one or more job descriptions (title on the first line, separate postings with a line containing ---)",
+        height=200, key="gap_descriptions",
+    )
+    jobs = split_descriptions(pasted)
+    if jobs.empty:
+        return
+    index = JobIndex(jobs)
+    report = index.report(ResumeProfile.from_text(text, analysis=analysis), cache=cache)
+    st.dataframe(
+        report[["Title", "Match", "Missing Skills", "Matched Skills", "Missing Keywords"]],
+        column_config={"Match": st.column_config.ProgressColumn("Match", min_value=0, max_value=100, format="%d")},
+        hide_index=True, use_container_width=True,
+    )
+
 
 def show_job_search():
     st.title("🔍 Intelligent Job Search")
@@ -114,6 +227,9 @@ def show_job_search():
         skills_input = st.text_input("Top Skills (comma separated)", ", ".join(default_skills))
         skills_list = [s.strip() for s in skills_input.split(',')] if skills_input else []
 
+    profiling = debug_controls()
+    # Start indexing in the background while the user is still typing
+    get_refresher()
     if st.button("Search Jobs", type="primary"):
         searcher = JobSearcher()
         
@@ -136,54 +252,84 @@ def show_job_search():
         
         st.markdown("### 📡 Job Results")
         
-        with st.spinner("Fetching jobs... this might take a moment if scraping is enabled."):
+        with st.spinner("Searching jobs..."), profile(enabled=profiling) as report:
+            store = get_job_store()
+            refresher = get_refresher()
             if use_scraper:
-                df = searcher.scrape_live_jobs(role, location)
+                aggregate_key = f"aggregate:{role.lower()}:{location.lower()}"
+                indexed = refresher is not None and (
+                    refresher.is_indexed(role, location) or store.last_refresh(aggregate_key) is not None
+                )
+                if not indexed:
+                    # First search for this query: all sources in parallel, rows shown as each answers
+                    partial = st.empty()
+                    def show_partial(merged, source, stats):
+                        partial.dataframe(merged[["Title", "Company", "Date", "Link", "Source"]],
+                                          hide_index=True, use_container_width=True)
+                    merged, source_stats = JobAggregator(searcher).aggregate(role, location, on_partial=show_partial)
+                    partial.empty()
+                    store.upsert(merged, source_key=aggregate_key)
+                    with st.expander("Source timings"):
+                        st.dataframe(pd.DataFrame(source_stats).T, use_container_width=True)
+                if refresher is not None:
+                    # The background schedule keeps this query fresh; later searches only read the index
+                    refresher.watch(role, location, first_run_in=None if indexed else refresher.jobspy_interval)
                 st.caption(f"Scraped from LinkedIn, Indeed, Glassdoor, Google.")
             else:
-                df = searcher.fetch_rss_jobs(role)
+                if refresher is not None:
+                    if store.last_refresh("rss") is None:
+                        refresher.wait_for("rss", timeout=FIRST_INDEX_WAIT)
+                elif store.is_stale("rss", RSS_INDEX_TTL):
+                    searcher.refresh_index(store)
                 st.caption("Fetched from RSS Feeds (WeWorkRemotely, Remotive).")
-            
-            if not df.empty:
-                st.dataframe(
-                    df,
-                    column_config={
-                        "Link": st.column_config.LinkColumn("Apply Link")
-                    },
-                    hide_index=True,
-                    use_container_width=True
-                )
-                
-                # Export Options
-                st.subheader("📤 Export Results")
-                c1, c2 = st.columns(2)
-                
-                with c1:
-                    csv = df.to_csv(index=False).encode('utf-8')
-                    st.download_button(
-                        "Download CSV",
-                        csv,
-                        "jobs.csv",
-                        "text/csv",
-                    )
-                with c2:
-                    # Excel Export logic
-                    try:
-                        import io
-                        buffer = io.BytesIO()
-                        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                            df.to_excel(writer, index=False, sheet_name='DeepSearch_Results')
-                        
-                        st.download_button(
-                            "Download Excel (.xlsx)",
-                            data=buffer,
-                            file_name="jobs.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
-                    except ImportError:
-                        st.error("Install 'openpyxl' to enable Excel export.")
-            else:
-                st.warning("No matching jobs found. Try a broader term or check Smart Links above.")
+            df = store.search(role, with_description=bool(skills_list))
+            st.caption(f"Served from local index ({len(store)} postings).")
+            show_index_status(store)
+
+            # Rank by how well each posting matches the resume skills
+            if skills_list and not df.empty:
+                df = rank_jobs(df, skills_list, with_matches=True).drop(columns=["Description"])
+
+            # Kept across reruns (e.g. clicking an export button) as a compact Arrow table
+            st.session_state["job_results"] = JobTable.from_frame(df)
+            st.session_state["job_exports"] = {}
+
+        show_debug_panel(report)
+
+    table = st.session_state.get("job_results")
+    if table is not None:
+        if len(table):
+            show_job_results(table)
+        else:
+            st.warning("No matching jobs found. Try a broader term or check Smart Links above.")
+
+def show_job_results(table):
+    st.dataframe(
+        table.to_frame(),
+        column_config={
+            "Link": st.column_config.LinkColumn("Apply Link")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+    # Export Options: each file is only built when asked for, then kept for this result set
+    st.subheader("📤 Export Results")
+    exports = st.session_state.setdefault("job_exports", {})
+    formats = {
+        "CSV": (csv_bytes, "jobs.csv", "text/csv"),
+        "Excel (.xlsx)": (excel_bytes, "jobs.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+        "Parquet": (parquet_bytes, "jobs.parquet", "application/vnd.apache.parquet"),
+    }
+    for col, (label, (build, file_name, mime)) in zip(st.columns(len(formats)), formats.items()):
+        with col:
+            if label not in exports and st.button(f"Prepare {label}"):
+                try:
+                    exports[label] = build(table)
+                except ImportError as e:
+                    st.error(f"Install '{e.name}' to enable {label} export.")
+            if label in exports:
+                st.download_button(f"Download {label}", exports[label], file_name, mime)
 
 if __name__ == "__main__":
     main()
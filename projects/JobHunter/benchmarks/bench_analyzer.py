@@ -0,0 +1,63 @@
+"""
+Fused single-pass analyze_resume() vs the per-check pipeline it replaced
+(extract_contacts, check_sections, extract_skills, check_content_quality, split).
+
+    python -m benchmarks.bench_analyzer [--words 500 5000 50000] [--min-speedup 1.4] [--tolerance 0.2]
+
+The two pipelines are timed back to back in each round (best round of each kept), so a
+load spike on the machine cannot land on only one of them. The speedup grows with the
+text (about 1.4x at 500 words, a typical resume; 3x at 5k; about 4x at 50k), and every size
+must reach --min-speedup less --tolerance (the share allowed for timing noise).
+"""
+import argparse
+import time
+
+from src.resume_parser import ResumeParser
+from benchmarks.synthetic import synthetic_resumes
+
+
+def per_check_analyze(parser, text):
+    return parser.build_result(
+        parser.extract_contacts(text),
+        *parser.check_sections(text),
+        parser.extract_skills(text),
+        parser.check_content_quality(text),
+        len(text.split()),
+    )
+
+
+def bench(fns, texts, repeat):
+    best = [float("inf")] * len(fns)
+    for _ in range(repeat):
+        for i, fn in enumerate(fns):
+            start = time.perf_counter()
+            for t in texts:
+                fn(t)
+            best[i] = min(best[i], time.perf_counter() - start)
+    return [b / len(texts) for b in best]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--words", type=int, nargs="+", default=[500, 5000, 50000])
+    ap.add_argument("--resumes", type=int, default=20)
+    ap.add_argument("--repeat", type=int, default=7)
+    ap.add_argument("--min-speedup", type=float, default=1.4, help="expected speedup at every size")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="fraction of --min-speedup allowed for noise")
+    args = ap.parse_args()
+
+    parser = ResumeParser()
+    required = args.min_speedup * (1 - args.tolerance)
+    slow = []
+    for words in args.words:
+        texts = synthetic_resumes(args.resumes, seed=words, words=words)
+        assert all(parser.analyze_resume(t) == per_check_analyze(parser, t) for t in texts), "outputs differ"
+        old, new = bench([lambda t: per_check_analyze(parser, t), parser.analyze_resume], texts, args.repeat)
+        print(f"words={words:>6}  per-check {old * 1000:8.3f}ms  fused {new * 1000:8.3f}ms  speedup {old / new:5.2f}x")
+        if old / new < required:
+            slow.append(f"{old / new:.2f}x at {words} words")
+    assert not slow, f"need {required:.2f}x: " + ", ".join(slow)
+
+
+if __name__ == "__main__":
+    main()
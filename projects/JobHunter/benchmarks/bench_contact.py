@@ -0,0 +1,124 @@
+"""
+Fuzz and timing checks for src/contact.py against the regexes it replaced.
+
+- fuzz: random short strings over an email-heavy alphabet give exactly the matches of
+  the old EMAIL_PATTERN (finditer); every phone found is well formed; analyze_stream()
+  over random page breaks reports the same contacts as analyze_resume().
+- timing: adversarial inputs (runs that almost match) at growing sizes. Fails if
+  extraction time grows faster than linearly or exceeds --budget-us per character.
+
+    python -m benchmarks.bench_contact [--fuzz 50000] [--sizes 4000 16000 64000]
+"""
+import argparse
+import random
+import re
+import time
+
+from src.contact import extract_contacts, iter_emails, phone_key
+from src.resume_parser import ResumeParser
+from benchmarks.synthetic import pathological_resumes, synthetic_resume
+
+LEGACY_EMAIL = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+LEGACY_PHONE = re.compile(r'(\+\d{1,3}[-.]?)?\(?\d{3}\)?[-.]?\d{3}[-.]?\d{4}')
+
+ALPHABET = list("aZ0.-@_%+ \nxc") + ["com", ".io", "@@", "é"]
+PHONE_ALPHABET = list("0123456789 -.()+x\n")
+
+
+def adversarial(size):
+    runs = {name: text for name, text in pathological_resumes(size).items()}
+    runs.update({
+        "at_only": "@" * size,
+        "dot_at": "a.@" * (size // 3),
+        "long_local": "a" * size + "@example.com",
+        "long_domain": "x@" + "a" * size + ".com",
+        "digit_space": "1 " * (size // 2),
+        "parens": "(555)" * (size // 5),
+        "plus_run": "+1-" * (size // 3),
+    })
+    return runs
+
+
+def fuzz_emails(rng, count):
+    for _ in range(count):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 40)))
+        legacy = [(m.start(), m.end(), m.group(0)) for m in LEGACY_EMAIL.finditer(text)]
+        assert list(iter_emails(text)) == legacy, f"email mismatch on {text!r}"
+
+
+def fuzz_phones(rng, count):
+    for _ in range(count):
+        text = "".join(rng.choice(PHONE_ALPHABET) for _ in range(rng.randint(0, 60)))
+        for phone in extract_contacts(text)["phones"]:
+            assert phone in text, f"{phone!r} not in {text!r}"
+            assert 10 <= len(phone_key(phone)) <= 13, f"bad phone {phone!r} in {text!r}"
+
+
+def fuzz_stream(rng, count, parser):
+    for i in range(count):
+        lines = [synthetic_resume(rng, words=rng.randint(60, 300))]
+        for j in range(rng.randint(1, 6)):
+            lines.append(f"contact{j}.{i}@mail{j}.example.org +1 ({rng.randint(200, 999)}) "
+                         f"{rng.randint(200, 999)}-{rng.randint(1000, 9999)} linkedin.com/in/user-{j}")
+        rng.shuffle(lines)
+        text = "\n".join(lines)
+        cuts = sorted(rng.sample(range(1, len(text)), rng.randint(1, 8)))
+        pages = [text[a:b] for a, b in zip([0] + cuts, cuts + [len(text)])]
+        whole = parser.analyze_resume(text)["contacts"]
+        streamed = parser.analyze_stream(pages, overlap=rng.choice([64, 256]))["contacts"]
+        assert streamed == whole, f"stream {streamed} != whole {whole}"
+
+
+def clock(fn, text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_contacts(text):
+    LEGACY_EMAIL.search(text)
+    LEGACY_PHONE.search(text)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--fuzz", type=int, default=50000, help="random strings per fuzz check")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[4000, 16000, 64000])
+    ap.add_argument("--legacy-max", type=int, default=16000, help="largest size timed with the old regexes")
+    ap.add_argument("--budget-us", type=float, default=2.0, help="max extraction time per character")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    parser = ResumeParser(use_spacy=False)
+    start = time.perf_counter()
+    fuzz_emails(rng, args.fuzz)
+    fuzz_phones(rng, args.fuzz)
+    fuzz_stream(rng, max(1, args.fuzz // 500), parser)
+    print(f"fuzz ok: {args.fuzz} email, {args.fuzz} phone, {max(1, args.fuzz // 500)} stream cases "
+          f"({time.perf_counter() - start:.1f}s)")
+
+    sizes = sorted(args.sizes)
+    timings = {}
+    for size in sizes:
+        for name, text in adversarial(size).items():
+            new = clock(extract_contacts, text)
+            old = clock(legacy_contacts, text, repeat=1) if size <= args.legacy_max else None
+            timings.setdefault(name, []).append((len(text), new))
+            legacy = f"{old * 1000:9.2f}ms" if old is not None else "        -  "
+            print(f"{name:15s} size={size:>6}  legacy {legacy}  new {new * 1000:7.2f}ms")
+            assert new / len(text) * 1e6 <= args.budget_us, f"{name}: {new / len(text) * 1e6:.2f}us/char"
+
+    for name, points in timings.items():
+        (small_len, small), (big_len, big) = points[0], points[-1]
+        # Linear growth, with slack for timer noise on the small inputs
+        allowed = big_len / small_len * 3
+        assert big <= max(small, 1e-4) * allowed, f"{name}: {small * 1000:.2f}ms -> {big * 1000:.2f}ms"
+    print(f"timing ok: linear up to {sizes[-1]} chars, under {args.budget_us}us/char")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Near-duplicate detection (MinHash/LSH) on synthetic postings with injected duplicates.
+
+    python -m benchmarks.bench_dedupe [--sizes 1000 10000 100000] [--dup-share 0.2]
+
+Duplicates are reposts of an earlier row under a new link and source, with one word
+of the description changed. Reports time, recall (duplicates removed) and precision
+(removed rows that really were duplicates); the all-pairs baseline runs on the first size.
+"""
+import argparse
+import itertools
+import random
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.dedupe import DEFAULT_COLUMNS, NearDuplicateDetector
+from src.job_match import posting_texts
+from benchmarks.synthetic import FILLER, SKILLS, synthetic_jobs
+
+
+def postings_with_duplicates(count, dup_share, seed=0):
+    """Returns (DataFrame, duplicate_of) where duplicate_of[i] is the original row or -1."""
+    rng = random.Random(seed)
+    originals = max(1, int(count * (1 - dup_share)))
+    df = synthetic_jobs(originals, seed=seed)
+    vocab = FILLER + SKILLS
+    df["Description"] = [d + " " + " ".join(rng.choices(vocab, k=45)) for d in df["Description"]]
+
+    rows = df.to_dict("records")
+    duplicate_of = [-1] * originals
+    for i in range(count - originals):
+        source = rng.randrange(originals)
+        row = dict(rows[source])
+        words = row["Description"].split()
+        words[rng.randrange(len(words))] = rng.choice(vocab)
+        row.update(Description=" ".join(words), Link=f"https://mirror.example.com/{i}", Source="mirror")
+        rows.append(row)
+        duplicate_of.append(source)
+
+    # Shuffle so a repost can appear before its original
+    order = list(range(len(rows)))
+    rng.shuffle(order)
+    position = {old: new for new, old in enumerate(order)}
+    shuffled = pd.DataFrame([rows[i] for i in order])
+    truth = np.array([position[duplicate_of[i]] if duplicate_of[i] >= 0 else -1 for i in order])
+    return shuffled, truth
+
+
+def scores(labels, truth):
+    """(recall, precision) of the dropped rows against the injected duplicates."""
+    n = len(labels)
+    group_of = np.where(truth >= 0, truth, np.arange(n))
+    dropped = labels != np.arange(n)
+    # A drop is right when the row and its kept label come from the same original
+    correct = dropped & (group_of == group_of[labels])
+    expected = n - len(np.unique(group_of))
+    recall = correct.sum() / expected if expected else 1.0
+    precision = correct.sum() / dropped.sum() if dropped.sum() else 1.0
+    return recall, precision
+
+
+def all_pairs_jaccard(texts, threshold, k=3):
+    shingles = []
+    for text in texts:
+        tokens = re.findall(r"[a-z0-9]+", text.lower())
+        shingles.append({tuple(tokens[i:i + k]) for i in range(len(tokens) - k + 1)})
+    pairs = 0
+    for a, b in itertools.combinations(shingles, 2):
+        if len(a & b) / len(a | b) >= threshold:
+            pairs += 1
+    return pairs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--dup-share", type=float, default=0.2)
+    ap.add_argument("--threshold", type=float, default=0.8)
+    args = ap.parse_args()
+
+    detector = NearDuplicateDetector(threshold=args.threshold)
+    print(f"num_perm={detector.num_perm} bands={detector.bands} rows={detector.rows} threshold={args.threshold}")
+    for i, size in enumerate(args.sizes):
+        df, truth = postings_with_duplicates(size, args.dup_share, seed=size)
+        texts = posting_texts(df, DEFAULT_COLUMNS)
+        start = time.perf_counter()
+        labels = detector.labels(texts)
+        seconds = time.perf_counter() - start
+        recall, precision = scores(labels, truth)
+        print(f"rows={size:>7}  minhash+lsh {seconds * 1000:8.1f}ms  kept={int((labels == np.arange(size)).sum()):>7}"
+              f"  recall={recall:.3f}  precision={precision:.3f}")
+
+        if i == 0:
+            start = time.perf_counter()
+            all_pairs_jaccard(texts, args.threshold)
+            brute = time.perf_counter() - start
+            print(f"rows={size:>7}  all-pairs   {brute * 1000:8.1f}ms  "
+                  f"(quadratic: ~{brute * (args.sizes[-1] / size) ** 2:.0f}s at {args.sizes[-1]} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Gap analysis of many resumes against many postings: precomputed JobIndex with one
+batched pass per resume, versus running extract_skills on every posting for every resume.
+
+    python -m benchmarks.bench_gap [--jobs 100 1000] [--resumes 20]
+
+Also times report() without a cache, with an in-memory ResultCache and with a SQLite-backed
+one, cold and warm, and asserts that filling the in-memory cache (as the app does) costs
+no more than the compare() it saves.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from src.cache import ResultCache
+from src.gap_analysis import JobIndex, ResumeProfile
+from src.resume_parser import ResumeParser
+from benchmarks.synthetic import synthetic_jobs, synthetic_resumes
+
+
+def naive_missing(parser, resume_skills, texts):
+    """Per posting: skills it asks for that the resume lacks (re-scanning each posting every time)."""
+    return [[s for s in parser.extract_skills(t) if s not in resume_skills] for t in texts]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, nargs="+", default=[100, 1000])
+    ap.add_argument("--resumes", type=int, default=20)
+    args = ap.parse_args()
+
+    parser = ResumeParser(use_spacy=False)
+    resumes = synthetic_resumes(args.resumes, seed=7)
+    for count in args.jobs:
+        df = synthetic_jobs(count, seed=count)
+        texts = (df["Title"] + " " + df["Description"]).tolist()
+
+        start = time.perf_counter()
+        profiles = [ResumeProfile.from_text(t, parser) for t in resumes]
+        naive = [naive_missing(parser, p.skills, texts) for p in profiles]
+        naive_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = JobIndex(df)
+        index_s = time.perf_counter() - start
+        start = time.perf_counter()
+        profiles = [ResumeProfile.from_text(t, parser) for t in resumes]
+        batched = [index.compare(p) for p in profiles]
+        compare_s = time.perf_counter() - start
+
+        for n, b in zip(naive, batched):
+            assert [sorted(m) for m in n] == [sorted(r["missing_skills"]) for r in b], "missing skills differ"
+
+        def reports(make_cache, repeat=3):
+            """Best-of-`repeat` seconds for a report per resume on a fresh cache, then on the filled one."""
+            cold = warm = float("inf")
+            for _ in range(repeat):
+                cache = make_cache()
+                for attempt in ("cold", "warm"):
+                    start = time.perf_counter()
+                    for p in profiles:
+                        index.report(p, cache=cache)
+                    seconds = time.perf_counter() - start
+                    if attempt == "cold":
+                        cold = min(cold, seconds)
+                    else:
+                        warm = min(warm, seconds)
+                if cache is not None:
+                    cache.close()
+            return cold, warm
+
+        uncached_s, _ = reports(lambda: None)
+        cold_s, warm_s = reports(lambda: ResultCache(max_items=count * args.resumes))
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = iter(os.path.join(tmp, f"{i}.db") for i in range(3))
+            disk_cold_s, disk_warm_s = reports(lambda: ResultCache(max_items=count * args.resumes, path=next(paths)))
+
+        pairs = count * args.resumes
+        print(f"jobs={count:>5} resumes={args.resumes}  naive {naive_s * 1000:8.1f}ms  "
+              f"index {index_s * 1000:7.1f}ms + compare {compare_s * 1000:7.1f}ms "
+              f"({pairs / compare_s:,.0f} pairs/s, {naive_s / (index_s + compare_s):.1f}x)")
+        print(f"{'':<23}report uncached {uncached_s * 1000:7.1f}ms  memory cold {cold_s * 1000:7.1f}ms / "
+              f"warm {warm_s * 1000:7.1f}ms  sqlite cold {disk_cold_s * 1000:7.1f}ms / warm {disk_warm_s * 1000:7.1f}ms")
+        assert cold_s - uncached_s <= compare_s, "caching gap results costs more than computing them"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+google_custom_scrape against a recorded results page served locally: the old
+requests.get + full BeautifulSoup parse + per-domain substring tests, versus the
+pooled session and anchor-only parsers in src/serp.py.
+
+    python -m benchmarks.bench_google [--queries 8] [--delay 0.1] [--repeat 20]
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+import requests
+from bs4 import BeautifulSoup
+
+from src import serp
+from src.job_search import JobSearcher
+from benchmarks.local_server import FIXTURES, FixtureServer
+
+ATS = ['greenhouse.io', 'lever.co', 'workday', 'linkedin.com/jobs']
+
+
+def legacy_links(html):
+    """The extraction google_custom_scrape used to do."""
+    links = []
+    for a in BeautifulSoup(html, 'html.parser').find_all('a', href=True):
+        href = a['href']
+        if href.startswith("http") and "google.com" not in href:
+            if any(d in href for d in ATS):
+                links.append({"Title": a.get_text()[:50] + "...", "Link": href})
+    return list({v['Link']: v for v in links}.values())
+
+
+def legacy_scrape(url, headers):
+    res = requests.get(url, headers=headers, timeout=10)
+    return legacy_links(res.text)
+
+
+def available_parsers():
+    names = []
+    for name, module in (("selectolax", "selectolax.lexbor"), ("lxml", "lxml.html")):
+        try:
+            __import__(module)
+            names.append(name)
+        except ImportError:
+            pass
+    return names + ["soup"]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--queries", type=int, default=8)
+    ap.add_argument("--delay", type=float, default=0.1, help="simulated latency per results page")
+    ap.add_argument("--repeat", type=int, default=20, help="parses per parser")
+    args = ap.parse_args()
+
+    with open(os.path.join(FIXTURES, "google_results.html"), encoding="utf-8") as f:
+        html = f.read()
+    date = datetime.now().strftime("%Y-%m-%d")
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        legacy = legacy_links(html)
+    legacy_ms = (time.perf_counter() - start) / args.repeat * 1000
+    print(f"parse  legacy soup      {legacy_ms:7.2f}ms/page  {len(legacy)} links")
+
+    legacy_urls = {row["Link"] for row in legacy}
+    for name in available_parsers():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            rows = serp.job_links(html, date, parser=name)
+        ms = (time.perf_counter() - start) / args.repeat * 1000
+        urls = {row["Link"] for row in rows}
+        # Same links as before, plus the /url?q= redirects the old filter threw away
+        assert legacy_urls <= urls, f"{name} lost links: {sorted(legacy_urls - urls)[:3]}"
+        print(f"parse  {name:16s} {ms:7.2f}ms/page  {len(rows)} links ({legacy_ms / ms:.1f}x)")
+
+    queries = [f"role {i}" for i in range(args.queries)]
+    with FixtureServer(routes={"/search": "google_results.html"}, delays={"/search": args.delay}) as server:
+        searcher = JobSearcher(google_search_url=server.url("/search"))
+
+        start = time.perf_counter()
+        for q in queries:
+            legacy_scrape(f"{server.url('/search')}?q={q}", searcher.headers)
+        seq_s = time.perf_counter() - start
+        seq_requests = server.requests
+
+        start = time.perf_counter()
+        df = searcher.google_custom_scrape(queries, "Remote", raise_errors=True)
+        pooled_s = time.perf_counter() - start
+        assert legacy_urls <= set(df["Link"]), "pooled scrape lost links"
+
+        # Second round reuses the pooled connections
+        start = time.perf_counter()
+        searcher.google_custom_scrape(queries, "Remote", raise_errors=True)
+        warm_s = time.perf_counter() - start
+
+    print(f"fetch  {args.queries} queries, {args.delay * 1000:.0f}ms latency: "
+          f"sequential legacy {seq_s * 1000:7.1f}ms ({seq_requests} requests)  "
+          f"concurrent pooled {pooled_s * 1000:7.1f}ms ({seq_s / pooled_s:.1f}x), "
+          f"warm {warm_s * 1000:7.1f}ms  -> {len(df)} links")
+
+
+if __name__ == "__main__":
+    main()
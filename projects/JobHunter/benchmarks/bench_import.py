@@ -0,0 +1,62 @@
+"""
+Import-time budget check. Each module is imported in a fresh interpreter with
+`python -X importtime`; the best cumulative time over several runs must stay within
+its budget, and none of its "forbidden" heavy dependencies may be loaded eagerly.
+Exits non-zero on any regression.
+
+    python -m benchmarks.bench_import [--runs 5] [--budgets benchmarks/import_budgets.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+
+def import_time_ms(module):
+    """Cumulative import time of `module` in a fresh interpreter, from -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    for line in reversed(proc.stderr.splitlines()):
+        # "import time: self [us] | cumulative | imported package"
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"no importtime line for {module}")
+
+
+def loaded_modules(module):
+    code = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(json.loads(proc.stdout))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budgets", default=os.path.join(HERE, "import_budgets.json"))
+    args = ap.parse_args()
+
+    with open(args.budgets, encoding="utf-8") as f:
+        budgets = json.load(f)
+
+    failures = 0
+    for module, spec in budgets.items():
+        best = min(import_time_ms(module) for _ in range(args.runs))
+        eager = sorted(m for m in spec.get("forbidden", []) if m in loaded_modules(module))
+        ok = best <= spec["budget_ms"] and not eager
+        failures += not ok
+        status = "ok  " if ok else "FAIL"
+        note = f"  eagerly imports: {', '.join(eager)}" if eager else ""
+        print(f"{status} {module:22s} {best:7.1f}ms (budget {spec['budget_ms']}ms){note}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
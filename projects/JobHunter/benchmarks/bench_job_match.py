@@ -0,0 +1,57 @@
+"""
+Times ranking synthetic postings against one resume: rank_jobs(df, resume) end to end
+as the app calls it, first on a new result set (builds the JobSkillMatrix) and then
+again on the same one (matrix reused from the per-result-set cache), plus the build
+and score+sort steps on their own. Checks that resume skills given as aliases ("k8s")
+score like the skills they stand for.
+
+    python -m benchmarks.bench_job_match [--sizes 1000 10000 100000] [--budget 1.0]
+"""
+import argparse
+import time
+
+from src import job_match
+from src.job_match import JobSkillMatrix, rank_jobs, score_jobs
+from benchmarks.synthetic import synthetic_jobs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    ap.add_argument("--budget", type=float, default=1.0, help="max seconds for a cached rank_jobs on the largest size")
+    args = ap.parse_args()
+
+    resume = {"skills": ["python", "django", "aws", "docker", "sql", "rest api"]}
+    rank_jobs(synthetic_jobs(10), resume)  # compile the matcher outside the timed region
+
+    for size in args.sizes:
+        df = synthetic_jobs(size)
+        job_match._matrix_cache.clear()
+        start = time.perf_counter()
+        ranked = rank_jobs(df, resume, with_matches=True)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cached = rank_jobs(df, resume, with_matches=True)
+        warm = time.perf_counter() - start
+        assert cached["Match"].tolist() == ranked["Match"].tolist()
+
+        start = time.perf_counter()
+        matrix = JobSkillMatrix(df)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rank_jobs(df, resume, matrix=matrix)
+        score = time.perf_counter() - start
+        print(f"rows={size:>7}  rank_jobs cold {cold * 1000:8.1f}ms  cached {warm * 1000:7.1f}ms  "
+              f"(build {build * 1000:8.1f}ms  score+sort {score * 1000:7.1f}ms)  top={ranked['Match'].iloc[0]}")
+    assert warm <= args.budget, f"cached rank_jobs took {warm:.2f}s on {size} rows"
+
+    aliased = score_jobs(df, ["k8s", "postgres", "python"], with_matches=True)
+    named = score_jobs(df, ["kubernetes", "postgresql", "python"], with_matches=True)
+    assert aliased["Match"].tolist() == named["Match"].tolist(), "resume aliases should score as their skill"
+    assert aliased["Matched Skills"].tolist() == named["Matched Skills"].tolist()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Memory and throughput of job results as Python dicts, a plain DataFrame, a categorical
+DataFrame and an Arrow table, plus Parquet round trips and chunked CSV export.
+
+    python -m benchmarks.bench_job_table [--rows 100000] [--excel]
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from src.job_table import JobTable, compact_frame, csv_bytes, excel_bytes, iter_csv
+from benchmarks.synthetic import synthetic_jobs
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def _records_bytes(records):
+    """Deep size of a list of dicts of strings (strings shared between rows counted once)."""
+    seen, total = set(), sys.getsizeof(records)
+    for record in records:
+        total += sys.getsizeof(record)
+        for value in record.values():
+            if id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+    return total
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--excel", action="store_true", help="also time the .xlsx export (slow)")
+    args = ap.parse_args()
+
+    records = synthetic_jobs(args.rows).to_dict("records")
+    mb = 1024 * 1024
+
+    frame, frame_s = _timed(lambda: pd.DataFrame(records))
+    compact, compact_s = _timed(lambda: compact_frame(frame))
+    table, table_s = _timed(lambda: JobTable.from_records(records))
+
+    print(f"rows={args.rows}")
+    print(f"list of dicts        {_records_bytes(records) / mb:8.1f} MB")
+    print(f"DataFrame            {frame.memory_usage(deep=True).sum() / mb:8.1f} MB  build {frame_s * 1000:7.1f}ms")
+    print(f"categorical frame    {compact.memory_usage(deep=True).sum() / mb:8.1f} MB  build +{compact_s * 1000:6.1f}ms")
+    print(f"Arrow table          {table.nbytes / mb:8.1f} MB  build {table_s * 1000:7.1f}ms (from dicts)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "jobs.parquet")
+        _, save_s = _timed(lambda: table.save(path))
+        loaded, load_s = _timed(lambda: JobTable.load(path))
+        _, frame_back_s = _timed(loaded.to_frame)
+        print(f"Parquet (zstd)       {os.path.getsize(path) / mb:8.1f} MB  write {save_s * 1000:7.1f}ms  "
+              f"read {load_s * 1000:6.1f}ms  to pandas {frame_back_s * 1000:6.1f}ms")
+
+    _, full_csv_s = _timed(lambda: frame.to_csv(index=False).encode("utf-8"))
+    tracemalloc.start()
+    start = time.perf_counter()
+    chunks = iter_csv(table)
+    first = next(chunks)
+    first_s = time.perf_counter() - start
+    total = len(first) + sum(len(c) for c in chunks)
+    chunked_s = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"CSV, whole frame     {full_csv_s * 1000:8.1f}ms")
+    print(f"CSV, chunked         {chunked_s * 1000:8.1f}ms  first chunk after {first_s * 1000:.1f}ms  "
+          f"{total / mb:.1f} MB at {total / mb / chunked_s:.0f} MB/s, peak Python heap {peak / mb:.1f} MB")
+    from_table = pd.read_csv(io.BytesIO(csv_bytes(table)))
+    assert from_table.equals(pd.read_csv(io.BytesIO(b"".join(iter_csv(compact))))), "CSV export differs"
+
+    if args.excel:
+        _, excel_s = _timed(lambda: excel_bytes(table))
+        print(f"Excel (write-only)   {excel_s * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Whole-document extract_text() vs page-by-page streaming with budgets.
+Reports wall time and peak Python heap (tracemalloc) for a long synthetic CV.
+
+    python -m benchmarks.bench_pdf_stream [--pages 60]
+"""
+import argparse
+import io
+import random
+import time
+import tracemalloc
+
+from pdfminer.high_level import extract_text
+
+from src.resume_parser import ResumeParser
+from benchmarks.synthetic import synthetic_pdf, synthetic_resume
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=60)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    pdf = synthetic_pdf([synthetic_resume(rng, words=700) for _ in range(args.pages)])
+    parser = ResumeParser()
+
+    def full():
+        return parser.analyze_resume(extract_text(io.BytesIO(pdf)))
+
+    def streamed(**limits):
+        def run():
+            stream = parser.stream_pdf_pages(pdf, **limits)
+            return parser.analyze_stream(stream), dict(stream.stats(), max_seconds=stream.max_seconds)
+        return run
+
+    cases = [
+        ("extract_text + analyze_resume", full),
+        ("stream, no limits", streamed(max_pages=None, max_chars=None, max_seconds=None)),
+        ("stream, default budgets", streamed()),
+        ("stream, enough_chars=8000", streamed(enough_chars=8000)),
+        ("stream, max_seconds=0.2", streamed(max_pages=None, max_seconds=0.2)),
+        ("stream, max_seconds=1.0", streamed(max_pages=None, max_seconds=1.0)),
+    ]
+    print(f"pages={args.pages} pdf={len(pdf) / 1024:.0f}KiB")
+    for name, fn in cases:
+        result, elapsed, peak = measure(fn)
+        extra = ""
+        if isinstance(result, tuple):
+            result, stats = result
+            extra = f" pages={stats['pages']} stop={stats['stop_reason']}"
+            if stats["stop_reason"] == "max_seconds":
+                limit = stats["max_seconds"]
+                # The deadline is checked inside each page; only one layout pass can run over
+                assert stats["elapsed"] <= limit * 1.5, f"max_seconds={limit} ran {stats['elapsed']:.3f}s"
+        print(f"{name:32s} {elapsed * 1000:8.1f}ms  peak {peak / 1024 / 1024:6.2f}MiB  score={result.get('score')}{extra}")
+
+
+if __name__ == "__main__":
+    main()
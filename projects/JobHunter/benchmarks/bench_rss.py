@@ -0,0 +1,72 @@
+"""
+Sequential vs concurrent RSS fetching against a local fixture server.
+
+    python -m benchmarks.bench_rss [--feeds 20] [--delay 0.3]
+"""
+import argparse
+import time
+
+import feedparser
+
+from src.feed_fetcher import FeedFetcher
+from benchmarks.local_server import FixtureServer
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--feeds", type=int, default=20)
+    ap.add_argument("--delay", type=float, default=0.3, help="simulated latency per feed")
+    args = ap.parse_args()
+
+    routes = {f"/feed{i}.rss": "remote_jobs.rss" for i in range(args.feeds)}
+    routes["/hung.rss"] = "remote_jobs.rss"
+    delays = {path: args.delay for path in routes}
+    delays["/hung.rss"] = 5
+
+    with FixtureServer(routes=routes, delays=delays) as server:
+        urls = [server.url(path) for path in routes if path != "/hung.rss"]
+
+        start = time.perf_counter()
+        sequential = sum(len(feedparser.parse(u).entries) for u in urls)
+        seq_time = time.perf_counter() - start
+
+        fetcher = FeedFetcher(ttl=0, timeout=2)
+        start = time.perf_counter()
+        results, _ = fetcher.fetch_all(urls)
+        cold_time = time.perf_counter() - start
+        concurrent = sum(len(v) for v in results.values())
+
+        # TTL expired -> conditional GET, server answers 304
+        start = time.perf_counter()
+        fetcher.fetch_all(urls)
+        revalidate_time = time.perf_counter() - start
+
+        # A hung feed only costs its own deadline
+        start = time.perf_counter()
+        results, errors = fetcher.fetch_all(urls + [server.url("/hung.rss")], deadline=1)
+        hung_time = time.perf_counter() - start
+
+        warm = FeedFetcher(ttl=600)
+        warm.fetch_all(urls)
+        start = time.perf_counter()
+        warm.fetch_all(urls)
+        cached_time = time.perf_counter() - start
+
+        # What the refresher does: within the TTL, but still asks every feed
+        not_modified = server.not_modified
+        start = time.perf_counter()
+        warm.fetch_all(urls, revalidate=True)
+        forced_time = time.perf_counter() - start
+        assert server.not_modified - not_modified == len(urls), "revalidate=True answered from the TTL cache"
+
+    print(f"feeds={len(urls)} delay={args.delay}s entries seq={sequential} concurrent={concurrent}")
+    print(f"sequential feedparser : {seq_time:7.3f}s")
+    print(f"concurrent (cold)     : {cold_time:7.3f}s")
+    print(f"conditional GET (304) : {revalidate_time:7.3f}s ({server.not_modified} not-modified)")
+    print(f"with one hung feed    : {hung_time:7.3f}s, {len(results)} feeds returned, errors={list(errors)}")
+    print(f"TTL cache hit         : {cached_time * 1000:7.2f}ms")
+    print(f"revalidate within TTL : {forced_time:7.3f}s ({len(urls)} conditional GETs)")
+
+
+if __name__ == "__main__":
+    main()
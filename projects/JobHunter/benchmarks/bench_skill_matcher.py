@@ -0,0 +1,59 @@
+"""
+Compares the single-scan SkillMatcher against the old per-skill regex loop.
+
+    python -m benchmarks.bench_skill_matcher [--resumes 10000] [--extra-skills 0]
+"""
+import argparse
+import re
+import time
+
+from src.resume_parser import ResumeParser
+from src.skill_matcher import SkillMatcher
+from benchmarks.synthetic import synthetic_resumes
+
+
+def legacy_extract_skills(skills, text):
+    text_lower = text.lower()
+    found = []
+    for skill in skills:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text_lower):
+            found.append(skill)
+    return found
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--resumes", type=int, default=10000)
+    ap.add_argument("--extra-skills", type=int, default=0,
+                    help="pad the vocabulary with synthetic terms to mimic a large taxonomy")
+    args = ap.parse_args()
+
+    skills = set(ResumeParser().common_skills)
+    skills.update(f"skill{i} tool" for i in range(args.extra_skills))
+    texts = synthetic_resumes(args.resumes)
+
+    # Warm up the regex cache for the legacy loop so we compare steady-state cost
+    legacy_extract_skills(skills, texts[0])
+    start = time.perf_counter()
+    legacy = [set(legacy_extract_skills(skills, t)) for t in texts]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = SkillMatcher(skills)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = [set(matcher.find(t.lower())) for t in texts]
+    fast_time = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(legacy, fast) if a != b)
+    print(f"resumes={len(texts)} skills={len(skills)}")
+    print(f"legacy loop : {legacy_time:8.3f}s")
+    print(f"matcher     : {fast_time:8.3f}s (build {build_time * 1000:.1f}ms)")
+    print(f"speedup     : {legacy_time / fast_time:8.1f}x")
+    print(f"mismatches  : {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
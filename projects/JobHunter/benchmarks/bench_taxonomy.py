@@ -0,0 +1,118 @@
+"""
+Taxonomy compile/load cost and extract_skills speed for the bundled taxonomy and a
+synthetic large one layered on top of it.
+
+    python -m benchmarks.bench_taxonomy [--terms 20000] [--resumes 2000] [--postings 250]
+
+Reports the time to compile the source files, to load the pickled artifact, and
+extract_skills per resume for both vocabularies; asserts that aliases resolve and that
+the large taxonomy finds the same default skills as the small one. Then times
+SkillMatcher.find() on one large text dense with hits (--postings resumes joined, plus
+a sprinkle of the synthetic terms) and asserts the large vocabulary stays within
+--max-slowdown of the default one there: a scan must cost per character, not per term.
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from src.resume_parser import ResumeParser
+from src.taxonomy import DEFAULT_FILES, compile_taxonomy, load_artifact, load_taxonomy, save_artifact
+from benchmarks.synthetic import synthetic_resumes
+
+
+def synthetic_taxonomy(path, terms, seed=0):
+    """Writes a taxonomy file with `terms` made-up skills (one, two or three words) and aliases."""
+    rng = random.Random(seed)
+    syllables = ["ka", "lo", "mi", "ter", "zu", "ra", "flux", "net", "io", "dex", "pro", "sys", "ql", "vo"]
+
+    def word():
+        return "".join(rng.choices(syllables, k=rng.randint(2, 4)))
+
+    skills = set()
+    while len(skills) < terms:
+        skills.add(" ".join(word() for _ in range(rng.choice((1, 1, 2, 3)))))
+    skills = sorted(skills)
+    categories = {f"Group {i}": skills[i::50] for i in range(50)}
+    aliases = {skill: [skill.replace(" ", "-") + "js"] for skill in skills[::10]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"name": "synthetic", "version": "0.0.1", "categories": categories, "aliases": aliases}, f)
+
+
+def _timed(fn, repeat=1):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def per_resume_ms(parser, texts):
+    _, seconds = _timed(lambda: [parser.extract_skills(t) for t in texts])
+    return seconds / len(texts) * 1000
+
+
+def dense_text(texts, taxonomy, postings, seed=0):
+    """`postings` resumes joined, with a few of the taxonomy's terms added to each one."""
+    rng = random.Random(seed)
+    terms = sorted(taxonomy.skills | set(taxonomy.aliases))
+    return "\n".join(f"{text} {' '.join(rng.sample(terms, 10))}" for text in texts[:postings])
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--terms", type=int, default=20_000)
+    ap.add_argument("--resumes", type=int, default=2000)
+    ap.add_argument("--postings", type=int, default=250)
+    ap.add_argument("--max-slowdown", type=float, default=3.0)
+    args = ap.parse_args()
+
+    texts = synthetic_resumes(args.resumes)
+    with tempfile.TemporaryDirectory() as tmp:
+        extra = os.path.join(tmp, "synthetic.json")
+        synthetic_taxonomy(extra, args.terms)
+
+        rows = []
+        for label, paths in (("default", DEFAULT_FILES), (f"+{args.terms} terms", DEFAULT_FILES + (extra,))):
+            taxonomy, compile_s = _timed(lambda: compile_taxonomy(paths))
+            artifact = os.path.join(tmp, f"{len(rows)}.pkl")
+            save_artifact(taxonomy, artifact)
+            _, load_s = _timed(lambda: load_artifact(artifact), repeat=5)
+            cold = load_taxonomy(paths, cache_dir=os.path.join(tmp, "cache"))
+            warm = load_taxonomy(paths, cache_dir=os.path.join(tmp, "cache"))
+            assert cold.fingerprint == warm.fingerprint
+            parser = ResumeParser(use_spacy=False, taxonomy=warm)
+            per_resume_ms(parser, texts[:50])
+            rows.append((label, taxonomy, compile_s, load_s, os.path.getsize(artifact), per_resume_ms(parser, texts)))
+
+        for label, taxonomy, compile_s, load_s, size, ms in rows:
+            print(f"{label:<16} terms={len(taxonomy.skills) + len(taxonomy.aliases):>6}  compile {compile_s * 1000:7.1f}ms  "
+                  f"artifact {size / 1024:6.0f} KiB, load {load_s * 1000:6.1f}ms  extract_skills {ms:.3f}ms/resume")
+
+        small, large = rows[0][1], rows[1][1]
+        default_parser = ResumeParser(use_spacy=False, taxonomy=small)
+        large_parser = ResumeParser(use_spacy=False, taxonomy=large)
+        assert default_parser.extract_skills("Ran k8s on postgres with sklearn") == \
+            ["kubernetes", "postgresql", "scikit-learn"], "aliases should resolve to their skill"
+        for text in texts[:200]:
+            found = [s for s in large_parser.extract_skills(text) if s in small.skills]
+            assert found == default_parser.extract_skills(text), "large taxonomy changed default matches"
+        print("aliases resolve; default matches unchanged under the large taxonomy")
+
+        text = dense_text(texts, large, args.postings).lower()
+        timings = []
+        for label, taxonomy in (("default", small), (f"+{args.terms} terms", large)):
+            taxonomy.matcher.find(text[:1000])
+            found, seconds = _timed(lambda: taxonomy.matcher.find(text), repeat=3)
+            timings.append(seconds)
+            print(f"{label:<16} find() on {args.postings} postings ({len(text) / 1e6:.1f}M chars): "
+                  f"{seconds * 1000:7.1f}ms, {len(found)} skills")
+        assert timings[1] <= timings[0] * args.max_slowdown, \
+            f"large vocabulary {timings[1] / timings[0]:.1f}x slower on a large text"
+
+
+if __name__ == "__main__":
+    main()
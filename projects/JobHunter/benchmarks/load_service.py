@@ -0,0 +1,151 @@
+"""
+Load test for the HTTP service (src/service.py): latency percentiles and throughput.
+
+    python -m benchmarks.load_service [--requests 2000] [--concurrency 32] [--pdf-share 0.1]
+    python -m benchmarks.load_service --url http://127.0.0.1:8000   # existing instance
+
+Without --url, a local instance is started on a free port and stopped afterwards.
+"""
+import argparse
+import http.client
+import json
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.synthetic import synthetic_pdf, synthetic_resumes
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_ready(host, port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=2)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                conn.close()
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"service on {host}:{port} did not become ready")
+
+
+def _percentile(sorted_values, p):
+    if not sorted_values:
+        return float("nan")
+    k = min(len(sorted_values) - 1, max(0, round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def build_payloads(count, words, pdf_share, seed=0):
+    rng = random.Random(seed)
+    texts = synthetic_resumes(min(count, 200), seed=seed, words=words)
+    pdfs = [synthetic_pdf([t[:3000]]) for t in texts[:20]]
+    payloads = []
+    for i in range(count):
+        if pdfs and rng.random() < pdf_share:
+            payloads.append(("/analyze/pdf", pdfs[i % len(pdfs)], "application/pdf"))
+        else:
+            body = json.dumps({"text": texts[i % len(texts)]}).encode()
+            payloads.append(("/analyze", body, "application/json"))
+    return payloads
+
+
+def run_load(host, port, payloads, concurrency):
+    """Sends every payload over `concurrency` keep-alive connections; returns (latencies, statuses, seconds)."""
+    latencies, statuses = [], {}
+    lock = threading.Lock()
+    cursor = iter(range(len(payloads)))
+
+    def client():
+        conn = http.client.HTTPConnection(host, port, timeout=60)
+        while True:
+            with lock:
+                i = next(cursor, None)
+            if i is None:
+                break
+            path, body, content_type = payloads[i]
+            start = time.perf_counter()
+            try:
+                conn.request("POST", path, body=body, headers={"Content-Type": content_type})
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=60)
+                status = "error"
+            elapsed = time.perf_counter() - start
+            with lock:
+                statuses[status] = statuses.get(status, 0) + 1
+                if status in (200, 422):
+                    latencies.append(elapsed)
+        conn.close()
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, statuses, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--url", default=None, help="existing instance; default starts a local one")
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=32)
+    ap.add_argument("--words", type=int, default=600, help="words per synthetic resume")
+    ap.add_argument("--pdf-share", type=float, default=0.1, help="fraction of requests uploading a PDF")
+    ap.add_argument("--workers", type=int, default=None, help="workers for the local instance")
+    ap.add_argument("--max-batch", type=int, default=16)
+    ap.add_argument("--queue-limit", type=int, default=256)
+    args = ap.parse_args()
+
+    payloads = build_payloads(args.requests, args.words, args.pdf_share)
+
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname, parts.port or 80
+    else:
+        host, port = "127.0.0.1", _free_port()
+        cmd = [sys.executable, "-m", "src.service", "--host", host, "--port", str(port),
+               "--max-batch", str(args.max_batch), "--queue-limit", str(args.queue_limit)]
+        if args.workers:
+            cmd += ["--workers", str(args.workers)]
+        server = subprocess.Popen(cmd)
+    try:
+        _wait_ready(host, port)
+        # Warm-up round so connection setup and first-batch costs are not measured
+        run_load(host, port, payloads[:min(50, len(payloads))], min(4, args.concurrency))
+        latencies, statuses, seconds = run_load(host, port, payloads, args.concurrency)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    latencies.sort()
+    served = len(latencies)
+    print(f"requests={args.requests} concurrency={args.concurrency} words={args.words} pdf_share={args.pdf_share}")
+    print(f"status counts : {dict(sorted(statuses.items(), key=str))}")
+    print(f"throughput    : {served / seconds:8.1f} req/s ({served} served in {seconds:.2f}s)")
+    print(f"latency p50   : {_percentile(latencies, 50) * 1000:8.1f} ms")
+    print(f"latency p99   : {_percentile(latencies, 99) * 1000:8.1f} ms")
+    print(f"latency max   : {(latencies[-1] if latencies else float('nan')) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
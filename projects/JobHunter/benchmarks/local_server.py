@@ -0,0 +1,72 @@
+import hashlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class FixtureServer:
+    """
+    Serves files from benchmarks/fixtures on localhost, standing in for real job sites.
+    `delays` maps a URL path to a sleep in seconds; ETag / If-None-Match is honoured.
+
+        with FixtureServer(delays={"/slow.rss": 2}) as server:
+            server.url("feed.rss")
+    """
+
+    def __init__(self, routes=None, delays=None):
+        self.routes = routes or {}  # path -> fixture file name
+        self.delays = delays or {}
+        self.requests = 0
+        self.not_modified = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so clients that pool connections actually reuse them
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.requests += 1
+                path = self.path.split("?", 1)[0]
+                time.sleep(server.delays.get(path, 0))
+                name = server.routes.get(path, path.lstrip("/"))
+                file_path = os.path.join(FIXTURES, name)
+                if not os.path.isfile(file_path):
+                    self.send_error(404)
+                    return
+                with open(file_path, "rb") as f:
+                    body = f.read()
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.port}/{path.lstrip('/')}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,233 @@
+"""
+Offline regression suite for the resume parser and job-search hot paths.
+
+    python -m benchmarks.regression                  # run, compare with the baseline, exit 1 on regression
+    python -m benchmarks.regression --save           # run and record the baseline
+    python -m benchmarks.regression --cases resume.analyze search.rss --threshold 0.3
+
+Every case calls one entry point over a fixed set of inputs and reports throughput,
+p50/p95/p99 latency and peak traced memory. The search cases fetch recorded fixtures
+(benchmarks/fixtures) from a local HTTP server, so nothing touches the network.
+
+Runs under a fixed PYTHONHASHSEED: set iteration order decides which candidate tokens
+some checks try first, and with it the cost of the pathological inputs.
+
+A case regresses when its p50 or p95 latency or its peak memory grows by more than
+`--threshold` (a fraction; `--memory-threshold` for memory) over the baseline, or its
+throughput drops by as much. Baselines depend on the machine: record one with --save
+on the host you compare on.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from src.feed_fetcher import FeedFetcher
+from src.job_search import JobSearcher
+from src.resume_parser import ResumeParser
+from benchmarks.local_server import FixtureServer
+from benchmarks.synthetic import pathological_resumes, varied_resumes
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+
+# Fields compared against the baseline and whether larger is worse
+COMPARED = {"p50_ms": True, "p95_ms": True, "throughput_per_s": False, "peak_kib": True}
+
+
+@contextmanager
+def resume_analyze(args):
+    parser = ResumeParser(use_spacy=False)
+    yield parser.analyze_resume, varied_resumes(args.resumes)
+
+
+@contextmanager
+def resume_skills(args):
+    parser = ResumeParser(use_spacy=False)
+    yield parser.extract_skills, varied_resumes(args.resumes)
+
+
+@contextmanager
+def resume_pathological(args):
+    parser = ResumeParser(use_spacy=False)
+    yield parser.analyze_resume, list(pathological_resumes(args.pathological_size).values())
+
+
+@contextmanager
+def contact_pathological(args):
+    parser = ResumeParser(use_spacy=False)
+    yield parser.extract_contact_info, list(pathological_resumes(args.pathological_size).values())
+
+
+@contextmanager
+def search_rss(args):
+    routes = {f"/feed{i}.rss": "programming_jobs.rss" for i in range(args.feeds)}
+    with FixtureServer(routes=routes) as server:
+        fetcher = FeedFetcher(ttl=0, timeout=10)
+        searcher = JobSearcher(feed_fetcher=fetcher)
+        searcher.rss_feeds = [server.url(path) for path in routes]
+
+        def fetch(term):
+            # A full download and parse every time, not a cache hit or a 304
+            fetcher.clear()
+            return searcher.fetch_rss_jobs(term, include_description=True, raise_errors=True)
+
+        yield fetch, ["engineer", "python", "developer", "data"]
+
+
+@contextmanager
+def search_google(args):
+    with FixtureServer(routes={"/search": "google_results.html"}) as server:
+        searcher = JobSearcher(google_search_url=server.url("/search"))
+
+        def scrape(query):
+            return searcher.google_custom_scrape(query, "Remote", raise_errors=True)
+
+        yield scrape, ["python developer", "data engineer", "devops"]
+
+
+# name -> (setup, default number of timed calls)
+CASES = {
+    "resume.analyze": (resume_analyze, 300),
+    "resume.extract_skills": (resume_skills, 300),
+    "resume.analyze_pathological": (resume_pathological, 80),
+    "resume.contact_pathological": (contact_pathological, 80),
+    "search.rss": (search_rss, 12),
+    "search.google": (search_google, 60),
+}
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def measure(fn, inputs, iterations, warmup, memory_calls):
+    for i in range(warmup):
+        fn(inputs[i % len(inputs)])
+
+    latencies = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        call_start = time.perf_counter()
+        fn(inputs[i % len(inputs)])
+        latencies.append(time.perf_counter() - call_start)
+    total = time.perf_counter() - start
+
+    # Separate pass: tracing allocations slows every call down, so it is not timed
+    tracemalloc.start()
+    for i in range(min(memory_calls, iterations)):
+        fn(inputs[i % len(inputs)])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    ms = [x * 1000 for x in latencies]
+    return {
+        "calls": iterations,
+        "throughput_per_s": round(iterations / total, 2),
+        "mean_ms": round(sum(ms) / len(ms), 4),
+        "p50_ms": round(percentile(ms, 50), 4),
+        "p95_ms": round(percentile(ms, 95), 4),
+        "p99_ms": round(percentile(ms, 99), 4),
+        "max_ms": round(ms[-1], 4),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, threshold, memory_threshold):
+    """Returns [(case, field, baseline value, current value, change)] for every regression."""
+    regressions = []
+    for case, current in results.items():
+        before = baseline.get(case)
+        if not before:
+            continue
+        for field, larger_is_worse in COMPARED.items():
+            old, new = before.get(field), current.get(field)
+            if not old or new is None:
+                continue
+            change = (new - old) / old if larger_is_worse else (old - new) / old
+            limit = memory_threshold if field == "peak_kib" else threshold
+            if change > limit:
+                regressions.append((case, field, old, new, change))
+    return regressions
+
+
+def main():
+    if os.environ.get("PYTHONHASHSEED") != "0":
+        # Re-run with a fixed hash seed so results are comparable with the baseline. A child
+        # process rather than os.execve: on Windows exec starts a new process and returns
+        # at once, so the caller would see our exit code before the run finished
+        env = dict(os.environ, PYTHONHASHSEED="0")
+        child = subprocess.run([sys.executable, "-m", "benchmarks.regression", *sys.argv[1:]], env=env)
+        sys.exit(child.returncode)
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cases", nargs="+", choices=sorted(CASES), default=sorted(CASES))
+    ap.add_argument("--iterations", type=int, default=None, help="timed calls per case (default: per case)")
+    ap.add_argument("--warmup", type=int, default=3)
+    ap.add_argument("--memory-calls", type=int, default=10, help="calls traced for peak memory")
+    ap.add_argument("--resumes", type=int, default=90, help="distinct synthetic resumes")
+    ap.add_argument("--pathological-size", type=int, default=4000, help="characters per pathological run")
+    ap.add_argument("--feeds", type=int, default=2, help="fixture feeds per RSS search")
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE)
+    ap.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    ap.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, as a fraction")
+    ap.add_argument("--memory-threshold", type=float, default=0.5, help="allowed peak memory growth")
+    ap.add_argument("--out", default=None, help="also write this run's results to a JSON file")
+    args = ap.parse_args()
+
+    results = {}
+    for name in args.cases:
+        setup, iterations = CASES[name]
+        with setup(args) as (fn, inputs):
+            results[name] = measure(fn, inputs, args.iterations or iterations, args.warmup, args.memory_calls)
+        r = results[name]
+        print(f"{name:28s} {r['throughput_per_s']:9.1f}/s  p50 {r['p50_ms']:8.3f}ms  p95 {r['p95_ms']:8.3f}ms  "
+              f"p99 {r['p99_ms']:8.3f}ms  peak {r['peak_kib']:8.1f} KiB", flush=True)
+
+    report = {
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "cases": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f).get("cases", {})
+        # Cases not run this time keep their previous baseline
+        report["cases"] = dict(baseline, **results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; record one with --save")
+        return
+    with open(args.baseline, encoding="utf-8") as f:
+        saved = json.load(f)
+    regressions = compare(results, saved.get("cases", {}), args.threshold, args.memory_threshold)
+    for case, field, old, new, change in regressions:
+        print(f"FAIL {case} {field}: {old} -> {new} ({change:+.0%} worse)")
+    if not regressions:
+        print(f"ok: within {args.threshold:.0%} of the baseline from {saved.get('recorded_at', '?')}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
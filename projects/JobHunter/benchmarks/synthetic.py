@@ -0,0 +1,135 @@
+import random
+
+FILLER = (
+    "responsible for the delivery of features across the team and worked closely with "
+    "stakeholders to ship reliable software on schedule while keeping quality high"
+).split()
+
+SKILLS = [
+    "python", "java", "javascript", "react", "sql", "postgresql", "aws", "docker",
+    "kubernetes", "git", "machine learning", "pandas", "django", "fastapi", "node.js",
+    "graphql", "rest api", "agile", "scrum", "leadership", "c++", "typescript",
+]
+
+VERBS = ["led", "developed", "built", "designed", "optimized", "launched", "mentored"]
+
+SECTIONS = ["Experience", "Education", "Skills", "Projects"]
+
+ROLES = ["Python Developer", "Backend Engineer", "Data Scientist", "Frontend Engineer", "DevOps Engineer"]
+
+
+def synthetic_jobs(count, seed=0):
+    """Job postings in the common Title/Company/Date/Link/Source/Description schema."""
+    import pandas as pd
+
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        words = rng.sample(FILLER, 12) + rng.sample(SKILLS, rng.randint(2, 6))
+        rng.shuffle(words)
+        rows.append({
+            "Title": rng.choice(ROLES),
+            "Company": f"Company {i % 500}",
+            "Date": "2026-10-01",
+            "Link": f"https://jobs.example.com/{i}",
+            "Source": "synthetic",
+            "Description": " ".join(words),
+        })
+    return pd.DataFrame(rows)
+
+
+def synthetic_resume(rng, words=400, skill_density=0.05):
+    """Generates a plausible resume-shaped text with a given number of words."""
+    lines = [
+        "Jane Doe",
+        f"jane.doe{rng.randint(1, 999)}@example.com | +1 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "linkedin.com/in/janedoe | github.com/janedoe",
+    ]
+    per_section = max(words // len(SECTIONS), 1)
+    for section in SECTIONS:
+        lines.append(section.upper())
+        body = []
+        for _ in range(per_section):
+            roll = rng.random()
+            if roll < skill_density:
+                body.append(rng.choice(SKILLS))
+            elif roll < skill_density * 2:
+                body.append(rng.choice(VERBS))
+            elif roll < skill_density * 2 + 0.01:
+                body.append(f"{rng.randint(5, 90)}%")
+            else:
+                body.append(rng.choice(FILLER))
+        lines.append(" ".join(body))
+    return "\n".join(lines)
+
+
+def synthetic_resumes(count, seed=0, **kwargs):
+    rng = random.Random(seed)
+    return [synthetic_resume(rng, **kwargs) for _ in range(count)]
+
+
+def varied_resumes(count, seed=0, lengths=(150, 600, 2500), densities=(0.01, 0.05, 0.15)):
+    """Resumes cycling through every (length in words, skill density) combination."""
+    rng = random.Random(seed)
+    shapes = [(w, d) for w in lengths for d in densities]
+    return [synthetic_resume(rng, words=shapes[i % len(shapes)][0], skill_density=shapes[i % len(shapes)][1])
+            for i in range(count)]
+
+
+def pathological_resumes(size=4000, seed=0):
+    """
+    {name: text} of inputs that make naive email/phone regexes backtrack: long runs that
+    almost match and fail at the very end. Each run comes before a normal resume, so a
+    search has to get past it to reach the real contact line.
+    """
+    rng = random.Random(seed)
+    frame = synthetic_resume(rng, words=300)
+    runs = {
+        "long_word": "a" * size,                        # email local part with no '@'
+        "digit_run": "7" * size,                        # one huge number
+        "dotted_domain": "x@" + "a." * (size // 2),     # domain with no valid TLD
+        "at_chain": "a@" * (size // 2),
+        "phone_like": "555-" * (size // 4),             # separators between short digit groups
+        "spaced_digits": " ".join("1234" for _ in range(size // 5)),
+        "unicode_digits": "\u0663" * size,              # Arabic-Indic digits match \d
+        "many_emails": " ".join(f"user{i}@host{i}" for i in range(size // 12)),  # '@' without TLD
+    }
+    return {name: run + "\n" + frame for name, run in runs.items()}
+
+
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def synthetic_pdf(pages_text):
+    """Builds a minimal valid PDF (Helvetica, one text line per 90 chars) with one page per string."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages_text:
+        lines = [text[i:i + 90] for i in range(0, len(text), 90)] or [""]
+        ops = ["BT /F1 9 Tf 11 TL 36 760 Td"]
+        ops += [f"({_pdf_escape(line)}) Tj T*" for line in lines[:64]]
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>stream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 3 0 R >> >> >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for i, obj in enumerate(objects):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % (i + 1) + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for off in offsets:
+        out += b"%010d 00000 n \n" % off
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return out
@@ -0,0 +1,133 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .job_search import JOBSPY_SITES
+
+# Shared pool: a source that overruns its deadline keeps its thread until it returns,
+# but nobody waits on it, so later searches are not blocked either.
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="source")
+
+DEFAULT_DEADLINES = {
+    "rss": 10,
+    "google_search": 12,
+    "jobspy:linkedin": 30,
+    "jobspy:indeed": 30,
+    "jobspy:glassdoor": 30,
+    "jobspy:google": 30,
+}
+
+
+class JobAggregator:
+    """
+    Runs the RSS feeds, each jobspy site and google_custom_scrape concurrently, each
+    against its own deadline, and merges whatever came back into one deduplicated
+    Title/Company/Date/Link/Source frame.
+    """
+
+    def __init__(self, searcher, deadlines=None, sites=None, include_google=True, limit=20):
+        self.searcher = searcher
+        self.deadlines = dict(DEFAULT_DEADLINES, **(deadlines or {}))
+        self.sites = sites or JOBSPY_SITES
+        self.include_google = include_google
+        self.limit = limit
+
+    def sources(self, role, location):
+        """{source name: zero-arg callable returning a DataFrame}"""
+        s = self.searcher
+        sources = {"rss": lambda: s.fetch_rss_jobs(role, include_description=True, raise_errors=True)}
+        for site in self.sites:
+            sources[f"jobspy:{site}"] = (
+                lambda site=site: s.scrape_live_jobs(role, location, limit=self.limit,
+                                                     include_description=True, sites=[site], raise_errors=True)
+            )
+        if self.include_google:
+            sources["google_search"] = lambda: s.google_custom_scrape(role, location, raise_errors=True)
+        return sources
+
+    def iter_results(self, role, location):
+        """
+        Yields (source, DataFrame or None, stats) as each source finishes, errors or
+        misses its deadline. stats = {"status", "rows", "seconds", "error"}.
+        """
+        start = time.monotonic()
+        futures = {}
+        for name, fn in self.sources(role, location).items():
+            futures[_executor.submit(_timed, fn)] = name
+
+        pending = set(futures)
+        while pending:
+            now = time.monotonic() - start
+            expires = {f: self.deadlines.get(futures[f], 30) - now for f in pending}
+            timeout = max(min(expires.values()), 0)
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                pending.discard(future)
+                name = futures[future]
+                try:
+                    df, seconds = future.result()
+                    yield name, df, {"status": "ok", "rows": len(df), "seconds": round(seconds, 3), "error": None}
+                except Exception as e:
+                    seconds = time.monotonic() - start
+                    yield name, None, {"status": "error", "rows": 0, "seconds": round(seconds, 3), "error": str(e)}
+
+            now = time.monotonic() - start
+            for future in [f for f in pending if self.deadlines.get(futures[f], 30) <= now]:
+                pending.discard(future)
+                future.cancel()
+                name = futures[future]
+                yield name, None, {
+                    "status": "timeout", "rows": 0, "seconds": round(now, 3),
+                    "error": f"Deadline of {self.deadlines.get(name, 30)}s exceeded",
+                }
+
+    def aggregate(self, role, location, on_partial=None):
+        """
+        Runs all sources and returns (merged DataFrame, {source: stats}).
+        on_partial(merged_so_far, source, stats) is called after each source finishes,
+        so a UI can render results as they arrive.
+        """
+        frames = []
+        stats = {}
+        merged = merge_results([])
+        for name, df, source_stats in self.iter_results(role, location):
+            stats[name] = source_stats
+            if df is not None and not df.empty:
+                frames.append(df)
+                merged = merge_results(frames)
+            if on_partial is not None:
+                on_partial(merged, name, source_stats)
+        return merged, stats
+
+
+def _timed(fn):
+    t = time.perf_counter()
+    df = fn()
+    return df, time.perf_counter() - t
+
+
+def merge_results(frames, near_duplicates=True):
+    """
+    Concatenates source frames into the common schema, deduplicated by normalized link
+    and, with near_duplicates=True, by title + company + description similarity.
+    """
+    import pandas as pd
+    from .job_store import RESULT_COLUMNS, normalize_link
+
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    merged = pd.concat(frames, ignore_index=True, sort=False)
+    for col in RESULT_COLUMNS:
+        if col not in merged.columns:
+            merged[col] = "N/A"
+    keys = merged["Link"].astype(str).map(normalize_link)
+    # Rows without a usable link are kept; they cannot be matched reliably
+    keep = keys.isna() | ~keys.duplicated()
+    extra = [c for c in merged.columns if c not in RESULT_COLUMNS]
+    merged = merged.loc[keep, RESULT_COLUMNS + extra].reset_index(drop=True)
+    if near_duplicates:
+        # The same role arrives from several boards under different URLs
+        from .dedupe import drop_near_duplicates
+        merged = drop_near_duplicates(merged)
+    return merged
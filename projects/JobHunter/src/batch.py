@@ -0,0 +1,230 @@
+"""
+Batch resume analysis.
+
+Usage:
+    python -m src.batch resumes/ --workers 8 --out results.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from .metrics import metrics
+
+# One parser per worker process, created on first use and reused for every item
+_worker_parser = None
+
+
+def _get_parser():
+    global _worker_parser
+    if _worker_parser is None:
+        from .resume_parser import ResumeParser
+        _worker_parser = ResumeParser()
+    return _worker_parser
+
+
+def warm_worker():
+    """Pool initializer: builds the parser (and compiles its matcher) before the first request."""
+    # A forked worker starts with a copy of the parent's metrics; report only its own
+    metrics.reset()
+    _get_parser()
+
+
+# Work items are tagged (kind, value) tuples:
+#   ("text", str)    resume text
+#   ("pdf", bytes)   PDF file contents
+#   ("path", str)    PDF file on this machine -- local callers only, never built from
+#                    network input (the service only sends "text" and "pdf")
+ITEM_KINDS = ("text", "pdf", "path")
+
+
+def local_item(item):
+    """
+    Tags an input given to analyze_batch() by a local caller: bytes are a PDF, a string
+    naming an existing .pdf file is a path, any other string is resume text.
+    """
+    if isinstance(item, tuple):
+        return item
+    if isinstance(item, (bytes, bytearray)):
+        return ("pdf", bytes(item))
+    if isinstance(item, str) and item.lower().endswith(".pdf") and os.path.isfile(item):
+        return ("path", item)
+    return ("text", item)
+
+
+def _label(index, item):
+    kind, value = item
+    return value if kind == "path" else f"{kind}[{index}]"
+
+
+def analyze_item(index, item):
+    """
+    Extracts (if needed) and scores one tagged resume item (see ITEM_KINDS).
+    Never raises: failures come back as {"error": ...}.
+    """
+    parser = _get_parser()
+    kind, value = item
+    extraction = None
+    try:
+        if kind not in ITEM_KINDS:
+            raise ValueError(f"unknown item kind {kind!r}")
+        if kind == "text":
+            analysis = parser.analyze_resume(value)
+        else:
+            # Page-by-page with budgets so one huge or hostile PDF cannot stall a worker
+            stream = parser.stream_pdf_pages(value)
+            analysis = parser.analyze_stream(stream)
+            if stream.error and stream.chars == 0:
+                analysis = {"error": f"Error extracting text: {stream.error}"}
+            extraction = stream.stats()
+    except Exception as e:
+        analysis = {"error": f"Analysis failed: {str(e)}"}
+        extraction = None
+    result = {"index": index, "source": _label(index, item), "analysis": analysis}
+    if extraction:
+        result["extraction"] = extraction
+    return result
+
+
+def analyze_many(items):
+    """Scores a list of (index, tagged item) pairs in one call, so a worker round-trip covers a whole micro-batch."""
+    return [analyze_item(index, item) for index, item in items]
+
+
+def analyze_many_reporting(items):
+    """analyze_many() plus this worker's metrics since its last call, for the parent to merge."""
+    return analyze_many(items), metrics.drain()
+
+
+def analyze_batch(paths_or_texts, workers=None, ordered=True, window=None):
+    """
+    Yields one result dict per input as soon as it is available. Inputs are tagged
+    items or, from trusted local callers, PDF paths / bytes / text (see local_item).
+    ordered=True keeps input order; ordered=False yields in completion order.
+    workers=1 runs inline without a process pool. At most `window` items (default
+    4 per worker) are handed to the pool at a time.
+    """
+    items = [local_item(item) for item in paths_or_texts]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(items) <= 1:
+        for i, item in enumerate(items):
+            yield analyze_item(i, item)
+        return
+
+    ready = {}
+    next_index = 0
+    for index, result in _run_pool(items, workers, window or workers * 4):
+        if not ordered:
+            yield result
+            continue
+        ready[index] = result
+        while next_index in ready:
+            yield ready.pop(next_index)
+            next_index += 1
+
+
+def _run_pool(items, workers, window):
+    """
+    Yields (index, result) in completion order.
+
+    A worker that dies (OOM kill, native crash in pdfminer) breaks the whole pool and
+    fails every item in flight. The pool is then rebuilt and those items are retried one
+    at a time; only an item that kills a worker while running alone is reported as
+    failed, so one bad PDF does not take its neighbours down with it.
+    """
+    queue = deque(range(len(items)))
+    suspects = deque()
+    running = {}
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while queue or suspects or running:
+            if suspects:
+                # Retrying after a crash: nothing else in flight, so a crash is blamed correctly
+                if not running:
+                    i = suspects.popleft()
+                    running[pool.submit(analyze_item, i, items[i])] = i
+            else:
+                while queue and len(running) < window:
+                    i = queue.popleft()
+                    running[pool.submit(analyze_item, i, items[i])] = i
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            if any(isinstance(f.exception(), BrokenProcessPool) for f in done):
+                # Every other future of a broken pool fails too; collect them all now
+                done = set(running)
+                wait(done)
+            crashed = []
+            for future in done:
+                i = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    yield i, future.result()
+                elif isinstance(error, BrokenProcessPool):
+                    crashed.append(i)
+                else:
+                    yield i, failure_result(i, items[i], error)
+            if not crashed:
+                continue
+
+            pool.shutdown(wait=False, cancel_futures=True)
+            pool = ProcessPoolExecutor(max_workers=workers)
+            if len(crashed) == 1:
+                i = crashed[0]
+                yield i, failure_result(i, items[i], "worker process died while analyzing this resume")
+            else:
+                suspects.extend(sorted(crashed))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def failure_result(index, item, error):
+    """The result dict for an item whose worker failed or died."""
+    return {"index": index, "source": _label(index, item), "analysis": {"error": f"Worker failed: {error}"}}
+
+
+def collect_inputs(paths):
+    """Expands directories into the PDF files they contain (recursively)."""
+    inputs = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.lower().endswith(".pdf"):
+                        inputs.append(os.path.join(root, name))
+        else:
+            inputs.append(path)
+    return inputs
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Score a folder of resumes without the Streamlit UI.")
+    ap.add_argument("paths", nargs="+", help="PDF files or folders containing PDFs")
+    ap.add_argument("--workers", type=int, default=None, help="process count (default: CPU count)")
+    ap.add_argument("--out", default="-", help="JSON Lines output file (default: stdout)")
+    ap.add_argument("--unordered", action="store_true", help="write results as they complete")
+    args = ap.parse_args(argv)
+
+    inputs = [("path", path) for path in collect_inputs(args.paths)]
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    failed = 0
+    try:
+        for result in analyze_batch(inputs, workers=args.workers, ordered=not args.unordered):
+            if "error" in result["analysis"]:
+                failed += 1
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Analyzed {len(inputs)} resumes ({failed} failed).", file=sys.stderr)
+    return 1 if inputs and failed == len(inputs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from .metrics import incr
+
+# Keys per SELECT ... IN (...) in get_many(), under SQLite's default bound-parameter limit
+_SQL_BATCH = 500
+
+
+def content_key(data):
+    """SHA-256 of the raw upload bytes, so the same file always maps to the same entry."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-level cache: an in-memory LRU in front of an optional SQLite file.
+    Values must be JSON-serializable (extracted text, analysis dicts).
+    """
+
+    def __init__(self, max_items=256, path=None):
+        self.max_items = max_items
+        self.path = path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._db = None
+        if path:
+            # Streamlit serves reruns from different threads, hence check_same_thread=False + lock
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._db.commit()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                incr("cache.hits")
+                return self._memory[key]
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    incr("cache.hits")
+                    incr("cache.disk_hits")
+                    return value
+            self.misses += 1
+            incr("cache.misses")
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+                self._db.commit()
+
+    def get_many(self, keys):
+        """
+        get() for a list of keys under one lock and one SQLite query per batch of keys.
+        Returns the values in key order, None for misses.
+        """
+        with self._lock:
+            found = {}
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+            missing = [key for key in dict.fromkeys(keys) if key not in found]
+            disk_hits = 0
+            if self._db is not None:
+                for i in range(0, len(missing), _SQL_BATCH):
+                    batch = missing[i:i + _SQL_BATCH]
+                    rows = self._db.execute(
+                        f"SELECT key, value FROM cache WHERE key IN ({','.join('?' * len(batch))})", batch)
+                    for key, value in rows:
+                        found[key] = json.loads(value)
+                        self._remember(key, found[key])
+                        disk_hits += 1
+            values = [found.get(key) for key in keys]
+            hits = len(keys) - values.count(None)
+            self.hits += hits
+            self.disk_hits += disk_hits
+            self.misses += len(keys) - hits
+        incr("cache.hits", hits)
+        incr("cache.disk_hits", disk_hits)
+        incr("cache.misses", len(keys) - hits)
+        return values
+
+    def put_many(self, items):
+        """put() for a list of (key, value) pairs, written to SQLite in one transaction."""
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value)
+            if self._db is not None:
+                self._db.executemany("INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                                     [(key, json.dumps(value)) for key, value in items])
+                self._db.commit()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_items": len(self._memory),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM cache")
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
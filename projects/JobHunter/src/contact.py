@@ -0,0 +1,203 @@
+"""
+Contact extraction (emails, phone numbers, LinkedIn/GitHub profiles) in linear time.
+
+The old unanchored EMAIL_PATTERN search backtracks quadratically on long runs that
+almost match (a huge dotted token from a broken PDF, a local part with no '@'), so a
+single upload could burn seconds of CPU. Here every candidate is anchored on something
+cheap to find and the work per candidate is capped:
+
+- emails: each plausible '@' (one regex with bounded lookarounds), a local part of at
+  most EMAIL_LOCAL_MAX characters read backwards and a domain of at most
+  EMAIL_DOMAIN_MAX forwards. Neither side can cross another '@', so every character is
+  looked at a bounded number of times.
+- phones: runs of digits and separators found by a single greedy character class (in a
+  byte copy of the text with every digit mapped to "0"), then a pattern with only
+  bounded quantifiers; with `phonenumbers` installed each match is
+  also checked with is_possible_number().
+- profiles: str.find for the marker plus a bounded handle.
+
+Matches are the same as EMAIL_PATTERN's for ordinary text. Emails whose local part or
+domain exceed the RFC 5321 limits are rejected instead of being matched in full.
+"""
+import os
+import re
+import string
+
+EMAIL_LOCAL_MAX = 64
+EMAIL_DOMAIN_MAX = 253
+
+_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_LETTERS = frozenset(string.ascii_letters)
+# '@'s worth a closer look: a local-part character before and '.' + 2 letters somewhere
+# in the domain after. Lets '@'-dense junk ("a@a@a@...") through without a Python step
+# per '@'; the lazy run is bounded and cannot cross the next '@'
+# (the pattern starts with the literal '@' so the engine can skip straight to each one)
+_AT = re.compile(r"@(?<=[a-zA-Z0-9._%%+-]@)(?=[a-zA-Z0-9.-]{0,%d}?\.[a-zA-Z]{2})" % EMAIL_DOMAIN_MAX)
+# One character more than allowed, so an over-long domain is detectable
+_DOMAIN_RUN = re.compile(r"[a-zA-Z0-9.-]{1,%d}" % (EMAIL_DOMAIN_MAX + 1))
+
+# Digits with separators between them; the class is greedy and never has to give back.
+# sre has no fast skip to a first character from a class (~8ns per character of text), so
+# runs are searched in a byte copy where every digit is "0": a literal first character
+# lets the engine jump between digits. encode("ascii", "replace") writes one byte per
+# character ("?", outside the class, for the rest), so offsets carry over to the text.
+# The caller steps back over a leading '+' or '('
+_DIGITS_AS_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_PHONE_RUN = re.compile(rb"0[0().\- \t]{8,}")
+# The old PHONE_PATTERN's shape, plus single spaces as separators, balanced area-code
+# parentheses and no digit on either side (ASCII digits only)
+_PHONE = re.compile(
+    r"(?<![0-9])(?:\+[0-9]{1,3}[-. ]?)?(?:\([0-9]{3}\)|[0-9]{3})[-. ]?[0-9]{3}[-. ]?[0-9]{4}(?![0-9])"
+)
+_NOT_DIGIT = re.compile(r"[^0-9]")
+
+PROFILE_MARKERS = {"linkedin": "linkedin.com/in/", "github": "github.com/"}
+_HANDLE = re.compile(r"[a-z0-9_%\-]{1,100}")
+
+# Region for numbers written without a country code (phonenumbers only)
+PHONE_REGION = os.environ.get("JOBHUNTER_PHONE_REGION", "US")
+
+_phonenumbers = None
+_phonenumbers_loaded = False
+
+
+def load_phonenumbers():
+    """The phonenumbers module, or None when it is not installed (checked once)."""
+    global _phonenumbers, _phonenumbers_loaded
+    if not _phonenumbers_loaded:
+        try:
+            import phonenumbers
+            _phonenumbers = phonenumbers
+        except ImportError:
+            _phonenumbers = None
+        _phonenumbers_loaded = True
+    return _phonenumbers
+
+
+def _tld_end(domain):
+    """
+    Length of the longest prefix of `domain` ending in '.' + 2 or more letters (what the
+    greedy EMAIL_PATTERN keeps), or 0 when there is none.
+    """
+    dot = domain.rfind(".")
+    while dot > 0:
+        end = dot + 1
+        while end < len(domain) and domain[end] in _LETTERS:
+            end += 1
+        if end - dot > 2:
+            return end
+        dot = domain.rfind(".", 0, dot)
+    return 0
+
+
+def iter_emails(text):
+    """(start, end, email) for every email address in `text`, in document order."""
+    last_end = 0
+    for candidate in _AT.finditer(text):
+        at = candidate.start()
+        # Like finditer, a match never starts inside the previous one (its domain can
+        # run into the next local part: "a@b.cc.1@d.com")
+        start = at
+        floor = max(last_end, at - EMAIL_LOCAL_MAX - 1)
+        while start > floor and text[start - 1] in _LOCAL_CHARS:
+            start -= 1
+        # at - start == EMAIL_LOCAL_MAX + 1: the local part is too long
+        if start < at and at - start <= EMAIL_LOCAL_MAX:
+            m = _DOMAIN_RUN.match(text, at + 1)
+            if m is not None and m.end() - m.start() <= EMAIL_DOMAIN_MAX:
+                end = _tld_end(m.group(0))
+                if end:
+                    last_end = at + 1 + end
+                    yield start, last_end, text[start:last_end]
+
+
+def iter_phones(text, region=None, validate=None):
+    """
+    (start, end, number) for every phone number in `text`, as written. `validate` (default:
+    when phonenumbers is installed) drops numbers phonenumbers does not consider possible.
+    """
+    pn = load_phonenumbers() if validate is None or validate else None
+    region = region or PHONE_REGION
+    mapped = text.encode("ascii", "replace").translate(_DIGITS_AS_ZERO)
+    for run in _PHONE_RUN.finditer(mapped):
+        start = run.start()
+        if start and text[start - 1] in "+(":
+            start -= 1
+        for m in _PHONE.finditer(text, start, run.end()):
+            number = m.group(0)
+            if pn is not None:
+                try:
+                    if not pn.is_possible_number(pn.parse(number, region)):
+                        continue
+                except pn.NumberParseException:
+                    continue
+            yield m.start(), m.end(), number
+
+
+def iter_profiles(text_lower, marker):
+    """(start, end, url) for every `marker` (e.g. "github.com/") plus the handle after it."""
+    pos = text_lower.find(marker)
+    while pos != -1:
+        end = pos + len(marker)
+        m = _HANDLE.match(text_lower, end)
+        if m is not None:
+            end = m.end()
+        yield pos, end, text_lower[pos:end]
+        pos = text_lower.find(marker, end)
+
+
+def _unique(found, key, after, into=None, first_only=False):
+    values = [] if into is None else into
+    seen = {key(v) for v in values}
+    for _, end, value in found:
+        if end <= after:
+            continue
+        k = key(value)
+        if k not in seen:
+            seen.add(k)
+            values.append(value)
+        if first_only:
+            break
+    return values
+
+
+def phone_key(number):
+    """Digits only, so "(555) 123-4567" and "555.123.4567" count once."""
+    return _NOT_DIGIT.sub("", number)
+
+
+def extract_contacts(text, text_lower=None, after=0, into=None, token_blob_lower=None):
+    """
+    Every distinct contact in `text`, in document order:
+    {"emails": [...], "phones": [...], "linkedin": [urls], "github": [urls]}.
+
+    Contacts ending at or before offset `after` are skipped (the overlap a streaming
+    caller already scanned); `into` is a previous result to extend without duplicates.
+
+    `token_blob_lower` (the text's distinct tokens, lowered and joined by newlines, as
+    fused_analysis builds them) saves full-text scans: emails and profile URLs cannot
+    span whitespace, so when no token holds an '@' or a marker there is nothing to find,
+    and when exactly one does, every match repeats the first.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    into = into or {"emails": [], "phones": [], "linkedin": [], "github": []}
+    ats = 2 if token_blob_lower is None else token_blob_lower.count("@")
+    if ats:
+        _unique(iter_emails(text), str.lower, after, into["emails"], first_only=ats == 1)
+    _unique(iter_phones(text), phone_key, after, into["phones"])
+    for name, marker in PROFILE_MARKERS.items():
+        found = 2 if token_blob_lower is None else token_blob_lower.count(marker)
+        if found:
+            _unique(iter_profiles(text_lower, marker), str.lower, after, into[name], first_only=found == 1)
+    return into
+
+
+def contact_summary(contacts):
+    """The single-value contact_info dict analyze_resume has always reported."""
+    return {
+        "email": contacts["emails"][0] if contacts["emails"] else None,
+        "phone": contacts["phones"][0] if contacts["phones"] else None,
+        "linkedin": "Found" if contacts["linkedin"] else None,
+        "github": "Found" if contacts["github"] else None,
+    }
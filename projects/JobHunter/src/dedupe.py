@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+
+from .job_match import posting_texts
+from .metrics import incr, timed
+
+# Documents are joined with this separator so one split tokenizes the whole frame
+_DOC_SEP = b"\x1e"
+
+# bytes.translate table turning ASCII punctuation and whitespace into spaces. Letters,
+# digits, the separator and UTF-8 bytes of non-ASCII text are kept as word characters.
+_WORD_BYTES = set(b"abcdefghijklmnopqrstuvwxyz0123456789\x1e") | set(range(128, 256))
+_SPLIT_TABLE = bytes(c if c in _WORD_BYTES else 32 for c in range(256))
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+
+DEFAULT_COLUMNS = ("Title", "Company", "Description")
+
+
+def _lsh_shape(num_perm, threshold):
+    """(bands, rows) splitting the signature so the LSH S-curve, (1/b)**(1/r), sits nearest `threshold`."""
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class NearDuplicateDetector:
+    """
+    Groups near-duplicate documents with MinHash signatures and LSH banding.
+
+    Each document becomes a set of word `shingle_size`-grams; two documents are near
+    duplicates when the Jaccard similarity of those sets is at least `threshold`.
+    Banding only compares documents that share a whole band of their signature, so the
+    cost grows with the number of documents and true duplicates, not with all pairs.
+    Candidate pairs are then confirmed on the estimated similarity of the full signature.
+
+    Tokenizing, shingling and hashing run as NumPy array operations over all documents
+    at once; the only per-document Python work is building the joined text.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=64, shingle_size=3, seed=1, chunk_shingles=1 << 16):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.chunk_shingles = chunk_shingles
+        self.bands, self.rows = _lsh_shape(num_perm, threshold)
+        rng = np.random.default_rng(seed)
+        # Multiply-add-shift hashing: (a*x + b) >> 32 with odd 64-bit a, wrapping arithmetic
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+
+    def _shingles(self, texts):
+        """Returns (doc_ids, shingle hashes as uint64), both sorted by document."""
+        blob = " \x1e ".join(texts).lower().encode("utf-8", "replace")
+        tokens = blob.translate(_SPLIT_TABLE).split()
+        if not tokens:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint64)
+        codes, uniques = pd.factorize(np.array(tokens, dtype=object))
+        codes = codes.astype(np.int64)
+        sep_codes = np.flatnonzero(uniques == _DOC_SEP)
+        is_sep = codes == (sep_codes[0] if len(sep_codes) else -1)
+        doc_of_token = np.cumsum(is_sep)[~is_sep]
+        ids = codes[~is_sep].astype(np.uint64) + np.uint64(1)
+
+        k = self.shingle_size
+        counts = np.bincount(doc_of_token, minlength=len(texts))
+        if k > 1 and len(ids) >= k:
+            # Rolling k-gram hash; a gram is valid when all its tokens belong to one document
+            gram = np.zeros(len(ids) - k + 1, dtype=np.uint64)
+            for offset in range(k):
+                part = ids[offset:len(ids) - k + 1 + offset] * np.uint64(0x9E3779B97F4A7C15 >> offset | 1)
+                gram = (gram ^ part) * np.uint64(0xBF58476D1CE4E5B9)
+            gram_doc = doc_of_token[:len(gram)]
+            valid = gram_doc == doc_of_token[k - 1:]
+            doc_ids, hashes = gram_doc[valid], gram[valid]
+        else:
+            doc_ids, hashes = np.empty(0, dtype=np.int64), np.empty(0, dtype=np.uint64)
+
+        if k > 1:
+            # Documents shorter than one shingle fall back to their single words
+            short = (counts > 0) & (counts < k)
+            if short.any():
+                word_mask = short[doc_of_token]
+                doc_ids = np.concatenate([doc_ids, doc_of_token[word_mask]])
+                hashes = np.concatenate([hashes, ids[word_mask] * np.uint64(0xD6E8FEB86659FD93)])
+                order = np.argsort(doc_ids, kind="stable")
+                doc_ids, hashes = doc_ids[order], hashes[order]
+        else:
+            doc_ids, hashes = doc_of_token, ids * np.uint64(0xD6E8FEB86659FD93)
+        return doc_ids, hashes
+
+    def signatures(self, texts):
+        """
+        (len(texts), num_perm) uint32 MinHash signatures. Returns (signatures, has_shingles):
+        documents without any token have no meaningful signature and are never matched.
+        """
+        n = len(texts)
+        signatures = np.full((n, self.num_perm), 0xFFFFFFFF, dtype=np.uint32)
+        doc_ids, hashes = self._shingles(texts)
+        has_shingles = np.zeros(n, dtype=bool)
+        if len(hashes) == 0:
+            return signatures, has_shingles
+        has_shingles[doc_ids] = True
+        x = hashes >> _SHIFT32 ^ (hashes & _MASK32)
+
+        # Chunks end on document boundaries so each document's minimum is taken in one piece
+        start = 0
+        while start < len(x):
+            stop = min(start + self.chunk_shingles, len(x))
+            if stop < len(x):
+                stop = int(np.searchsorted(doc_ids, doc_ids[stop - 1], side="left")) or stop
+                if stop <= start:
+                    stop = int(np.searchsorted(doc_ids, doc_ids[start], side="right"))
+            chunk_docs = doc_ids[start:stop]
+            # (num_perm, chunk) layout so each permutation's minimum runs over contiguous memory
+            values = np.multiply.outer(self._a, x[start:stop])
+            values += self._b[:, None]
+            values >>= _SHIFT32
+            bounds = np.flatnonzero(np.r_[True, chunk_docs[1:] != chunk_docs[:-1]])
+            signatures[chunk_docs[bounds]] = np.minimum.reduceat(values, bounds, axis=1).T
+            start = stop
+        return signatures, has_shingles
+
+    def candidate_pairs(self, signatures, has_shingles):
+        """Unique (i, j) pairs, i < j, sharing at least one LSH band."""
+        docs = np.flatnonzero(has_shingles)
+        if len(docs) < 2:
+            return np.empty((0, 2), dtype=np.int64)
+        sig = signatures[docs].astype(np.uint64)
+        mix = np.random.default_rng(7).integers(1, 2**63, size=self.rows, dtype=np.uint64) | np.uint64(1)
+        pairs = []
+        for band in range(self.bands):
+            cols = sig[:, band * self.rows:(band + 1) * self.rows]
+            keys = (cols * mix).sum(axis=1)
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            new_group = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+            if new_group.all():
+                continue
+            # Link every member of a bucket to its first member rather than to each other
+            leader = order[np.maximum.accumulate(np.where(new_group, np.arange(len(order)), 0))]
+            linked = leader != order
+            pairs.append(np.stack([leader[linked], order[linked]], axis=1))
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64)
+        pairs = docs[np.concatenate(pairs)]
+        pairs.sort(axis=1)
+        return np.unique(pairs, axis=0)
+
+    def labels(self, texts):
+        """
+        Cluster label per document: the index of the first document of its duplicate
+        group (a document that has no duplicates is labelled with its own index).
+        """
+        n = len(texts)
+        labels = np.arange(n)
+        if n < 2:
+            return labels
+        signatures, has_shingles = self.signatures(texts)
+        pairs = self.candidate_pairs(signatures, has_shingles)
+        if len(pairs):
+            similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+            pairs = pairs[similarity >= self.threshold]
+        incr("dedupe.candidate_pairs", len(pairs))
+        if len(pairs) == 0:
+            return labels
+
+        # Connected components by min-label propagation with pointer jumping
+        a, b = pairs[:, 0], pairs[:, 1]
+        while True:
+            previous = labels.copy()
+            low = np.minimum(labels[a], labels[b])
+            np.minimum.at(labels, a, low)
+            np.minimum.at(labels, b, low)
+            labels = labels[labels]
+            if np.array_equal(labels, previous):
+                return labels
+
+
+@timed("dedupe.near_duplicates", count_rows=True)
+def drop_near_duplicates(df, threshold=0.8, columns=DEFAULT_COLUMNS, detector=None):
+    """
+    Collapses postings whose title + company + description are near duplicates,
+    keeping the first row of each group (so earlier sources win). Works on the frames
+    returned by fetch_rss_jobs / scrape_live_jobs / google_custom_scrape and merges of them.
+
+    Rows without a description are left alone: a title on its own is too little to
+    tell two openings apart.
+    """
+    if df is None or len(df) < 2 or "Description" not in df.columns:
+        return df
+    texts = posting_texts(df, columns)
+    blank_description = df["Description"].fillna("").astype(str).str.strip().isin(["", "N/A"]).to_numpy()
+    texts = ["" if blank else text for text, blank in zip(texts, blank_description)]
+
+    detector = detector or NearDuplicateDetector(threshold=threshold)
+    labels = detector.labels(texts)
+    keep = labels == np.arange(len(df))
+    incr("dedupe.dropped", int((~keep).sum()))
+    if keep.all():
+        return df
+    return df.loc[keep].reset_index(drop=True)
@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import incr, span
+
+
+class FeedFetcher:
+    """
+    Fetches many RSS/Atom feeds concurrently over one pooled HTTP session.
+
+    - Each feed's parsed entries are cached for `ttl` seconds.
+    - After the TTL, a conditional GET (ETag / Last-Modified) is sent; a 304 reuses the cache.
+      `revalidate=True` sends it right away (for scheduled refreshes, which must see new
+      entries but can still get a cheap 304).
+    - A feed that does not answer within `timeout` seconds is skipped (stale entries are
+      served if we have them), so one slow feed cannot hold up the others.
+    """
+
+    def __init__(self, ttl=900, timeout=8, max_workers=16, headers=None):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="feed")
+        self._state = {}  # url -> {"entries", "fetched_at", "etag", "last_modified"}
+        self._lock = threading.Lock()
+
+    def _cached(self, url):
+        with self._lock:
+            return self._state.get(url)
+
+    def _fetch_one(self, url, revalidate=False):
+        state = self._cached(url)
+        if state and not revalidate and time.monotonic() - state["fetched_at"] < self.ttl:
+            incr("feeds.ttl_hits")
+            return state["entries"]
+
+        headers = dict(self.headers)
+        if state:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+
+        with span("feeds.http_get"):
+            res = self.session.get(url, headers=headers, timeout=self.timeout)
+        if res.status_code == 304 and state:
+            incr("feeds.not_modified")
+            with self._lock:
+                state["fetched_at"] = time.monotonic()
+            return state["entries"]
+        res.raise_for_status()
+        incr("feeds.bytes_in", len(res.content))
+
+        import feedparser
+        feed = feedparser.parse(res.content)
+        entries = [
+            {
+                "title": e.get("title", ""),
+                "link": e.get("link", ""),
+                "published": e.get("published"),
+                "summary": e.get("summary", ""),
+                "author": e.get("author"),
+            }
+            for e in feed.entries
+        ]
+        with self._lock:
+            self._state[url] = {
+                "entries": entries,
+                "fetched_at": time.monotonic(),
+                "etag": res.headers.get("ETag"),
+                "last_modified": res.headers.get("Last-Modified"),
+            }
+        return entries
+
+    def fetch_all(self, urls, deadline=None, revalidate=False):
+        """
+        Returns ({url: [entry dicts]}, {url: error}) for every feed that answered (or had
+        cached entries) within `deadline` seconds (defaults to the per-feed timeout).
+        `revalidate=True` skips the TTL and always asks the server (conditionally).
+        """
+        deadline = self.timeout if deadline is None else deadline
+        futures = {self._executor.submit(self._fetch_one, url, revalidate): url for url in urls}
+        done, not_done = wait(futures, timeout=deadline)
+
+        results = {}
+        errors = {}
+        for future in done:
+            url = futures[future]
+            try:
+                results[url] = future.result()
+            except Exception as e:
+                errors[url] = str(e)
+                self._serve_stale(url, results)
+        for future in not_done:
+            url = futures[future]
+            errors[url] = f"Timed out after {deadline}s"
+            self._serve_stale(url, results)
+        return results, errors
+
+    def _serve_stale(self, url, results):
+        state = self._cached(url)
+        if state:
+            results[url] = state["entries"]
+
+    def clear(self):
+        with self._lock:
+            self._state.clear()
+
+
+_default_fetcher = None
+_default_lock = threading.Lock()
+
+
+def get_feed_fetcher(headers=None):
+    """Process-wide fetcher so the connection pool and TTL cache survive across searches."""
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = FeedFetcher(headers=headers)
+        return _default_fetcher
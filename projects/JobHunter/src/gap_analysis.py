@@ -0,0 +1,297 @@
+"""
+Resume vs. job-description gap analysis.
+
+JobIndex turns a set of postings (the JobSearcher schema: Title/Company/Date/Link/Source
+plus Description) into per-posting features once: the skills each asks for (through the
+taxonomy matcher, so aliases count), the action verbs it uses and its most repeated
+keywords, stored as sparse (posting, feature) arrays. A resume parsed once is then
+compared with every posting in one batched NumPy pass, giving a 0-100 match plus the
+matched and missing skills per posting.
+
+A posting's features depend only on its own text and the taxonomy, so results are
+cached per (resume hash, posting hash) and stay valid across different posting sets.
+
+    python -m src.gap_analysis resume.pdf jobs.csv [--out gaps.csv] [--top 20]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from .cache import content_key
+from .job_match import posting_texts, skill_hits
+from .job_store import RESULT_COLUMNS
+from .metrics import timed
+
+# Bump whenever features or scoring change so cached results are invalidated
+GAP_VERSION = 1
+
+# Share of the match that each feature group contributes (when the posting has any)
+WEIGHTS = {"skills": 0.7, "keywords": 0.2, "verbs": 0.1}
+# A skill named in the title is what the role is about
+TITLE_SKILL_WEIGHT = 2.0
+
+_TOKEN = re.compile(r"[a-z][a-z0-9+#]*(?:[.-][a-z0-9+#]+)*")
+
+STOPWORDS = frozenset("""
+a about above across after all also an and any are as at be because been being both but by can
+could do does each etc for from has have how if in including into is it its join just like look
+looking may more most must new not of on or other our out over own per plus role should so such
+than that the their them then there these they this those through to under up us using very via
+was we well were what when where which while who will with within work working would you your
+able ability across apply based candidate company day environment experience years year strong
+team teams help make including required requirements preferred responsibilities benefits salary
+remote position opportunity job jobs skills knowledge understanding excellent good great
+""".split())
+
+
+def tokens(text_lower):
+    return _TOKEN.findall(text_lower)
+
+
+class ResumeProfile:
+    """What a resume offers: canonical skills and word tokens (for verbs and keywords), plus its hash."""
+
+    def __init__(self, skills, words, key):
+        self.skills = frozenset(s.lower() for s in skills)
+        self.words = frozenset(words)
+        self.key = key
+
+    @classmethod
+    def from_text(cls, text, parser=None, analysis=None):
+        """Uses analysis["skills"] when an analyze_resume() result is at hand, else extract_skills."""
+        if analysis is not None and "skills" in analysis:
+            skills = analysis["skills"]
+        else:
+            if parser is None:
+                from .resume_parser import ResumeParser
+                parser = ResumeParser(use_spacy=False)
+            skills = parser.extract_skills(text)
+        return cls(skills, tokens(text.lower()), content_key(text.encode("utf-8")))
+
+
+def _coo(rows, cols, vocab_size):
+    """Unique (row, col) pairs sorted by row, as two int arrays."""
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    if len(rows) == 0:
+        return rows, cols
+    pairs = np.unique(rows * vocab_size + cols)
+    return pairs // vocab_size, pairs % vocab_size
+
+
+def _by_row(values, rows, n_rows):
+    """Splits `values` (sorted by their `rows`) into one Python list per row."""
+    flat = values.tolist()
+    bounds = [0, *np.searchsorted(rows, np.arange(1, n_rows)).tolist(), len(flat)]
+    return [flat[bounds[i]:bounds[i + 1]] for i in range(n_rows)]
+
+
+class JobIndex:
+    """
+    Precomputed features for a set of postings; see the module docstring.
+    Build it once per result set and call compare()/report() for each resume.
+    """
+
+    @timed("gap.index")
+    def __init__(self, df, taxonomy=None, text_columns=("Title", "Description"), keywords_per_job=15):
+        if taxonomy is None:
+            from .taxonomy import get_taxonomy
+            taxonomy = get_taxonomy()
+        self.taxonomy = taxonomy
+        self.jobs = df.reset_index(drop=True)
+        self.n_rows = len(df)
+        texts = posting_texts(self.jobs, text_columns)
+        self.hashes = [content_key(t.encode("utf-8")) for t in texts]
+
+        # Skills: every (posting, skill) pair, weighted up when the title names the skill
+        self.skill_rows, self.skill_cols, self.skills = skill_hits(texts, taxonomy.matcher)
+        self.skill_weight = np.ones(len(self.skill_rows))
+        if "Title" in self.jobs.columns and len(self.skill_rows):
+            title_rows, title_cols, _ = skill_hits(self.jobs["Title"].fillna("").astype(str).tolist(), taxonomy.matcher)
+            in_title = np.isin(self.skill_rows * len(self.skills) + self.skill_cols,
+                               title_rows * len(self.skills) + title_cols)
+            self.skill_weight[in_title] = TITLE_SKILL_WEIGHT
+
+        # Verbs and keywords from one tokenization per posting
+        verb_index = {v: i for i, v in enumerate(taxonomy.verbs)}
+        skill_words = {w for s in taxonomy.skills for w in tokens(s)}
+        keyword_index = {}
+        verb_rows, verb_cols, kw_rows, kw_cols = [], [], [], []
+        for row, text in enumerate(texts):
+            counts = Counter(tokens(text.lower()))
+            for word in counts.keys() & verb_index.keys():
+                verb_rows.append(row)
+                verb_cols.append(verb_index[word])
+            # Repeated words that are not filler, skills or verbs: what the posting keeps returning to
+            candidates = [(n, w) for w, n in counts.items()
+                          if n > 1 and len(w) > 2 and w not in STOPWORDS and w not in skill_words and w not in verb_index]
+            candidates.sort(key=lambda c: (-c[0], c[1]))
+            for _, word in candidates[:keywords_per_job]:
+                kw_rows.append(row)
+                kw_cols.append(keyword_index.setdefault(word, len(keyword_index)))
+        self.verbs = list(taxonomy.verbs)
+        self.verb_rows, self.verb_cols = _coo(verb_rows, verb_cols, max(len(self.verbs), 1))
+        self.keywords = list(keyword_index)
+        self.kw_rows, self.kw_cols = _coo(kw_rows, kw_cols, max(len(self.keywords), 1))
+
+    @property
+    def config(self):
+        """Part of the cache key: anything besides the two texts that changes results."""
+        return f"{GAP_VERSION}:{self.taxonomy.fingerprint}"
+
+    def _coverage(self, rows, cols, present, weights=None):
+        """Per-posting (matched weight, total weight) for one feature group."""
+        weights = np.ones(len(rows)) if weights is None else weights
+        total = np.bincount(rows, weights=weights, minlength=self.n_rows)
+        matched = np.bincount(rows, weights=weights * present[cols], minlength=self.n_rows)
+        return matched, total
+
+    @timed("gap.compare")
+    def compare(self, profile, rows=None):
+        """
+        One result dict per posting (or per index in `rows`): match (0-100), skill
+        coverage, matched/missing skills (title skills first) and missing keywords.
+        """
+        has_skill = np.fromiter((s in profile.skills for s in self.skills), dtype=bool, count=len(self.skills))
+        has_verb = np.fromiter((v in profile.words for v in self.verbs), dtype=bool, count=len(self.verbs))
+        has_kw = np.fromiter((k in profile.words for k in self.keywords), dtype=bool, count=len(self.keywords))
+
+        groups = {
+            "skills": self._coverage(self.skill_rows, self.skill_cols, has_skill, self.skill_weight),
+            "keywords": self._coverage(self.kw_rows, self.kw_cols, has_kw),
+            "verbs": self._coverage(self.verb_rows, self.verb_cols, has_verb),
+        }
+        score = np.zeros(self.n_rows)
+        weight_sum = np.zeros(self.n_rows)
+        for name, (matched, total) in groups.items():
+            # A posting that mentions no verbs (say) is scored on the other groups only
+            present = total > 0
+            score[present] += WEIGHTS[name] * matched[present] / total[present]
+            weight_sum[present] += WEIGHTS[name]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            match = np.where(weight_sum > 0, score / weight_sum, 0.0)
+        skill_matched, skill_total = groups["skills"]
+
+        # Per-posting lists: order skill pairs by row, then title skills first, then name
+        order = np.lexsort((self.skill_cols, -self.skill_weight, self.skill_rows))
+        skill_rows, skill_cols = self.skill_rows[order], self.skill_cols[order]
+        found = has_skill[skill_cols]
+        names = np.asarray(self.skills, dtype=object)[skill_cols]
+        matched_skills = _by_row(names[found], skill_rows[found], self.n_rows)
+        missing_skills = _by_row(names[~found], skill_rows[~found], self.n_rows)
+        lacking = ~has_kw[self.kw_cols]
+        missing_keywords = _by_row(np.asarray(self.keywords, dtype=object)[self.kw_cols[lacking]],
+                                   self.kw_rows[lacking], self.n_rows)
+
+        percent = np.rint(match * 100).astype(int).tolist()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coverage = np.round(skill_matched / skill_total, 3).tolist()
+        return [
+            {
+                "match": percent[row],
+                "skill_coverage": coverage[row] if skill_total[row] else None,
+                "matched_skills": matched_skills[row],
+                "missing_skills": missing_skills[row],
+                "missing_keywords": missing_keywords[row],
+            }
+            for row in (range(self.n_rows) if rows is None else rows)
+        ]
+
+    def report(self, profile, cache=None):
+        """
+        compare() for every posting, reusing cached (resume, posting) results from a
+        ResultCache and computing the rest in one batch. Returns the postings' Title/
+        Company/Date/Link/Source with Match, Matched/Missing Skills and Missing Keywords,
+        best match first.
+
+        The cache is read and written in bulk and holds an entry per posting: give it its
+        own in-memory ResultCache, not the one holding extracted resumes (which those
+        entries would evict). A SQLite-backed one works, but reading a result back from
+        disk costs more than compare() computing it again.
+        """
+        prefix = f"gap:{self.config}:{profile.key}:"
+        keys = [prefix + h for h in self.hashes]
+        results = cache.get_many(keys) if cache is not None else [None] * self.n_rows
+        todo = [i for i, r in enumerate(results) if r is None]
+        if todo:
+            computed = self.compare(profile, todo)
+            for i, result in zip(todo, computed):
+                results[i] = result
+            if cache is not None:
+                cache.put_many([(keys[i], result) for i, result in zip(todo, computed)])
+
+        out = self.jobs[[c for c in RESULT_COLUMNS if c in self.jobs.columns]].copy()
+        out["Match"] = [r["match"] for r in results]
+        out["Missing Skills"] = [", ".join(r["missing_skills"]) for r in results]
+        out["Matched Skills"] = [", ".join(r["matched_skills"]) for r in results]
+        out["Missing Keywords"] = [", ".join(r["missing_keywords"][:5]) for r in results]
+        return out.sort_values("Match", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def split_descriptions(text, separator="---"):
+    """Pasted job descriptions, one per block between separator lines; first line is the title."""
+    blocks = [b.strip() for b in re.split(rf"^\s*{re.escape(separator)}\s*$", text or "", flags=re.M)]
+    rows = []
+    for i, block in enumerate(b for b in blocks if b):
+        title, _, body = block.partition("\n")
+        rows.append({"Title": title.strip()[:120], "Company": "N/A", "Date": "N/A", "Link": f"#jd-{i + 1}",
+                     "Source": "Pasted", "Description": body.strip()})
+    return pd.DataFrame(rows, columns=RESULT_COLUMNS + ["Description"])
+
+
+def read_jobs(path):
+    """Postings from .csv / .parquet / .jsonl, or a folder of .txt descriptions."""
+    if os.path.isdir(path):
+        texts = []
+        for name in sorted(os.listdir(path)):
+            if name.lower().endswith(".txt"):
+                with open(os.path.join(path, name), encoding="utf-8", errors="replace") as f:
+                    texts.append(f.read())
+        return split_descriptions("\n---\n".join(texts))
+    lower = path.lower()
+    if lower.endswith(".parquet"):
+        from .job_table import JobTable
+        return JobTable.load(path).to_frame()
+    if lower.endswith((".jsonl", ".ndjson")):
+        return pd.read_json(path, lines=True)
+    return pd.read_csv(path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Missing skills and match score of a resume against many postings.")
+    ap.add_argument("resume", help="resume .pdf or .txt")
+    ap.add_argument("jobs", help="postings: .csv/.parquet/.jsonl with Title and Description, or a folder of .txt")
+    ap.add_argument("--out", help="write the full report (.csv or .jsonl)")
+    ap.add_argument("--top", type=int, default=20, help="rows to print")
+    args = ap.parse_args(argv)
+
+    from .resume_parser import ResumeParser
+    parser = ResumeParser(use_spacy=False)
+    if args.resume.lower().endswith(".pdf"):
+        text = parser.extract_text_from_pdf(args.resume)
+    else:
+        with open(args.resume, encoding="utf-8", errors="replace") as f:
+            text = f.read()
+
+    index = JobIndex(read_jobs(args.jobs))
+    report = index.report(ResumeProfile.from_text(text, parser))
+    if args.out:
+        if args.out.lower().endswith((".jsonl", ".ndjson")):
+            with open(args.out, "w", encoding="utf-8") as f:
+                for row in report.to_dict("records"):
+                    f.write(json.dumps(row, default=str) + "\n")
+        else:
+            report.to_csv(args.out, index=False)
+    with pd.option_context("display.max_colwidth", 60, "display.width", 200):
+        print(report[["Title", "Company", "Match", "Missing Skills"]].head(args.top).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
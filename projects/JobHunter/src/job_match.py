@@ -0,0 +1,190 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .cache import content_key
+from .skill_matcher import SkillMatcher, as_matcher, get_skill_matcher
+
+# Control character that never appears in postings and is not a word character,
+# so joining rows with it keeps \b boundaries intact at row edges
+_ROW_SEP = "\x1e"
+
+# Matrices of the last few result sets: ranking the same postings again (a repeated
+# search, another resume with the same skills) skips the text scan
+MATRIX_CACHE_SIZE = 4
+_matrix_cache = OrderedDict()
+_matrix_lock = threading.Lock()
+
+
+def skill_hits(texts, vocabulary):
+    """
+    Scans all texts in one pass. `vocabulary` is a collection of skills or a SkillMatcher
+    (whose aliases then count as their skill). Returns (row_ids, skill_ids, skills) where
+    each (row, skill) pair appears once and `skills` is the vocabulary order used for ids.
+    """
+    matcher = as_matcher(vocabulary)
+    skills = matcher.skills
+    if not skills or len(texts) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), skills
+
+    # Lowercase before measuring: lower() can change the length ("İ" -> "i̇"), and the
+    # row offsets must match the blob the positions come from
+    texts = [t.lower() for t in texts]
+    lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=len(texts))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    blob = _ROW_SEP.join(texts)
+
+    index = {s: i for i, s in enumerate(skills)}
+    positions, ids = [], []
+    for skill, hits in matcher.hit_positions(blob).items():
+        positions.extend(hits)
+        ids.extend([index[skill]] * len(hits))
+
+    positions = np.asarray(positions, dtype=np.int64)
+    skill_ids = np.asarray(ids, dtype=np.int64)
+    row_ids = np.searchsorted(starts, positions, side="right") - 1
+
+    # Binary matrix: collapse repeated mentions of a skill within one posting
+    pairs = np.unique(row_ids * len(skills) + skill_ids)
+    return pairs // len(skills), pairs % len(skills), skills
+
+
+def posting_texts(df, columns):
+    """The given columns (whichever exist) joined by spaces, one string per row."""
+    present = [c for c in columns if c in df.columns]
+    if not present:
+        return [""] * len(df)
+    text = df[present[0]].fillna("").astype(str)
+    for col in present[1:]:
+        text = text + " " + df[col].fillna("").astype(str)
+    return text.tolist()
+
+
+def _with_resume_skills(vocabulary, resume_skills):
+    """
+    Skills the resume lists but the vocabulary lacks still count towards the match.
+    The default vocabulary is the taxonomy's, aliases included; a resume skill that is
+    an alias ("k8s") stands for its skill, not for an extra one.
+    """
+    if vocabulary is None:
+        from .taxonomy import get_taxonomy
+        vocabulary = get_taxonomy().matcher
+    if not isinstance(vocabulary, SkillMatcher):
+        return set(vocabulary) | resume_skills
+    extra = {vocabulary.canonical(s) or s for s in resume_skills}.difference(vocabulary.skills)
+    if not extra:
+        return vocabulary
+    return get_skill_matcher(frozenset(vocabulary.skills) | extra, frozenset(vocabulary.aliases.items()))
+
+
+class JobSkillMatrix:
+    """
+    Sparse (posting x skill) hit matrix for a job DataFrame, stored as COO arrays.
+
+    Building it scans the posting text once; after that, scoring any number of resumes
+    is a handful of NumPy reductions over the hit pairs (no per-row Python work).
+    """
+
+    def __init__(self, df, vocabulary=None, text_columns=("Title", "Description"), texts=None):
+        if vocabulary is None:
+            from .taxonomy import get_taxonomy
+            vocabulary = get_taxonomy().matcher
+        if texts is None:
+            texts = posting_texts(df, text_columns)
+        self.n_rows = len(df)
+        self.matcher = as_matcher(vocabulary)
+        self.rows, self.cols, self.skills = skill_hits(texts, self.matcher)
+        doc_freq = np.bincount(self.cols, minlength=len(self.skills))
+        self.idf = np.log((1 + self.n_rows) / (1 + doc_freq)) + 1.0
+        self._weight = self.idf ** 2
+        self._job_norm = np.sqrt(np.bincount(self.rows, weights=self._weight[self.cols], minlength=self.n_rows))
+
+    def resume_vector(self, resume):
+        """
+        Boolean mask over self.skills for an analyze_resume() result or a list of skills.
+        Skills are read through the vocabulary's aliases, so "k8s" marks "kubernetes".
+        """
+        resume_skills = resume.get("skills", []) if isinstance(resume, dict) else list(resume or [])
+        canonical = self.matcher.canonical
+        resume_skills = {canonical(s) or s.lower() for s in resume_skills}
+        return np.fromiter((s in resume_skills for s in self.skills), dtype=bool, count=len(self.skills))
+
+    def score(self, resume):
+        """
+        Cosine similarity (0-1) between each posting and the resume, both as
+        IDF-weighted binary skill vectors.
+        """
+        in_resume = self.resume_vector(resume)
+        dot = np.bincount(self.rows, weights=self._weight[self.cols] * in_resume[self.cols], minlength=self.n_rows)
+        resume_norm = np.sqrt(self._weight[in_resume].sum())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.where(self._job_norm > 0, dot / (self._job_norm * resume_norm), 0.0)
+        return np.nan_to_num(score)
+
+    def matched_skills(self, resume):
+        """Comma-separated resume skills found in each posting."""
+        keep = self.resume_vector(resume)[self.cols]
+        rows, cols = self.rows[keep], self.cols[keep]
+        # Pairs come out of skill_hits sorted by row, then skill: slice names per row
+        bounds = np.searchsorted(rows, np.arange(self.n_rows + 1)).tolist()
+        names = np.asarray(self.skills, dtype=object)[cols].tolist()
+        out = np.empty(self.n_rows, dtype=object)
+        out[:] = [", ".join(names[a:b]) for a, b in zip(bounds, bounds[1:])]
+        return out
+
+
+def cached_matrix(df, vocabulary=None, text_columns=("Title", "Description")):
+    """
+    JobSkillMatrix for `df`, reused while the same posting texts are ranked against the
+    same vocabulary (keyed by a hash of the texts, so equal result sets share one entry).
+    """
+    if vocabulary is None:
+        from .taxonomy import get_taxonomy
+        vocabulary = get_taxonomy().matcher
+    matcher = as_matcher(vocabulary)
+    texts = posting_texts(df, text_columns)
+    key = (content_key(_ROW_SEP.join(texts).encode("utf-8", "surrogatepass")), matcher)
+    with _matrix_lock:
+        matrix = _matrix_cache.get(key)
+        if matrix is not None:
+            _matrix_cache.move_to_end(key)
+            return matrix
+    matrix = JobSkillMatrix(df, matcher, text_columns, texts=texts)
+    with _matrix_lock:
+        _matrix_cache[key] = matrix
+        while len(_matrix_cache) > MATRIX_CACHE_SIZE:
+            _matrix_cache.popitem(last=False)
+    return matrix
+
+
+def score_jobs(df, resume, vocabulary=None, text_columns=("Title", "Description"), with_matches=False, matrix=None):
+    """
+    Adds a "Match" column (0-100) ranking each posting against a resume.
+
+    `resume` is an analyze_resume() result or a list of skills. Pass a prebuilt
+    JobSkillMatrix to score several resumes against the same postings cheaply; without
+    one, the matrix comes from cached_matrix().
+    """
+    if df is None or df.empty:
+        return df
+
+    if matrix is None:
+        resume_skills = resume.get("skills", []) if isinstance(resume, dict) else list(resume or [])
+        vocabulary = _with_resume_skills(vocabulary, {s.lower() for s in resume_skills})
+        matrix = cached_matrix(df, vocabulary, text_columns)
+
+    out = df.copy()
+    out["Match"] = np.round(matrix.score(resume) * 100).astype(int)
+    if with_matches:
+        out["Matched Skills"] = matrix.matched_skills(resume)
+    return out
+
+
+def rank_jobs(df, resume, **kwargs):
+    """score_jobs() sorted best match first."""
+    scored = score_jobs(df, resume, **kwargs)
+    if scored is None or scored.empty:
+        return scored
+    return scored.sort_values("Match", ascending=False, kind="stable").reset_index(drop=True)
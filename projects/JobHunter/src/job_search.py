@@ -1,13 +1,19 @@
 import urllib.parse
-import feedparser
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-from jobspy import scrape_jobs
+from .metrics import timed
+
+# pandas, requests, bs4, feedparser and jobspy are imported inside the methods that use
+# them: jobspy alone takes longer to import than the rest of the app.
+
+JOBSPY_SITES = ["linkedin", "indeed", "glassdoor", "google"]
+
+GOOGLE_SEARCH_URL = "https://www.google.com/search"
 
 class JobSearcher:
-    def __init__(self):
+    def __init__(self, feed_fetcher=None, google_search_url=GOOGLE_SEARCH_URL):
+        # Both default to the live services; benchmarks point them at local fixtures
+        self._feed_fetcher = feed_fetcher
+        self.google_search_url = google_search_url
         self.rss_feeds = [
             "https://weworkremotely.com/categories/remote-programming-jobs.rss",
             "https://remotive.com/remote-jobs/software-dev/feed"
@@ -16,6 +22,13 @@ class JobSearcher:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
 
+    @property
+    def feed_fetcher(self):
+        if self._feed_fetcher is not None:
+            return self._feed_fetcher
+        from .feed_fetcher import get_feed_fetcher
+        return get_feed_fetcher(headers=self.headers)
+
     def generate_smart_links(self, role, location, skills):
         """Generates optimized boolean search URLs."""
         # Query Construction
@@ -34,33 +47,59 @@ class JobSearcher:
             {"name": "Naukri", "url": f"https://www.naukri.com/{role.replace(' ', '-')}-jobs-in-{location.lower().replace(' ', '-')}"}
         ]
 
-    def fetch_rss_jobs(self, search_term):
-        """Fetches jobs from RSS feeds."""
+    @timed("search.rss", count_rows=True)
+    def fetch_rss_jobs(self, search_term, include_description=False, raise_errors=False, dedupe=True,
+                       revalidate=False):
+        """
+        Fetches jobs from RSS feeds (concurrently, with per-feed caching and timeouts).
+        raise_errors=True raises when no feed could be fetched at all.
+        dedupe=True collapses the same posting syndicated by several feeds.
+        revalidate=True bypasses the feed cache's TTL (a conditional GET is still sent).
+        """
+        import pandas as pd
         jobs = []
+        feeds, errors = self.feed_fetcher.fetch_all(self.rss_feeds, revalidate=revalidate)
+        if raise_errors and errors and not feeds:
+            raise RuntimeError("; ".join(f"{url}: {error}" for url, error in errors.items()))
+        for url, error in errors.items():
+            print(f"RSS Error ({url}): {error}")
+
         for feed_url in self.rss_feeds:
-            try:
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries:
-                    title = entry.get('title', '').lower()
-                    if search_term.lower() in title:
-                        jobs.append({
-                            "Title": entry.get('title', 'No Title'),
-                            "Company": "RSS Source",
-                            "Date": entry.get('published', datetime.now().strftime("%Y-%m-%d")),
-                            "Link": entry.get('link', '#'),
-                            "Source": urllib.parse.urlparse(feed_url).netloc
-                        })
-            except Exception as e:
-                print(f"RSS Error: {e}")
-        return pd.DataFrame(jobs)
-
-    def scrape_live_jobs(self, role, location, limit=20):
+            for entry in feeds.get(feed_url, []):
+                title = entry.get('title', '').lower()
+                if search_term.lower() in title:
+                    job = {
+                        "Title": entry.get('title') or 'No Title',
+                        "Company": "RSS Source",
+                        "Date": entry.get('published') or datetime.now().strftime("%Y-%m-%d"),
+                        "Link": entry.get('link') or '#',
+                        "Source": urllib.parse.urlparse(feed_url).netloc
+                    }
+                    if include_description or dedupe:
+                        job["Description"] = entry.get('summary', '')
+                    jobs.append(job)
+        df = pd.DataFrame(jobs)
+        if dedupe:
+            # Every feed row has Company "RSS Source", so the summary is what tells postings apart
+            from .dedupe import drop_near_duplicates
+            df = drop_near_duplicates(df)
+            if not include_description and "Description" in df.columns:
+                df = df.drop(columns=["Description"])
+        return df
+
+    @timed("search.jobspy", count_rows=True)
+    def scrape_live_jobs(self, role, location, limit=20, include_description=False, sites=None, raise_errors=False,
+                         dedupe=True):
         """
         Scrapes real-time jobs from LinkedIn, Indeed, Glassdoor, and Google using python-jobspy.
+        `sites` narrows the jobspy site list; raise_errors=True propagates failures to the caller.
+        dedupe=True collapses the same role posted on several sites under different URLs.
         """
+        import pandas as pd
         try:
+            from jobspy import scrape_jobs
             jobs = scrape_jobs(
-                site_name=["linkedin", "indeed", "glassdoor", "google"],
+                site_name=sites or JOBSPY_SITES,
                 search_term=role,
                 location=location,
                 results_wanted=limit,
@@ -79,9 +118,16 @@ class JobSearcher:
                 "site": "Source",
                 "date_posted": "Date"
             })
+            if dedupe:
+                # Before dropping columns, so jobspy's full descriptions take part in matching
+                from .dedupe import drop_near_duplicates
+                normalized_jobs = drop_near_duplicates(normalized_jobs.rename(columns={"description": "Description"}))
             
             # Select only relevant columns
             cols_to_keep = ["Title", "Company", "Date", "Link", "Source"]
+            if include_description:
+                normalized_jobs = normalized_jobs.rename(columns={"description": "Description"})
+                cols_to_keep.append("Description")
             # Fill missing columns if any
             for col in cols_to_keep:
                 if col not in normalized_jobs.columns:
@@ -90,48 +136,76 @@ class JobSearcher:
             return normalized_jobs[cols_to_keep]
 
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"JobSpy Error: {e}")
             return pd.DataFrame()
 
-    def google_custom_scrape(self, query, location):
+    @timed("search.google", count_rows=True)
+    def google_custom_scrape(self, query, location, raise_errors=False, max_workers=8):
         """
         Attempts to find specific job application links via Google Search.
         WARNING: This is strictly educational/demonstration code. 
         Google often blocks automated requests without API.
+
+        `query` may be a list of queries; they are fetched concurrently over the shared
+        pooled session (see serp.py) and their links merged. raise_errors=True raises when
+        no query got a usable page.
         """
-        # Targeted search for Applicant Tracking Systems
-        search_query = f'{query} jobs in {location} "apply" (site:greenhouse.io OR site:lever.co OR site:workday.com)'
-        url = f"https://www.google.com/search?q={urllib.parse.quote(search_query)}"
-        
-        try:
-            res = requests.get(url, headers=self.headers, timeout=10)
+        import pandas as pd
+        from concurrent.futures import ThreadPoolExecutor
+        from .serp import get_session, job_links
+
+        queries = [query] if isinstance(query, str) else list(query)
+        date = datetime.now().strftime("%Y-%m-%d")
+        session = get_session()
+
+        def fetch(q):
+            # Targeted search for Applicant Tracking Systems
+            search_query = f'{q} jobs in {location} "apply" (site:greenhouse.io OR site:lever.co OR site:workday.com)'
+            url = f"{self.google_search_url}?q={urllib.parse.quote(search_query)}"
+            res = session.get(url, headers=self.headers, timeout=10)
             if res.status_code != 200:
-                return pd.DataFrame() # Blocked or error
-                
-            soup = BeautifulSoup(res.text, 'html.parser')
-            links = []
-            
-            # Extract links from search results (generic 'a' filtering)
-            for a in soup.find_all('a', href=True):
-                href = a['href']
-                text = a.get_text()
-                
-                # Logic to filter valid external links
-                if href.startswith("http") and "google.com" not in href:
-                    # Check for ATS domains
-                    if any(d in href for d in ['greenhouse.io', 'lever.co', 'workday', 'linkedin.com/jobs']):
-                        links.append({
-                            "Title": text[:50] + "...",
-                            "Company": "Derived from URL",
-                            "Link": href,
-                            "Source": "Google Search",
-                            "Date": datetime.now().strftime("%Y-%m-%d")
-                        })
-            
-            # Remove duplicates
-            unique_links = {v['Link']: v for v in links}.values()
-            return pd.DataFrame(unique_links)
-            
-        except Exception as e:
-            print(f"Scrape Error: {e}")
+                raise RuntimeError(f"Google returned HTTP {res.status_code}")
+            return job_links(res.text, date)
+
+        if len(queries) == 1:
+            outcomes = [_attempt(fetch, queries[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as pool:
+                outcomes = list(pool.map(lambda q: _attempt(fetch, q), queries))
+
+        errors = [error for _, error in outcomes if error is not None]
+        if errors and len(errors) == len(outcomes):
+            if raise_errors:
+                raise errors[0]
+            print(f"Scrape Error: {errors[0]}")
             return pd.DataFrame()
+
+        # Same link found by several queries: keep the first
+        unique_links = {}
+        for links, _ in outcomes:
+            for row in links or ():
+                unique_links.setdefault(row["Link"], row)
+        return pd.DataFrame(list(unique_links.values()))
+
+    def refresh_index(self, store, role=None, location=None, use_scraper=False):
+        """
+        Pulls the configured sources into a JobStore and expires old postings.
+        RSS feeds are indexed in full; live scraping needs a role/location.
+        Returns the number of new postings.
+        """
+        added = store.upsert(self.fetch_rss_jobs("", include_description=True, revalidate=True), source_key="rss")
+        if use_scraper and role:
+            df = self.scrape_live_jobs(role, location or "Remote", include_description=True)
+            added += store.upsert(df, source_key=f"jobspy:{role.lower()}:{(location or '').lower()}")
+        store.expire()
+        return added
+
+
+def _attempt(fn, *args):
+    """(result, None) or (None, exception), so one failed query does not sink the others."""
+    try:
+        return fn(*args), None
+    except Exception as e:
+        return None, e
@@ -0,0 +1,224 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+import pandas as pd
+
+from .job_table import compact_frame
+from .metrics import timed
+
+RESULT_COLUMNS = ["Title", "Company", "Date", "Link", "Source"]
+
+# Query parameters that only track the click and do not identify the posting
+_TRACKING_PARAMS = re.compile(r"^(utm_.*|ref|refid|trk|trackingid|src|from|gclid|fbclid)$", re.I)
+_FTS_TOKEN = re.compile(r"[\w+#.]+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    link_key TEXT UNIQUE NOT NULL,
+    title TEXT, company TEXT, date TEXT, link TEXT, source TEXT, description TEXT,
+    first_seen REAL NOT NULL, last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs(last_seen);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, description, content='jobs', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts(rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+    INSERT INTO jobs_fts(rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+CREATE TABLE IF NOT EXISTS refreshes (source TEXT PRIMARY KEY, refreshed_at REAL NOT NULL, rows INTEGER);
+"""
+
+
+def default_store_path():
+    """data/jobs.db next to the app, unless JOBHUNTER_JOBS_DB points elsewhere."""
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.environ.get("JOBHUNTER_JOBS_DB", os.path.join(project_dir, "data", "jobs.db"))
+
+
+def normalize_link(link):
+    """Canonical form of a posting URL used for deduplication."""
+    if not link or link == "#":
+        return None
+    parts = urllib.parse.urlsplit(link.strip())
+    query = [
+        (k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if not _TRACKING_PARAMS.match(k)
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urllib.parse.urlunsplit((
+        "https" if parts.scheme in ("http", "https") else parts.scheme,
+        parts.netloc.lower().removeprefix("www."),
+        path,
+        urllib.parse.urlencode(sorted(query)),
+        "",
+    ))
+
+
+def to_fts_query(text):
+    """Turns free text into an FTS5 query: every word must match (as a prefix)."""
+    tokens = _FTS_TOKEN.findall(text or "")
+    return " ".join('"' + t.replace('"', '""') + '"*' for t in tokens)
+
+
+class JobStore:
+    """
+    Persistent job index on SQLite + FTS5.
+    Refreshing (upsert/expire) and querying (search) are independent, so searches
+    never wait on the network.
+    """
+
+    def __init__(self, path=":memory:", max_age_days=14):
+        self.path = path
+        self.max_age = max_age_days * 86400
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            # Readers do not block on a writer, so a refresher in another process can
+            # update the index while the app searches it
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    @timed("store.upsert")
+    def upsert(self, df, source_key=None, now=None):
+        """
+        Adds or refreshes rows from a Title/Company/Date/Link/Source DataFrame (an optional
+        Description column is indexed too). Returns the number of new postings.
+        """
+        now = time.time() if now is None else now
+        if df is None or df.empty:
+            if source_key:
+                self._mark_refreshed(source_key, now, 0)
+            return 0
+
+        rows = []
+        for rec in df.to_dict("records"):
+            key = normalize_link(str(rec.get("Link") or ""))
+            if key is None:
+                continue
+            rows.append((
+                key, _s(rec.get("Title")), _s(rec.get("Company")), _s(rec.get("Date")),
+                _s(rec.get("Link")), _s(rec.get("Source")), _s(rec.get("Description")), now, now,
+            ))
+
+        with self._lock:
+            before = self._count()
+            self._db.executemany(
+                """
+                INSERT INTO jobs (link_key, title, company, date, link, source, description, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(link_key) DO UPDATE SET
+                    title = excluded.title,
+                    company = excluded.company,
+                    date = excluded.date,
+                    source = excluded.source,
+                    description = COALESCE(NULLIF(excluded.description, ''), jobs.description),
+                    last_seen = excluded.last_seen
+                """,
+                rows,
+            )
+            added = self._count() - before
+            if source_key:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO refreshes (source, refreshed_at, rows) VALUES (?, ?, ?)",
+                    (source_key, now, len(rows)),
+                )
+            self._db.commit()
+        return added
+
+    def expire(self, now=None):
+        """Drops postings not seen by any refresh within max_age_days."""
+        now = time.time() if now is None else now
+        with self._lock:
+            cur = self._db.execute("DELETE FROM jobs WHERE last_seen < ?", (now - self.max_age,))
+            self._db.commit()
+            return cur.rowcount
+
+    @timed("store.search", count_rows=True)
+    def search(self, query, limit=200, with_description=False):
+        """
+        Ranked full-text search over title, company and description (title weighs most).
+        Title/Company/Date/Source come back as categoricals (see job_table.compact_frame).
+        """
+        fts_query = to_fts_query(query)
+        columns = RESULT_COLUMNS + (["Description"] if with_description else [])
+        select = "j.title, j.company, j.date, j.link, j.source" + (", j.description" if with_description else "")
+        with self._lock:
+            if fts_query:
+                rows = self._db.execute(
+                    f"""
+                    SELECT {select}
+                    FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid
+                    WHERE jobs_fts MATCH ?
+                    ORDER BY bm25(jobs_fts, 10.0, 3.0, 1.0), j.last_seen DESC
+                    LIMIT ?
+                    """,
+                    (fts_query, limit),
+                ).fetchall()
+            else:
+                rows = self._db.execute(
+                    f"SELECT {select} FROM jobs j ORDER BY last_seen DESC LIMIT ?",
+                    (limit,),
+                ).fetchall()
+        return compact_frame(pd.DataFrame(rows, columns=columns))
+
+    def last_refresh(self, source_key):
+        with self._lock:
+            row = self._db.execute("SELECT refreshed_at FROM refreshes WHERE source = ?", (source_key,)).fetchone()
+        return row[0] if row else None
+
+    def refresh_log(self):
+        """{source_key: {"refreshed_at", "rows"}} for every source that has been refreshed."""
+        with self._lock:
+            rows = self._db.execute("SELECT source, refreshed_at, rows FROM refreshes ORDER BY source").fetchall()
+        return {source: {"refreshed_at": at, "rows": count} for source, at, count in rows}
+
+    def is_stale(self, source_key, ttl, now=None):
+        now = time.time() if now is None else now
+        last = self.last_refresh(source_key)
+        return last is None or now - last > ttl
+
+    def __len__(self):
+        with self._lock:
+            return self._count()
+
+    def _count(self):
+        return self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def _mark_refreshed(self, source_key, now, rows):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO refreshes (source, refreshed_at, rows) VALUES (?, ?, ?)",
+                (source_key, now, rows),
+            )
+            self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+def _s(value):
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    return str(value)
@@ -0,0 +1,160 @@
+import io
+
+import pandas as pd
+
+from .metrics import timed
+
+# pyarrow is imported where it is used: compact_frame() is on the search path and
+# should not pay for loading Arrow.
+
+# Columns with few distinct values per result set (a handful of sources and dates, the
+# same companies and titles over and over) are stored once and referenced by integer codes
+CATEGORY_COLUMNS = ("Title", "Company", "Date", "Source")
+
+DEFAULT_CHUNK_ROWS = 20_000
+
+
+def compact_frame(df):
+    """
+    Same frame with CATEGORY_COLUMNS as pandas categoricals. Missing values become "N/A"
+    (as in merge_results) so later fillna("") calls never need a new category.
+    """
+    if df is None or df.empty:
+        return df
+    out = df.copy()
+    for col in CATEGORY_COLUMNS:
+        if col in out.columns and not isinstance(out[col].dtype, pd.CategoricalDtype):
+            out[col] = out[col].fillna("N/A").astype(str).astype("category")
+    return out
+
+
+class JobTable:
+    """
+    Job results as an Arrow table: one typed buffer per column, CATEGORY_COLUMNS
+    dictionary-encoded. Persisted as Parquet, which keeps the dictionary encoding on disk.
+
+    Used where a finished result set is held or written whole: the app's results between
+    reruns, the exports, and Parquet postings read by the gap CLI. Fetchers and JobStore
+    stay on DataFrames, since dedupe, ranking and the SQLite index all work on pandas;
+    JobStore.search() returns compact_frame() categoricals, which get most of the memory
+    saving without loading Arrow on the search path.
+    """
+
+    def __init__(self, table):
+        self.table = table
+
+    @classmethod
+    def from_frame(cls, df):
+        import pyarrow as pa
+        table = pa.Table.from_pandas(compact_frame(df) if df is not None else pd.DataFrame(), preserve_index=False)
+        return cls(table)
+
+    @classmethod
+    def from_records(cls, records, columns=None):
+        """Builds the columns straight from a list of dicts, without a DataFrame in between."""
+        import pyarrow as pa
+        if columns is None:
+            columns = list(dict.fromkeys(key for record in records for key in record))
+        arrays = []
+        for col in columns:
+            values = [r.get(col) for r in records]
+            if col in CATEGORY_COLUMNS:
+                values = ["N/A" if v is None else str(v) for v in values]
+                arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values))
+        return cls(pa.table(arrays, names=columns))
+
+    @classmethod
+    def load(cls, path, columns=None):
+        import pyarrow.parquet as pq
+        return cls(pq.read_table(path, columns=columns))
+
+    @timed("job_table.save")
+    def save(self, path, compression="zstd", row_group_rows=64_000):
+        import pyarrow.parquet as pq
+        pq.write_table(self.table, path, compression=compression, row_group_size=row_group_rows)
+
+    def to_frame(self):
+        """pandas view; dictionary columns come back as categoricals."""
+        return self.table.to_pandas()
+
+    def iter_frames(self, chunk_rows=DEFAULT_CHUNK_ROWS):
+        for batch in self.table.to_batches(max_chunksize=chunk_rows):
+            yield batch.to_pandas()
+
+    @property
+    def nbytes(self):
+        return self.table.nbytes
+
+    @property
+    def columns(self):
+        return self.table.column_names
+
+    def __len__(self):
+        return self.table.num_rows
+
+
+def _frames(data, chunk_rows):
+    if isinstance(data, JobTable):
+        yield from data.iter_frames(chunk_rows)
+    else:
+        for start in range(0, len(data), chunk_rows):
+            yield data.iloc[start:start + chunk_rows]
+
+
+def iter_csv(data, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """UTF-8 CSV of a JobTable or DataFrame, yielded in chunks of about `chunk_rows` rows."""
+    if isinstance(data, JobTable):
+        # Arrow's writer encodes dictionary columns directly, without going through pandas
+        import pyarrow.csv as pacsv
+        buffer = io.BytesIO()
+        with pacsv.CSVWriter(buffer, data.table.schema) as writer:
+            for batch in data.table.to_batches(max_chunksize=chunk_rows):
+                writer.write_batch(batch)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.getvalue():
+            yield buffer.getvalue()
+        return
+
+    header = True
+    for frame in _frames(data, chunk_rows):
+        yield frame.to_csv(index=False, header=header).encode("utf-8")
+        header = False
+    if header:
+        yield ",".join(data.columns).encode("utf-8") + b"\n"
+
+
+@timed("job_table.csv")
+def csv_bytes(data, chunk_rows=DEFAULT_CHUNK_ROWS):
+    return b"".join(iter_csv(data, chunk_rows))
+
+
+@timed("job_table.excel")
+def excel_bytes(data, sheet_name="DeepSearch_Results", chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    .xlsx workbook written with openpyxl's write-only mode, which streams rows to the
+    file instead of building every cell object in memory first.
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=sheet_name)
+    sheet.append(list(data.columns))
+    for frame in _frames(data, chunk_rows):
+        for row in frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None):
+            sheet.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@timed("job_table.parquet")
+def parquet_bytes(data, compression="zstd"):
+    import pyarrow.parquet as pq
+    table = data if isinstance(data, JobTable) else JobTable.from_frame(data)
+    buffer = io.BytesIO()
+    pq.write_table(table.table, buffer, compression=compression)
+    return buffer.getvalue()
@@ -0,0 +1,223 @@
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """
+    In-process timings and counters for the analyze/search pipelines.
+
+    Disabled by default; when off, span() returns a shared no-op and incr()/observe()
+    return after one attribute check. Enable with JOBHUNTER_METRICS=1 or metrics.enable().
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._spans = {}     # name -> [count, total seconds, max seconds]
+        self._counters = {}  # name -> value
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def span(self, name):
+        if not self.enabled:
+            return _NOOP
+        return _Span(self, name)
+
+    def observe(self, name, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._spans.get(name)
+            if entry is None:
+                self._spans[name] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+
+    def incr(self, name, value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+    def drain(self):
+        """Raw spans and counters recorded since the last drain (then cleared), for merge()."""
+        with self._lock:
+            data = {"spans": self._spans, "counters": self._counters}
+            self._spans, self._counters = {}, {}
+        return data
+
+    def merge(self, data):
+        """Adds another process's drain() output, e.g. from a worker pool."""
+        if not data or not (data["spans"] or data["counters"]):
+            return
+        with self._lock:
+            for name, (count, total, peak) in data["spans"].items():
+                entry = self._spans.get(name)
+                if entry is None:
+                    self._spans[name] = [count, total, peak]
+                else:
+                    entry[0] += count
+                    entry[1] += total
+                    entry[2] = max(entry[2], peak)
+            for name, value in data["counters"].items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "spans": {
+                    name: {"count": c, "total_s": round(t, 6), "avg_ms": round(t / c * 1000, 3), "max_ms": round(m * 1000, 3)}
+                    for name, (c, t, m) in sorted(self._spans.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix="jobhunter"):
+        """Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines = [
+            f"# TYPE {prefix}_span_seconds summary",
+        ]
+        for name, s in snap["spans"].items():
+            label = _label(name)
+            lines.append(f'{prefix}_span_seconds_count{{span="{label}"}} {s["count"]}')
+            lines.append(f'{prefix}_span_seconds_sum{{span="{label}"}} {s["total_s"]}')
+        lines.append(f"# TYPE {prefix}_span_seconds_max gauge")
+        for name, s in snap["spans"].items():
+            lines.append(f'{prefix}_span_seconds_max{{span="{_label(name)}"}} {round(s["max_ms"] / 1000, 6)}')
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in snap["counters"].items():
+            lines.append(f'{prefix}_events_total{{name="{_label(name)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = Metrics(enabled=os.environ.get("JOBHUNTER_METRICS", "").lower() in ("1", "true", "yes"))
+
+
+def span(name):
+    return metrics.span(name)
+
+
+def incr(name, value=1):
+    metrics.incr(name, value)
+
+
+def timed(name, count_rows=False):
+    """
+    Decorator recording the call as span `name`. With count_rows, also adds len(result)
+    to the `<name>.rows` counter (for functions returning DataFrames/lists).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                metrics.observe(name, time.perf_counter() - start)
+            if count_rows and result is not None:
+                try:
+                    metrics.incr(name + ".rows", len(result))
+                except TypeError:
+                    pass
+            return result
+        return wrapper
+    return decorator
+
+
+class ProfileReport:
+    def __init__(self, engine):
+        self.engine = engine
+        self.text = ""
+
+
+@contextmanager
+def profile(enabled=True, engine="cprofile", limit=30):
+    """
+    Opt-in per-request profiler. Yields a ProfileReport whose .text is filled on exit.
+    engine="pyinstrument" is used when that package is installed, else cProfile.
+    """
+    if not enabled:
+        yield ProfileReport(None)
+        return
+
+    if engine == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            engine = "cprofile"
+
+    report = ProfileReport(engine)
+    if engine == "pyinstrument":
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield report
+        finally:
+            profiler.stop()
+            report.text = profiler.output_text(unicode=True, color=False)
+    else:
+        import cProfile
+        import io
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+            report.text = out.getvalue()
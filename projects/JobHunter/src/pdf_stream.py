@@ -0,0 +1,161 @@
+import io
+import os
+import time
+
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+
+from .metrics import incr
+
+# Defaults sized for resumes: real CVs are 1-3 pages and a few thousand characters
+DEFAULT_MAX_PAGES = 10
+DEFAULT_MAX_CHARS = 200_000
+DEFAULT_MAX_SECONDS = 10.0
+DEFAULT_MAX_FILE_BYTES = 20 * 1024 * 1024
+
+
+class _PastDeadline(Exception):
+    """Raised from inside pdfminer to abandon the page being extracted."""
+
+
+class _DeadlineConverter(TextConverter):
+    """TextConverter that gives up once `deadline` (a perf_counter() value) has passed."""
+
+    deadline = None
+
+    def check_deadline(self):
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise _PastDeadline()
+
+    def end_page(self, page):
+        # Layout analysis is a third of a page's cost; skip it when time is already up
+        self.check_deadline()
+        super().end_page(page)
+
+
+class _DeadlineInterpreter(PDFPageInterpreter):
+    """Checks the device's deadline on every operand, so one slow page cannot run on."""
+
+    def push(self, obj):
+        self.device.check_deadline()
+        super().push(obj)
+
+
+class PdfPageStream:
+    """
+    Iterates over a PDF's text one page at a time, with budgets.
+
+    Stops (without raising) when any limit is hit:
+      max_pages      - pages extracted
+      max_chars      - total characters of text produced
+      max_seconds    - wall time, checked while each page is interpreted and before its
+                       layout analysis; a page cut short is dropped, not yielded
+      max_file_bytes - size of the input file, checked before parsing
+      enough_chars   - optional early exit once this much text has been found
+
+    Page text is byte-for-byte what pdfminer's extract_text() produces for that page.
+    After iteration, `stop_reason`, `error`, `pages`, `chars` and `elapsed` describe the run.
+    """
+
+    def __init__(self, pdf_file, max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS,
+                 max_seconds=DEFAULT_MAX_SECONDS, max_file_bytes=DEFAULT_MAX_FILE_BYTES, enough_chars=None):
+        self.pdf_file = pdf_file
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.max_seconds = max_seconds
+        self.max_file_bytes = max_file_bytes
+        self.enough_chars = enough_chars
+        self.pages = 0
+        self.chars = 0
+        self.elapsed = 0.0
+        self.stop_reason = None
+        self.error = None
+
+    def __iter__(self):
+        start = time.perf_counter()
+        fp, close = self._open()
+        try:
+            if fp is None:
+                return
+            rsrcmgr = PDFResourceManager()
+            buffer = io.StringIO()
+            device = _DeadlineConverter(rsrcmgr, buffer, laparams=LAParams())
+            if self.max_seconds is not None:
+                device.deadline = start + self.max_seconds
+            interpreter = _DeadlineInterpreter(rsrcmgr, device)
+            try:
+                for page in PDFPage.get_pages(fp):
+                    if self.max_pages is not None and self.pages >= self.max_pages:
+                        self.stop_reason = "max_pages"
+                        break
+                    try:
+                        device.check_deadline()
+                        interpreter.process_page(page)
+                    except _PastDeadline:
+                        self.stop_reason = "max_seconds"
+                        break
+                    text = buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+
+                    if self.max_chars is not None and self.chars + len(text) > self.max_chars:
+                        text = text[:self.max_chars - self.chars]
+                        self.stop_reason = "max_chars"
+                    self.pages += 1
+                    self.chars += len(text)
+                    incr("pdf.pages")
+                    self.elapsed = time.perf_counter() - start
+                    yield text
+
+                    if self.stop_reason:
+                        break
+                    if self.enough_chars is not None and self.chars >= self.enough_chars:
+                        self.stop_reason = "enough_chars"
+                        break
+            except Exception as e:
+                self.error = str(e)
+                self.stop_reason = "error"
+            finally:
+                device.close()
+        finally:
+            self.elapsed = time.perf_counter() - start
+            if self.stop_reason:
+                incr(f"pdf.stopped.{self.stop_reason}")
+            if close:
+                fp.close()
+
+    def _open(self):
+        """Returns (binary file object, should_close); enforces max_file_bytes."""
+        src = self.pdf_file
+        if isinstance(src, (bytes, bytearray)):
+            size, fp, close = len(src), io.BytesIO(src), True
+        elif isinstance(src, (str, os.PathLike)):
+            size, fp, close = os.path.getsize(src), open(src, "rb"), True
+        else:
+            fp, close = src, False
+            try:
+                pos = fp.tell()
+                fp.seek(0, os.SEEK_END)
+                size = fp.tell() - pos
+                fp.seek(pos)
+            except (AttributeError, OSError):
+                size = None
+
+        if self.max_file_bytes is not None and size is not None and size > self.max_file_bytes:
+            self.stop_reason = "max_file_bytes"
+            self.error = f"PDF is {size} bytes, limit is {self.max_file_bytes}"
+            if close:
+                fp.close()
+            return None, False
+        return fp, close
+
+    def stats(self):
+        return {
+            "pages": self.pages,
+            "chars": self.chars,
+            "elapsed": round(self.elapsed, 4),
+            "stop_reason": self.stop_reason,
+            "error": self.error,
+        }
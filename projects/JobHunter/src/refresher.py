@@ -0,0 +1,403 @@
+"""
+Background refresher that keeps the JobStore filled, so searches only query the
+local index and never wait on the network.
+
+Each source (the RSS feeds, and every jobspy site for each watched role/location) has
+its own schedule:
+
+- runs every `interval` seconds, jittered by +/- `jitter` so sources drift apart;
+- two requests to the same site are at least `min_spacing` seconds apart;
+- after a failure it retries with exponential backoff (backoff_base * 2**n, capped at
+  backoff_max, randomized), and returns to its normal interval after a success.
+
+Queries watched on behalf of searches are dropped once nobody has searched them for
+`watch_ttl` seconds, and at most `max_watched` of them are kept (least recently searched
+go first). Queries given to the constructor (e.g. --query) are always kept.
+
+Runs as a daemon thread inside the app, or as its own process writing to the same
+SQLite file:
+
+    python -m src.refresher [--query "Python Developer@Remote" ...] [--once]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .metrics import _label, incr, span
+
+DEFAULT_RSS_INTERVAL = 15 * 60
+DEFAULT_JOBSPY_INTERVAL = 60 * 60
+DEFAULT_MAX_WATCHED = 20
+DEFAULT_WATCH_TTL = 3 * 24 * 60 * 60
+
+
+class Source:
+    """A refreshable source with its schedule and health."""
+
+    def __init__(self, name, fetch, interval, limit_key=None):
+        self.name = name
+        self.fetch = fetch
+        self.interval = interval
+        self.limit_key = limit_key or name
+        self.next_run = 0.0      # monotonic
+        self.running = False
+        self.failures = 0        # consecutive
+        self.runs = 0
+        self.last_attempt = None  # wall clock, so it can be shown and compared across processes
+        self.last_success = None
+        self.last_error = None
+        self.last_seconds = None
+        self.last_rows = 0
+        self.total_rows = 0
+        self.added = 0
+
+
+def query_key(role, location):
+    return f"{role.strip().lower()}@{(location or '').strip().lower()}"
+
+
+class Refresher:
+    """
+    Pulls the configured sources into `store` on a schedule (see module docstring).
+    start()/stop() control the scheduler thread; run_once() refreshes everything now.
+    """
+
+    def __init__(self, store, searcher=None, queries=(), sites=None, rss_interval=DEFAULT_RSS_INTERVAL,
+                 jobspy_interval=DEFAULT_JOBSPY_INTERVAL, jitter=0.2, min_spacing=30, backoff_base=30,
+                 backoff_max=3600, startup_spread=5, max_workers=4, jobspy_limit=50, max_watched=DEFAULT_MAX_WATCHED,
+                 watch_ttl=DEFAULT_WATCH_TTL, seed=None):
+        if searcher is None:
+            from .job_search import JobSearcher
+            searcher = JobSearcher()
+        from .job_search import JOBSPY_SITES
+        self.store = store
+        self.searcher = searcher
+        self.sites = list(sites or JOBSPY_SITES)
+        self.rss_interval = rss_interval
+        self.jobspy_interval = jobspy_interval
+        self.jitter = jitter
+        self.min_spacing = min_spacing
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.startup_spread = startup_spread
+        self.jobspy_limit = jobspy_limit
+        self.max_watched = max_watched
+        self.watch_ttl = watch_ttl
+        self.started_at = time.time()
+
+        self._rng = random.Random(seed)
+        self._sources = {}
+        self._watched = {}  # query_key -> {"sources", "last_watched" (wall clock), "pinned"}
+        self._limits = {}  # limit_key -> monotonic time the next request may start
+        self._cond = threading.Condition()
+        self._stopped = True
+        self._thread = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="refresh")
+        self._last_expire = 0.0
+
+        self.add_source(
+            "rss",
+            # Past the feed cache's TTL: every scheduled run asks the feeds (a 304 is cheap)
+            lambda: searcher.fetch_rss_jobs("", include_description=True, raise_errors=True, revalidate=True),
+            rss_interval,
+        )
+        for role, location in queries:
+            self.watch(role, location, pinned=True)
+
+    # --- configuration ---
+
+    def add_source(self, name, fetch, interval, limit_key=None, first_run_in=None):
+        """
+        Registers a source; `fetch` returns a DataFrame for JobStore.upsert. A source the
+        store saw recently (e.g. before a restart) waits out the rest of its interval;
+        `first_run_in` postpones the first run further (e.g. when the caller just fetched).
+        """
+        source = Source(name, fetch, interval, limit_key)
+        last = self.store.last_refresh(name)
+        age = time.time() - last if last is not None else None
+        delay = self._rng.uniform(0, self.startup_spread)
+        if age is not None and age < interval:
+            delay += interval - age
+        elif first_run_in is not None:
+            delay += first_run_in
+        source.next_run = time.monotonic() + delay
+        source.last_success = last
+        with self._cond:
+            if name not in self._sources:
+                self._sources[name] = source
+                self._cond.notify_all()
+        return self._sources[name]
+
+    def jobspy_sources(self, role, location):
+        """Store source keys used for a watched query, one per jobspy site."""
+        return [f"jobspy:{site}:{query_key(role, location)}" for site in self.sites]
+
+    def watch(self, role, location="Remote", first_run_in=None, pinned=False):
+        """
+        Adds one jobspy source per site for this role/location, or marks an already watched
+        query as just searched. `pinned` queries are never pruned.
+        """
+        location = location or "Remote"
+        key = query_key(role, location)
+        with self._cond:
+            entry = self._watched.get(key)
+            if entry is not None:
+                entry["last_watched"] = time.time()
+                entry["pinned"] = entry["pinned"] or pinned
+                return
+            self._watched[key] = {"sources": self.jobspy_sources(role, location), "last_watched": time.time(),
+                                  "pinned": pinned}
+        for site, name in zip(self.sites, self.jobspy_sources(role, location)):
+            self.add_source(
+                name,
+                lambda site=site: self.searcher.scrape_live_jobs(
+                    role, location, limit=self.jobspy_limit, include_description=True,
+                    sites=[site], raise_errors=True,
+                ),
+                self.jobspy_interval,
+                limit_key=f"jobspy:{site}",
+                first_run_in=first_run_in,
+            )
+        self.prune_watched()
+
+    def prune_watched(self, now=None):
+        """
+        Stops watching queries not searched for `watch_ttl` seconds, then the least recently
+        searched ones beyond `max_watched`. Pinned queries stay. Returns the dropped keys.
+        """
+        now = time.time() if now is None else now
+        with self._cond:
+            # Oldest first, so the expired queries are a prefix
+            unpinned = sorted((e["last_watched"], key) for key, e in self._watched.items() if not e["pinned"])
+            expired = sum(1 for last, _ in unpinned if now - last > self.watch_ttl)
+            excess = max(len(unpinned) - expired - self.max_watched, 0) if self.max_watched is not None else 0
+            dropped = [key for _, key in unpinned[:expired + excess]]
+            for key in dropped:
+                for name in self._watched.pop(key)["sources"]:
+                    self._sources.pop(name, None)
+            if dropped:
+                self._cond.notify_all()
+        if dropped:
+            incr("refresher.unwatched", len(dropped))
+        return dropped
+
+    def watched(self):
+        """Watched query keys, most recently searched first."""
+        with self._cond:
+            return sorted(self._watched, key=lambda key: self._watched[key]["last_watched"], reverse=True)
+
+    def is_indexed(self, role, location="Remote"):
+        """True once any site has been refreshed for this query (by this or another process)."""
+        return any(self.store.last_refresh(name) is not None
+                   for name in self.jobspy_sources(role, location or "Remote"))
+
+    # --- scheduling ---
+
+    def start(self):
+        with self._cond:
+            if not self._stopped:
+                return self
+            self._stopped = False
+        self._thread = threading.Thread(target=self._loop, name="refresher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def trigger(self, name):
+        """Runs a source as soon as its rate limit allows."""
+        with self._cond:
+            self._sources[name].next_run = 0.0
+            self._cond.notify_all()
+
+    def wait_for(self, name, timeout=None):
+        """Blocks until `name` has had at least one successful refresh; returns whether it has."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._sources[name].last_success is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def run_once(self):
+        """Refreshes every source now, one after the other, ignoring schedules and rate limits."""
+        for source in list(self._sources.values()):
+            with self._cond:
+                source.running = True
+            self._run(source)
+        return self.status()
+
+    def _loop(self):
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                for source in self._sources.values():
+                    if source.running or source.next_run > now:
+                        continue
+                    ready = self._limits.get(source.limit_key, 0.0)
+                    if ready > now:
+                        source.next_run = ready
+                        continue
+                    self._limits[source.limit_key] = now + self.min_spacing
+                    source.running = True
+                    self._executor.submit(self._run, source)
+                waiting = [s.next_run for s in self._sources.values() if not s.running]
+                self._cond.wait(max(min(waiting) - time.monotonic(), 0) if waiting else None)
+
+    def _run(self, source):
+        started = time.monotonic()
+        attempt = time.time()
+        rows = added = 0
+        error = None
+        try:
+            with span("refresher." + source.name.split(":", 1)[0]):
+                df = source.fetch()
+                rows = 0 if df is None else len(df)
+                added = self.store.upsert(df, source_key=source.name, now=attempt)
+            # Dropping postings no source has seen lately is cheap, but needs no more than the RSS cadence
+            if started - self._last_expire > self.rss_interval:
+                self._last_expire = started
+                self.store.expire()
+                self.prune_watched()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        incr("refresher.runs")
+        if error is None:
+            incr("refresher.rows", rows)
+        else:
+            incr("refresher.errors")
+
+        with self._cond:
+            source.runs += 1
+            source.running = False
+            source.last_attempt = attempt
+            source.last_seconds = time.monotonic() - started
+            if error is None:
+                source.failures = 0
+                source.last_success = attempt
+                source.last_error = None
+                source.last_rows = rows
+                source.total_rows += rows
+                source.added += added
+                delay = self._rng.uniform(1 - self.jitter, 1 + self.jitter) * source.interval
+            else:
+                source.failures += 1
+                source.last_error = error
+                delay = min(self.backoff_max, self.backoff_base * 2 ** (source.failures - 1))
+                # Randomize the upper half so failing sources do not retry in lockstep
+                delay = self._rng.uniform(delay / 2, delay)
+            source.next_run = time.monotonic() + delay
+            self._cond.notify_all()
+
+    # --- metrics ---
+
+    def status(self):
+        """One dict per source: freshness (last success, lag), row counts, failures, next run."""
+        now, wall = time.monotonic(), time.time()
+        with self._cond:
+            return [
+                {
+                    "source": s.name,
+                    "last_success": s.last_success,
+                    # Since the last success, or since startup for a source that never had one
+                    "lag_s": round(wall - (s.last_success or self.started_at), 1),
+                    "last_rows": s.last_rows,
+                    "total_rows": s.total_rows,
+                    "added": s.added,
+                    "runs": s.runs,
+                    "failures": s.failures,
+                    "last_error": s.last_error,
+                    "last_seconds": None if s.last_seconds is None else round(s.last_seconds, 3),
+                    "next_run_in_s": None if s.running else round(max(s.next_run - now, 0), 1),
+                    "running": s.running,
+                }
+                for s in self._sources.values()
+            ]
+
+    def to_prometheus(self, prefix="jobhunter"):
+        """Per-source gauges plus the index size, in Prometheus text format."""
+        status = self.status()
+        gauges = [
+            ("refresh_last_success_timestamp_seconds", "last_success"),
+            ("refresh_lag_seconds", "lag_s"),
+            ("refresh_last_rows", "last_rows"),
+            ("refresh_rows_total", "total_rows"),
+            ("refresh_consecutive_failures", "failures"),
+        ]
+        lines = []
+        for metric, field in gauges:
+            lines.append(f"# TYPE {prefix}_{metric} gauge")
+            for s in status:
+                if s[field] is not None:
+                    lines.append(f'{prefix}_{metric}{{source="{_label(s["source"])}"}} {s[field]}')
+        lines.append(f"# TYPE {prefix}_refresh_watched_queries gauge")
+        lines.append(f"{prefix}_refresh_watched_queries {len(self.watched())}")
+        lines.append(f"# TYPE {prefix}_index_rows gauge")
+        lines.append(f"{prefix}_index_rows {len(self.store)}")
+        return "\n".join(lines) + "\n"
+
+
+def _parse_query(value):
+    role, _, location = value.partition("@")
+    return role.strip(), location.strip() or "Remote"
+
+
+def main(argv=None):
+    from .job_store import JobStore, default_store_path
+
+    ap = argparse.ArgumentParser(description="Keep the local job index fresh in the background.")
+    ap.add_argument("--db", default=default_store_path(), help="SQLite job index (default: JOBHUNTER_JOBS_DB)")
+    ap.add_argument("--query", action="append", default=[], type=_parse_query,
+                    help='"role@location" to scrape with jobspy; repeat for several')
+    ap.add_argument("--sites", nargs="+", default=None, help="jobspy sites (default: all)")
+    ap.add_argument("--rss-interval", type=float, default=DEFAULT_RSS_INTERVAL)
+    ap.add_argument("--jobspy-interval", type=float, default=DEFAULT_JOBSPY_INTERVAL)
+    ap.add_argument("--min-spacing", type=float, default=30, help="seconds between requests to one site")
+    ap.add_argument("--status-every", type=float, default=60)
+    ap.add_argument("--once", action="store_true", help="refresh every source once and exit")
+    args = ap.parse_args(argv)
+
+    if os.path.dirname(args.db):
+        os.makedirs(os.path.dirname(args.db), exist_ok=True)
+    refresher = Refresher(JobStore(args.db), queries=args.query, sites=args.sites,
+                          rss_interval=args.rss_interval, jobspy_interval=args.jobspy_interval,
+                          min_spacing=args.min_spacing)
+
+    def report():
+        for s in refresher.status():
+            state = f"error: {s['last_error']}" if s["last_error"] else "ok"
+            print(f"{s['source']:<48} lag {s['lag_s']:>8.0f}s  rows {s['last_rows']:>5}  "
+                  f"total {s['total_rows']:>6}  next {s['next_run_in_s'] or 0:>6.0f}s  {state}", flush=True)
+        print(f"index: {len(refresher.store)} postings", flush=True)
+
+    if args.once:
+        refresher.run_once()
+        report()
+        return 0
+
+    refresher.start()
+    try:
+        while True:
+            time.sleep(args.status_every)
+            report()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        refresher.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,79 +1,157 @@
+import hashlib
+import os
 import re
-import spacy
-from pdfminer.high_level import extract_text
 from collections import Counter
+from .cache import content_key
+from .contact import contact_summary, extract_contacts
+from .metrics import incr, timed
 
-# Try loading spacy model, else fallback
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    nlp = None
+# Heavy dependencies (pdfminer, spaCy) are imported on first use, not at import time,
+# so the Streamlit cold start, the CLI and batch workers only pay for what they run.
+
+# Bump whenever analyze_resume's scoring rules change so cached results are invalidated
+SCORING_VERSION = 2
+
+# Emails and phone numbers are found by contact.py, in linear time
+# Metrics (e.g., 20%, $50k, 100+): a digit followed by % or +, or $ followed by a digit.
+# Only tested for presence, so the digit runs need no quantifier (\d+% would rescan a
+# long digit run from every start position)
+METRIC_PATTERN = r'\d[%+]|\$\d'
+
+# Group synonyms
+SECTION_GROUPS = {
+    "Experience": ["experience", "work history", "employment"],
+    "Education": ["education", "academic"],
+    "Skills": ["skills", "technologies", "competencies"],
+    "Projects": ["projects"]
+}
+
+# PdfPageStream limits that decide which text a PDF yields; cache keys carry them.
+# max_seconds is not among them: text cut short by the clock is never cached
+_TEXT_BUDGETS = ("max_pages", "max_chars", "max_file_bytes", "enough_chars")
+
+_LAST_SPACE = re.compile(r"\s\S*\Z")
+_FIRST_SPACE = re.compile(r"\s")
+
+_nlp = None
+_nlp_loaded = False
+
+
+def spacy_enabled():
+    """spaCy is opt-in: set JOBHUNTER_ENABLE_SPACY=1 (or pass use_spacy=True to ResumeParser)."""
+    return os.environ.get("JOBHUNTER_ENABLE_SPACY", "").lower() in ("1", "true", "yes")
+
+
+def load_nlp():
+    """Loads en_core_web_sm once per process; None if spaCy or the model is not installed."""
+    global _nlp, _nlp_loaded
+    if not _nlp_loaded:
+        _nlp_loaded = True
+        try:
+            import spacy
+            _nlp = spacy.load("en_core_web_sm")
+        except (ImportError, OSError):
+            _nlp = None
+    return _nlp
+
+
+def __getattr__(name):
+    # Keeps `from src.resume_parser import nlp` working, loading the model on access
+    if name == "nlp":
+        return load_nlp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class ResumeParser:
-    def __init__(self):
-        self.common_skills = {
-            "python", "java", "c++", "javascript", "typescript", "react", "angular", "vue",
-            "html", "css", "sql", "nosql", "mongodb", "postgresql", "aws", "azure", "gcp",
-            "docker", "kubernetes", "git", "ci/cd", "machine learning", "deep learning",
-            "pandas", "numpy", "scikit-learn", "tensorflow", "pytorch", "flask", "django",
-            "fastapi", "spring boot", "node.js", "express", "graphql", "rest api",
-            "communication", "leadership", "teamwork", "problem solving", "agile", "scrum"
-        }
-        self.action_verbs = {
-            "led", "developed", "created", "managed", "designed", "implemented", "optimized",
-            "achieved", "improved", "increased", "decreased", "saved", "launched", "engineered",
-            "architected", "built", "spearheaded", "mentored", "orchestrated", "resolved"
-        }
+    def __init__(self, use_spacy=None, taxonomy=None):
+        self.use_spacy = spacy_enabled() if use_spacy is None else use_spacy
+        # Skills, aliases and action verbs come from the versioned files in taxonomy/
+        # (see taxonomy.py); loading is a cached, pickled artifact after the first run
+        if taxonomy is None:
+            from .taxonomy import get_taxonomy
+            taxonomy = get_taxonomy()
+        self.taxonomy = taxonomy
+        self.common_skills = taxonomy.skills
+        self.action_verbs = taxonomy.verbs
+        self.skill_matcher = taxonomy.matcher
 
+    @property
+    def nlp(self):
+        """The spaCy pipeline, or None when the feature is off or unavailable."""
+        return load_nlp() if self.use_spacy else None
+
+    @timed("resume.extract_text")
     def extract_text_from_pdf(self, pdf_file):
         try:
+            from pdfminer.high_level import extract_text
             text = extract_text(pdf_file)
             return text
         except Exception as e:
             return f"Error extracting text: {str(e)}"
 
+    def config_version(self):
+        """Fingerprint of everything that affects analyze_resume's output."""
+        payload = "|".join([
+            str(SCORING_VERSION),
+            self.taxonomy.fingerprint,
+        ])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @timed("resume.analyze_pdf")
+    def analyze_pdf(self, pdf_bytes, cache=None, **limits):
+        """
+        Extracts and analyzes a PDF given as raw bytes. Returns (text, analysis).
+        Extraction is page by page within the PdfPageStream budgets (overridable via
+        `limits`), so oversized or hostile files cannot pin the process.
+        With a ResultCache, text is keyed by the file hash and the effective page/char
+        budgets, and the analysis additionally by config_version(), so re-uploads and
+        reruns skip pdfminer entirely. Text cut short by max_seconds or an extraction
+        error depends on the run rather than the file, so it is analyzed but not cached.
+        """
+        incr("resume.pdf_bytes_in", len(pdf_bytes))
+        stream = self.stream_pdf_pages(pdf_bytes, **limits)
+        budgets = ",".join(f"{name}={getattr(stream, name)}" for name in _TEXT_BUDGETS)
+        digest = f"{content_key(pdf_bytes)}:{budgets}"
+        analysis_key = f"analysis:{digest}:{self.config_version()}"
+        text_key = f"text:{digest}"
+
+        if cache is not None:
+            entry = cache.get(analysis_key)
+            if entry is not None:
+                return entry["text"], entry["analysis"]
+
+        text = cache.get(text_key) if cache is not None else None
+        cacheable = True
+        if text is None:
+            text = "".join(stream)
+            if stream.error and not text:
+                text = f"Error extracting text: {stream.error}"
+                return text, {"error": text}
+            cacheable = stream.stop_reason not in ("max_seconds", "error")
+            if cache is not None and cacheable:
+                cache.put(text_key, text)
+
+        analysis = self.analyze_resume(text)
+        if cache is not None and cacheable and "error" not in analysis:
+            cache.put(analysis_key, {"text": text, "analysis": analysis})
+        return text, analysis
+
+    @timed("resume.contact_info")
     def extract_contact_info(self, text):
-        info = {
-            "email": None,
-            "phone": None,
-            "linkedin": None,
-            "github": None
-        }
-        
-        # Email
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        email_match = re.search(email_pattern, text)
-        if email_match:
-            info["email"] = email_match.group(0)
-
-        # Phone (simple regex, can be improved with phonenumbers lib)
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\(?\d{3}\)?[-.]?\d{3}[-.]?\d{4}'
-        phone_match = re.search(phone_pattern, text)
-        if phone_match:
-            info["phone"] = phone_match.group(0)
-
-        # Links
-        if "linkedin.com/in/" in text.lower():
-            info["linkedin"] = "Found"
-        if "github.com/" in text.lower():
-            info["github"] = "Found"
-            
-        return info
+        """First email and phone, and whether LinkedIn / GitHub profiles are linked."""
+        return contact_summary(extract_contacts(text))
 
+    @timed("resume.contacts")
+    def extract_contacts(self, text):
+        """Every distinct email, phone and profile URL, in document order (see contact.py)."""
+        return extract_contacts(text)
+
+    @timed("resume.sections")
     def check_sections(self, text):
         text_lower = text.lower()
         found_sections = []
         missing_sections = []
         
-        # Group synonyms
-        section_groups = {
-            "Experience": ["experience", "work history", "employment"],
-            "Education": ["education", "academic"],
-            "Skills": ["skills", "technologies", "competencies"],
-            "Projects": ["projects"]
-        }
-        
-        for section, keywords in section_groups.items():
+        for section, keywords in SECTION_GROUPS.items():
             if any(k in text_lower for k in keywords):
                 found_sections.append(section)
             else:
@@ -81,19 +159,16 @@ class ResumeParser:
                 
         return found_sections, missing_sections
 
+    @timed("resume.skills")
     def extract_skills(self, text):
-        text_lower = text.lower()
-        found_skills = []
-        
-        # Direct string matching for defined skills
-        for skill in self.common_skills:
-            # Word boundary check to avoid partial matches (e.g., "java" in "javascript")
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
-                
-        return found_skills
+        # One scan over the text for the whole vocabulary (see skill_matcher.py)
+        return self.skill_matcher.find(text.lower())
 
+    def match_skills(self, text):
+        """Returns {skill: [positions]} so callers can use hit counts and locations."""
+        return self.skill_matcher.match(text.lower())
+
+    @timed("resume.content_quality")
     def check_content_quality(self, text):
         text_lower = text.lower()
         details = {
@@ -111,22 +186,25 @@ class ResumeParser:
         details["verb_count"] = len(details["action_verbs"])
 
         # Check for Metrics (e.g., 20%, $50k, 100+)
-        # Pattern: number followed by % or preceded by $ or number+
-        metric_pattern = r'\d+%|\$\d+|\d+\+'
-        if re.search(metric_pattern, text):
+        if re.search(METRIC_PATTERN, text):
             details["metrics"] = True
             
         return details
 
+    @timed("resume.analyze")
     def analyze_resume(self, text):
         if not text or len(text) < 50:
             return {"error": "Resume text is too short or empty."}
+        incr("resume.chars_in", len(text))
 
-        contact_info = self.extract_contact_info(text)
-        found_sections, missing_sections = self.check_sections(text)
-        found_skills = self.extract_skills(text)
-        quality_check = self.check_content_quality(text)
-        
+        # One tokenizing pass computes every check; same output as calling
+        # extract_contacts / check_sections / extract_skills / check_content_quality
+        from .text_analyzer import fused_analysis
+        return self.build_result(*fused_analysis(text, self.skill_matcher, self.action_verbs))
+
+    def build_result(self, contacts, found_sections, missing_sections, found_skills, quality_check, word_count):
+        """Scores the individual checks and assembles the analyze_resume() result dict."""
+        contact_info = contact_summary(contacts)
         # Scoring Logic
         score = 0
         
@@ -152,7 +230,6 @@ class ResumeParser:
         if quality_check["metrics"]: score += 10
         
         # 5. Formatting/Length (10 pts)
-        word_count = len(text.split())
         if 200 <= word_count <= 1000:
             score += 10
         elif word_count > 1000:
@@ -165,6 +242,7 @@ class ResumeParser:
         return {
             "score": score,
             "contact_info": contact_info,
+            "contacts": contacts,
             "found_sections": found_sections,
             "missing_sections": missing_sections,
             "skills": found_skills,
@@ -173,6 +251,105 @@ class ResumeParser:
             "summary_feedback": self.generate_feedback(score, missing_sections, contact_info, quality_check)
         }
 
+    def stream_pdf_pages(self, pdf_file, **limits):
+        """
+        Page-by-page text of a PDF (path, bytes or file object) with page/char/time/size
+        budgets; see PdfPageStream for the limits and the stats it records.
+        """
+        from .pdf_stream import PdfPageStream
+        return PdfPageStream(pdf_file, **limits)
+
+    @timed("resume.analyze_stream")
+    def analyze_stream(self, pages, overlap=256):
+        """
+        Analyzes text arriving in chunks (e.g. stream_pdf_pages) without keeping the whole
+        document. Produces the same result dict as analyze_resume() on the joined text.
+
+        Chunks are scanned in regions that end on whitespace (a trailing partial word is
+        carried into the next chunk), and each region is prefixed with up to `overlap`
+        already-scanned characters so matches spanning a page break are not lost.
+        """
+        state = {
+            "contacts": None,
+            "section_order": None,
+            "found_sections": set(),
+            "skills": {},
+            "verbs": {},
+            "metrics": False,
+            "word_count": 0,
+            "scanned": 0,
+            "tail": "",
+        }
+        carry = ""
+        total_chars = 0
+
+        for page in pages:
+            if not page:
+                continue
+            total_chars += len(page)
+            text = carry + page
+            m = _LAST_SPACE.search(text)
+            if m is None:
+                carry = text
+                continue
+            self._scan_region(state, text[:m.start() + 1], overlap)
+            carry = text[m.start() + 1:]
+        if carry:
+            self._scan_region(state, carry, overlap)
+
+        if total_chars < 50:
+            return {"error": "Resume text is too short or empty."}
+
+        order = state["section_order"] or []
+        found_list = [s for s in order if s in state["found_sections"]]
+        missing_list = [s for s in order if s not in state["found_sections"]]
+        verbs = list(state["verbs"])
+        quality_check = {"action_verbs": verbs, "metrics": state["metrics"], "verb_count": len(verbs)}
+        found_skills = sorted(state["skills"], key=state["skills"].get)
+        return self.build_result(state["contacts"], found_list, missing_list, found_skills,
+                                 quality_check, state["word_count"])
+
+    def _scan_region(self, state, region, overlap):
+        tail = state["tail"]
+        window = tail + region
+        offset = state["scanned"] - len(tail)
+        state["scanned"] += len(region)
+        # The region starts right after whitespace, so its words are complete
+        state["word_count"] += len(region.split())
+
+        # Contacts ending inside the tail were already taken from the previous window
+        state["contacts"] = extract_contacts(window, after=len(tail), into=state["contacts"])
+
+        found, missing = self.check_sections(window)
+        if state["section_order"] is None:
+            state["section_order"] = found + missing
+        state["found_sections"].update(found)
+
+        # Keep the earliest document position so the order matches extract_skills()
+        for skill, positions in self.match_skills(window).items():
+            state["skills"].setdefault(skill, offset + positions[0])
+
+        quality = self.check_content_quality(window)
+        for verb in quality["action_verbs"]:
+            state["verbs"].setdefault(verb, None)
+        state["metrics"] = state["metrics"] or quality["metrics"]
+
+        # Carry-over must start on whitespace: a window opening mid-word would
+        # create a false word boundary (e.g. "git" out of "legit")
+        tail = window[-overlap:]
+        if len(window) > overlap and not window[-overlap - 1].isspace():
+            m = _FIRST_SPACE.search(tail)
+            tail = tail[m.start():] if m else ""
+        state["tail"] = tail
+
+    def analyze_batch(self, paths_or_texts, workers=None, ordered=True):
+        """
+        Analyzes many resumes (PDF paths or raw text) across a process pool.
+        Yields {"index", "source", "analysis"} dicts; a bad PDF only fails its own entry.
+        """
+        from .batch import analyze_batch
+        return analyze_batch(paths_or_texts, workers=workers, ordered=ordered)
+
     def generate_feedback(self, score, missing_sections, contact_info, quality_check):
         feedback = []
         if score < 50:
@@ -0,0 +1,359 @@
+"""
+Headless HTTP service for resume scoring.
+
+Usage:
+    python -m src.service --port 8000 --workers 4
+
+    curl -X POST localhost:8000/analyze -H "Content-Type: application/json" -d '{"text": "..."}'
+    curl -X POST localhost:8000/analyze/pdf -H "Content-Type: application/pdf" --data-binary @resume.pdf
+
+Endpoints:
+    POST /analyze      JSON {"text": ...} (or a text/plain body) -> {"analysis": ...}
+    POST /analyze/pdf  raw PDF bytes -> {"analysis": ..., "extraction": ...}
+    GET  /health       queue depth and batches in flight
+    GET  /metrics      Prometheus text (timings need JOBHUNTER_METRICS=1); spans recorded in
+                       the worker processes are merged in after every batch
+
+A plain ASGI app, so any ASGI server can host it; the CLI uses uvicorn.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .batch import analyze_many_reporting, failure_result, warm_worker
+from .metrics import incr, metrics, span
+from .pdf_stream import DEFAULT_MAX_FILE_BYTES
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class MicroBatcher:
+    """
+    Collects concurrent requests into batches for a worker pool.
+
+    A batch is dispatched once it holds `max_batch` items or its first item has waited
+    `max_wait` seconds. At most `max_inflight` batches run at once; while they do, new
+    requests wait in a queue of `queue_limit` items, and submit() raises QueueFullError
+    beyond that so callers can shed load instead of piling up latency.
+
+    If a worker process dies the pool is unusable; `restart` (a callable returning a new
+    executor) replaces it, and the batch is retried item by item so only the request
+    that kills a worker fails.
+    """
+
+    def __init__(self, executor, max_batch=16, max_wait=0.005, queue_limit=256, max_inflight=1, restart=None):
+        self.executor = executor
+        self.restart = restart
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue_limit = queue_limit
+        self.max_inflight = max_inflight
+        self.inflight = 0
+        self._queue = None
+        self._slots = None
+        self._task = None
+        self._pending = set()
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.queue_limit)
+        self._slots = asyncio.Semaphore(self.max_inflight)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def queued(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, item):
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((item, future))
+        except asyncio.QueueFull:
+            raise QueueFullError(f"{self.queue_limit} requests already queued") from None
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Only pull from the queue once a worker slot is free, so the backlog stays
+            # bounded by the queue (and rejected early) rather than by our own lists
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            task = asyncio.create_task(self._dispatch(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _dispatch(self, batch):
+        self.inflight += 1
+        incr("service.batches")
+        incr("service.batched_items", len(batch))
+        try:
+            # Skip requests whose client already gave up
+            live = [(i, item, future) for i, (item, future) in enumerate(batch) if not future.done()]
+            if not live:
+                return
+            with span("service.batch"):
+                results = await self._analyze([(i, item) for i, item, _ in live])
+            for (_, _, future), result in zip(live, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self.inflight -= 1
+            self._slots.release()
+
+    async def _analyze(self, items):
+        try:
+            return await self._call(items)
+        except BrokenProcessPool:
+            if self.restart is None:
+                raise
+        # Some item in the batch killed its worker: retry them alone to find out which
+        results = []
+        for index, item in items:
+            try:
+                results.extend(await self._call([(index, item)]))
+            except BrokenProcessPool:
+                results.append(failure_result(index, item, "worker process died while analyzing this resume"))
+        return results
+
+    async def _call(self, items):
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            results, worker_metrics = await loop.run_in_executor(executor, analyze_many_reporting, items)
+        except BrokenProcessPool:
+            incr("service.worker_crashes")
+            # Batches in flight on the same pool all fail; only the first replaces it
+            if self.restart is not None and self.executor is executor:
+                self.executor = self.restart()
+            raise
+        metrics.merge(worker_metrics)
+        return results
+
+
+class ResumeService:
+    """ASGI app exposing ResumeParser.analyze_resume and PDF analysis over HTTP."""
+
+    def __init__(self, workers=None, max_batch=16, max_wait_ms=5, queue_limit=256,
+                 max_body_bytes=DEFAULT_MAX_FILE_BYTES, request_timeout=30.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.queue_limit = queue_limit
+        self.max_body_bytes = max_body_bytes
+        self.request_timeout = request_timeout
+        self.executor = None
+        self.batcher = None
+        self._start_lock = asyncio.Lock()
+
+    async def startup(self):
+        # One warm parser per worker process: the initializer builds it on spawn, and one
+        # task per worker makes sure every process exists before the first request
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, warm_worker) for _ in range(self.workers)))
+        self.batcher = MicroBatcher(self.executor, max_batch=self.max_batch, max_wait=self.max_wait,
+                                    queue_limit=self.queue_limit, max_inflight=self.workers,
+                                    restart=self._restart_executor)
+        await self.batcher.start()
+
+    def _restart_executor(self):
+        """Replaces a pool broken by a dead worker; the new workers warm up on spawn."""
+        broken = self.executor
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker)
+        if broken is not None:
+            broken.shutdown(wait=False, cancel_futures=True)
+        return self.executor
+
+    async def shutdown(self):
+        if self.batcher is not None:
+            await self.batcher.stop()
+            self.batcher = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        method, path = scope["method"], scope["path"].rstrip("/") or "/"
+        if self.batcher is None:
+            # Hosted without lifespan support: start lazily on the first request
+            async with self._start_lock:
+                if self.batcher is None:
+                    await self.startup()
+
+        if path == "/health" and method == "GET":
+            return await _send_json(send, 200, {
+                "status": "ok",
+                "workers": self.workers,
+                "queued": self.batcher.queued(),
+                "inflight_batches": self.batcher.inflight,
+            })
+        if path == "/metrics" and method == "GET":
+            return await _send(send, 200, metrics.to_prometheus().encode(), "text/plain; version=0.0.4")
+        if path not in ("/analyze", "/analyze/pdf"):
+            return await _send_json(send, 404, {"error": "Not found"})
+        if method != "POST":
+            return await _send_json(send, 405, {"error": "Method not allowed"}, [(b"allow", b"POST")])
+
+        body = await self._read_body(scope, receive)
+        if body is None:
+            return await _send_json(send, 413, {"error": f"Body larger than {self.max_body_bytes} bytes"})
+
+        if path == "/analyze/pdf":
+            if not body.startswith(b"%PDF"):
+                return await _send_json(send, 415, {"error": "Expected raw PDF bytes"})
+            item = ("pdf", body)
+        else:
+            text = _text_from_body(_header(scope, b"content-type"), body)
+            if text is None:
+                return await _send_json(send, 400, {"error": 'Expected JSON {"text": "..."} or a text/plain body'})
+            # Always tagged as text: a body that looks like a file path must never be opened
+            item = ("text", text)
+
+        try:
+            result = await asyncio.wait_for(self.batcher.submit(item), self.request_timeout)
+        except QueueFullError as e:
+            incr("service.rejected")
+            return await _send_json(send, 503, {"error": f"Server busy: {e}"}, [(b"retry-after", b"1")])
+        except asyncio.TimeoutError:
+            incr("service.timeouts")
+            return await _send_json(send, 504, {"error": "Analysis timed out"})
+        except Exception as e:
+            return await _send_json(send, 500, {"error": f"Worker failed: {str(e)}"})
+
+        payload = {"analysis": result["analysis"]}
+        if "extraction" in result:
+            payload["extraction"] = result["extraction"]
+        status = 422 if "error" in result["analysis"] else 200
+        await _send_json(send, status, payload)
+
+    async def _read_body(self, scope, receive):
+        """Whole request body, or None once it exceeds max_body_bytes."""
+        length = _header(scope, b"content-length")
+        if length and length.isdigit() and int(length) > self.max_body_bytes:
+            return None
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+
+def _header(scope, name):
+    for key, value in scope.get("headers", ()):
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _text_from_body(content_type, body):
+    if content_type and content_type.startswith("text/plain"):
+        return body.decode("utf-8", errors="replace")
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict) or not isinstance(payload.get("text"), str):
+        return None
+    return payload["text"]
+
+
+async def _send(send, status, body, content_type, headers=()):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode()), *headers],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(send, status, payload, headers=()):
+    await _send(send, status, json.dumps(payload).encode(), "application/json", headers)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Serve resume analysis over HTTP.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--workers", type=int, default=None, help="analysis processes (default: CPU count)")
+    ap.add_argument("--max-batch", type=int, default=16, help="most requests per worker call")
+    ap.add_argument("--max-wait-ms", type=float, default=5, help="how long a batch waits to fill up")
+    ap.add_argument("--queue-limit", type=int, default=256, help="queued requests before answering 503")
+    args = ap.parse_args(argv)
+
+    try:
+        import uvicorn
+    except ImportError:
+        print("The service needs uvicorn: pip install uvicorn", file=sys.stderr)
+        return 1
+
+    app = ResumeService(workers=args.workers, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms,
+                        queue_limit=args.queue_limit)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+import re
+from functools import lru_cache
+
+_WORD_RUN = re.compile(r"\w+")
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+def _trie_pattern(terms):
+    """Builds a regex alternation shaped like a trie so the engine walks shared prefixes once."""
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        ends = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if ends:
+            # Greedy optional: try the longer term first, fall back to the shorter one
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    """
+    Finds every skill of a fixed vocabulary in a single scan of the text.
+    Matches follow the same word-boundary rule as r'\\b' + re.escape(skill) + r'\\b'.
+
+    `aliases` maps extra spellings to a skill ({"k8s": "kubernetes"}); hits on an alias
+    are reported under the skill it stands for.
+
+    Terms are indexed by their first word (a run of \\w characters). One pass of a
+    trie regex over those first words finds every candidate position, so the cost
+    follows the text, not the vocabulary; only the terms sharing a first word are then
+    compared at each hit. The rare terms that start with a non-word character (".net")
+    go through a second, small trie regex. Both regexes are compiled on first use, and
+    the matcher pickles as plain containers, so it loads quickly.
+    """
+
+    def __init__(self, skills, aliases=None):
+        canonical = {s.lower(): s.lower() for s in skills if s}
+        for alias, skill in (aliases or {}).items():
+            if alias and skill:
+                canonical.setdefault(alias.lower(), skill.lower())
+        self.skills = sorted(set(canonical.values()))
+        self._canonical = canonical
+
+        self._by_head = {}
+        odd = []
+        for term in canonical:
+            m = _WORD_RUN.match(term)
+            if m is None:
+                odd.append(term)
+            else:
+                self._by_head.setdefault(m.group(0), []).append(term)
+        for terms in self._by_head.values():
+            terms.sort(key=len, reverse=True)
+        self._odd_terms = sorted(odd)
+        self._odd_regex = None
+        self._heads_regex = None
+        self._spaced = None
+
+    @property
+    def aliases(self):
+        """{alias: skill} for the extra spellings this matcher knows."""
+        return {term: skill for term, skill in self._canonical.items() if term != skill}
+
+    def canonical(self, term):
+        """The skill `term` names (itself, or the skill it is an alias of), or None if unknown."""
+        return self._canonical.get(term.lower())
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_odd_regex"] = None
+        state["_heads_regex"] = None
+        return state
+
+    def _odd_hits(self, text_lower):
+        if not self._odd_terms:
+            return []
+        if self._odd_regex is None:
+            # Zero-width lookahead so overlapping and nested terms are all seen
+            self._odd_regex = re.compile(r"(?=\b(" + _trie_pattern(self._odd_terms) + r"))")
+        hits = []
+        for m in self._odd_regex.finditer(text_lower):
+            pos = m.start(1)
+            hits.extend((pos, term) for term in self._terms_at(text_lower, pos, self._odd_terms))
+        return hits
+
+    def _ends_ok(self, text_lower, term, pos):
+        end = pos + len(term)
+        after = end < len(text_lower) and _is_word_char(text_lower[end])
+        return after != _is_word_char(term[-1])
+
+    def _terms_at(self, text_lower, pos, terms):
+        """Terms from `terms` that match at `pos` (start boundary already checked)."""
+        return [t for t in terms if text_lower.startswith(t, pos) and self._ends_ok(text_lower, t, pos)]
+
+    def _head_positions(self, text_lower):
+        """{head: [positions]} for every head occurring as a whole word, in one scan of the text."""
+        found = {}
+        if not self._by_head:
+            return found
+        if self._heads_regex is None:
+            # A head is a whole word, so at most one of them matches at any position
+            self._heads_regex = re.compile(r"\b(?:" + _trie_pattern(sorted(self._by_head)) + r")\b")
+        for m in self._heads_regex.finditer(text_lower):
+            found.setdefault(m.group(0), []).append(m.start())
+        return found
+
+    def _term_positions(self, text_lower):
+        """Yields (term, [positions]) for every term with at least one match, aliases included."""
+        by_head = self._by_head
+        for head, positions in self._head_positions(text_lower).items():
+            for term in by_head[head]:
+                if term != head:
+                    term_positions = [pos for pos in positions
+                                      if text_lower.startswith(term, pos) and self._ends_ok(text_lower, term, pos)]
+                    if term_positions:
+                        yield term, term_positions
+                else:
+                    yield term, positions
+        odd = {}
+        for pos, term in self._odd_hits(text_lower):
+            odd.setdefault(term, []).append(pos)
+        yield from odd.items()
+
+    def _raw_hits(self, text_lower):
+        """(position, term) for every match of every term, including aliases."""
+        return [(pos, term) for term, positions in self._term_positions(text_lower) for pos in positions]
+
+    def hit_positions(self, text_lower):
+        """
+        {skill: [start positions]} like match(), but unsorted, and a position can repeat
+        when a skill and its alias both match there. For bulk callers that only need to
+        know where skills occur (skips ordering every hit).
+        """
+        hits = {}
+        canonical = self._canonical
+        for term, positions in self._term_positions(text_lower):
+            hits.setdefault(canonical[term], []).extend(positions)
+        return hits
+
+    def _ordered(self, hits):
+        """
+        Sorts hits by position; at one position (where all terms are prefixes of each
+        other) the longest term comes first, then the shorter ones by ascending length.
+        """
+        longest = {}
+        for pos, term in hits:
+            if len(term) > longest.get(pos, 0):
+                longest[pos] = len(term)
+        return sorted(set(hits), key=lambda h: (h[0], len(h[1]) != longest[h[0]], len(h[1])))
+
+    def terms_at(self, text_lower, pos):
+        """Skills matching at `pos`, in the order match() records them."""
+        starts_word = _is_word_char(text_lower[pos])
+        before = pos > 0 and _is_word_char(text_lower[pos - 1])
+        hits = []
+        if before != starts_word:
+            if starts_word:
+                candidates = self._by_head.get(_WORD_RUN.match(text_lower, pos).group(0), ())
+            else:
+                candidates = self._odd_terms
+            hits = [(pos, t) for t in self._terms_at(text_lower, pos, candidates)]
+        skills = []
+        for _, term in self._ordered(hits):
+            skill = self._canonical[term]
+            if skill not in skills:
+                skills.append(skill)
+        return skills
+
+    def first_position(self, text_lower, term):
+        """Earliest index where `term` matches with word boundaries (str.find + boundary checks)."""
+        starts_word = _is_word_char(term[0])
+        ends_word = _is_word_char(term[-1])
+        end_offset = len(term)
+        pos = text_lower.find(term)
+        while pos != -1:
+            before = pos > 0 and _is_word_char(text_lower[pos - 1])
+            after = pos + end_offset < len(text_lower) and _is_word_char(text_lower[pos + end_offset])
+            # \b holds where word-ness differs across the edge
+            if before != starts_word and after != ends_word:
+                return pos
+            pos = text_lower.find(term, pos + 1)
+        return None
+
+    def find_tokenized(self, token_blob_lower, text_lower):
+        """
+        Same result as find(text_lower), but scans only `token_blob_lower`: the distinct
+        whitespace-separated tokens of the text joined by newlines. Terms without whitespace
+        can only match inside one token, so the blob decides which of them occur; the full
+        text is only searched (with str.find) to order the hits and for multi-word terms.
+        """
+        if not self.skills:
+            return []
+        found = {term for _, term in self._raw_hits(token_blob_lower)}
+        for term, parts in self._spaced_terms():
+            if all(part in token_blob_lower for part in parts):
+                found.add(term)
+
+        positions = {}
+        for term in found:
+            pos = self.first_position(text_lower, term)
+            if pos is not None:
+                skill = self._canonical[term]
+                if pos < positions.get(skill, len(text_lower)):
+                    positions[skill] = pos
+
+        # Tie-break like match(): at a shared position, the order terms_at() gives
+        groups = {}
+        for skill, pos in positions.items():
+            groups.setdefault(pos, []).append(skill)
+        rank = {}
+        for pos, skills in groups.items():
+            if len(skills) > 1:
+                order = self.terms_at(text_lower, pos)
+                for skill in skills:
+                    rank[skill] = order.index(skill)
+        return sorted(positions, key=lambda s: (positions[s], rank.get(s, 0)))
+
+    def _spaced_terms(self):
+        if self._spaced is None:
+            self._spaced = [(t, t.split()) for t in self._canonical if any(ch.isspace() for ch in t)]
+        return self._spaced
+
+    def match(self, text_lower):
+        """Returns {skill: [start positions]} for every hit in already lowercased text."""
+        hits = {}
+        if not self.skills or not text_lower:
+            return hits
+        canonical = self._canonical
+        for pos, term in self._ordered(self._raw_hits(text_lower)):
+            positions = hits.setdefault(canonical[term], [])
+            # A skill and its alias can both match at one position; record it once
+            if not positions or positions[-1] != pos:
+                positions.append(pos)
+        return hits
+
+    def counts(self, text_lower):
+        return {skill: len(positions) for skill, positions in self.match(text_lower).items()}
+
+    def find(self, text_lower):
+        """Returns the distinct skills found, ordered by first appearance."""
+        hits = self.match(text_lower)
+        return sorted(hits, key=lambda s: hits[s][0])
+
+
+@lru_cache(maxsize=8)
+def get_skill_matcher(skills, aliases=None):
+    """
+    Process-wide cache so each vocabulary is indexed once, not per parser.
+    `skills` is a frozenset; `aliases`, if given, a frozenset of (alias, skill) pairs.
+    """
+    return SkillMatcher(skills, dict(aliases) if aliases else None)
+
+
+def as_matcher(vocabulary):
+    """A SkillMatcher as is, or the cached matcher for a plain collection of skills."""
+    if isinstance(vocabulary, SkillMatcher):
+        return vocabulary
+    return get_skill_matcher(frozenset(vocabulary))
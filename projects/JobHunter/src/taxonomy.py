@@ -0,0 +1,215 @@
+"""
+Skill and action-verb taxonomy loaded from data files.
+
+A taxonomy file (JSON, or YAML when PyYAML is installed) looks like:
+
+    {
+      "name": "jobhunter-default",
+      "version": "1.0.0",
+      "categories": {"Cloud & DevOps": ["docker", "kubernetes"], ...},
+      "aliases": {"kubernetes": ["k8s"], ...},
+      "verbs": ["led", "developed", ...]
+    }
+
+Skills are the union of all category lists; aliases map extra spellings onto a skill.
+Several files can be layered (later ones add skills, aliases and verbs, and may move a
+skill to another category). Set JOBHUNTER_TAXONOMY to a list of files separated by
+os.pathsep to replace the bundled taxonomy/default.json.
+
+The compiled form (vocabulary, alias map and SkillMatcher index) is pickled next to the
+job index, keyed by a hash of the source files, so later processes load it in a few
+milliseconds instead of rebuilding it:
+
+    python -m src.taxonomy compile [files...] [--out path]
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from functools import lru_cache
+
+from .metrics import timed
+from .skill_matcher import SkillMatcher
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_FILES = (os.path.join(PROJECT_DIR, "taxonomy", "default.json"),)
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_DIR, "data", "taxonomy")
+
+# Bump whenever Taxonomy or SkillMatcher change shape, so old artifacts are ignored
+ARTIFACT_FORMAT = 3
+
+
+class Taxonomy:
+    """Compiled taxonomy: vocabulary, aliases, categories, verbs and a ready SkillMatcher."""
+
+    def __init__(self, skills, aliases, categories, verbs, versions, fingerprint):
+        self.skills = frozenset(skills)
+        self.aliases = dict(aliases)        # alias -> skill
+        self.categories = dict(categories)  # skill -> category
+        self.verbs = tuple(verbs)           # file order, so reported verbs are stable
+        self.versions = list(versions)      # [(name, version)] per source file
+        self.fingerprint = fingerprint
+        self.matcher = SkillMatcher(self.skills, self.aliases)
+
+    def canonical(self, term):
+        """The skill a term or alias stands for, or None."""
+        term = term.lower()
+        return term if term in self.skills else self.aliases.get(term)
+
+    def category_of(self, skill):
+        return self.categories.get(skill.lower())
+
+    def by_category(self, skills):
+        """Groups skills (e.g. an analysis' found skills) as {category: [skills]}."""
+        groups = {}
+        for skill in skills:
+            groups.setdefault(self.category_of(skill) or "Other", []).append(skill)
+        return groups
+
+    @property
+    def version(self):
+        return "+".join(f"{name}@{version}" for name, version in self.versions)
+
+    def __repr__(self):
+        return f"<Taxonomy {self.version}: {len(self.skills)} skills, {len(self.aliases)} aliases, {len(self.verbs)} verbs>"
+
+
+def read_source(path):
+    """Parses one taxonomy file (.json, or .yaml/.yml with PyYAML installed)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.lower().endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError(f"Reading {path} needs PyYAML: pip install pyyaml") from None
+        doc = yaml.safe_load(data)
+    else:
+        doc = json.loads(data)
+    if not isinstance(doc, dict):
+        raise ValueError(f"{path}: expected a mapping at the top level")
+    return doc
+
+
+def compile_taxonomy(paths):
+    """Reads and merges the source files into a Taxonomy (no artifact involved)."""
+    categories, aliases, verbs, versions = {}, {}, {}, []
+    for path in paths:
+        doc = read_source(path)
+        versions.append((doc.get("name") or os.path.basename(path), str(doc.get("version", "0"))))
+        for category, terms in (doc.get("categories") or {}).items():
+            for term in terms:
+                categories[term.strip().lower()] = category
+        for skill, spellings in (doc.get("aliases") or {}).items():
+            if isinstance(spellings, str):
+                spellings = [spellings]
+            for alias in spellings:
+                aliases[alias.strip().lower()] = skill.strip().lower()
+        for verb in doc.get("verbs") or ():
+            verbs.setdefault(verb.strip().lower(), None)
+
+    unknown = sorted({skill for skill in aliases.values() if skill not in categories})
+    if unknown:
+        raise ValueError(f"Aliases point at skills that no category lists: {', '.join(unknown)}")
+    # An alias spelled like a real skill would hide that skill
+    aliases = {alias: skill for alias, skill in aliases.items() if alias not in categories}
+    return Taxonomy(categories, aliases, categories, verbs, versions, fingerprint(paths))
+
+
+def fingerprint(paths):
+    digest = hashlib.sha256(f"format={ARTIFACT_FORMAT}".encode())
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:16]
+
+
+def save_artifact(taxonomy, path):
+    """Pickles atomically, so concurrent workers never read a half-written file."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(taxonomy, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_artifact(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def artifact_path(paths, cache_dir=None):
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"taxonomy-{fingerprint(paths)}.pkl")
+
+
+@timed("taxonomy.load")
+def load_taxonomy(paths=None, cache_dir=None):
+    """
+    Returns the Taxonomy for `paths` (default: JOBHUNTER_TAXONOMY or the bundled file),
+    from the compiled artifact when one matches the current files, else compiling it
+    and saving the artifact for next time. An unwritable cache dir only costs the rebuild.
+    """
+    paths = tuple(paths or configured_files())
+    path = artifact_path(paths, cache_dir)
+    try:
+        return load_artifact(path)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        pass
+    taxonomy = compile_taxonomy(paths)
+    try:
+        save_artifact(taxonomy, path)
+    except OSError:
+        pass
+    return taxonomy
+
+
+def configured_files():
+    value = os.environ.get("JOBHUNTER_TAXONOMY")
+    if value:
+        return tuple(p for p in value.split(os.pathsep) if p)
+    return DEFAULT_FILES
+
+
+@lru_cache(maxsize=4)
+def get_taxonomy(paths=None):
+    """Process-wide taxonomy; `paths` is a tuple of files (default: configured_files())."""
+    return load_taxonomy(paths)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Compile skill taxonomy files into a matcher artifact.")
+    sub = ap.add_subparsers(dest="command", required=True)
+    compile_cmd = sub.add_parser("compile", help="build the artifact and report load time")
+    compile_cmd.add_argument("files", nargs="*", help="taxonomy files (default: configured taxonomy)")
+    compile_cmd.add_argument("--out", default=None, help="artifact path (default: data/taxonomy/<hash>.pkl)")
+    args = ap.parse_args(argv)
+
+    paths = tuple(args.files) or configured_files()
+    start = time.perf_counter()
+    taxonomy = compile_taxonomy(paths)
+    compile_s = time.perf_counter() - start
+
+    out = args.out or artifact_path(paths)
+    save_artifact(taxonomy, out)
+    start = time.perf_counter()
+    load_artifact(out)
+    load_s = time.perf_counter() - start
+
+    print(repr(taxonomy))
+    print(f"compiled in {compile_s * 1000:.1f}ms -> {out} ({os.path.getsize(out) / 1024:.0f} KiB)")
+    print(f"artifact loads in {load_s * 1000:.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
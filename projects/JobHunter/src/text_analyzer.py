@@ -0,0 +1,82 @@
+import re
+
+from .contact import extract_contacts
+from .metrics import span
+from .resume_parser import METRIC_PATTERN, SECTION_GROUPS
+from .skill_matcher import as_matcher
+
+_METRIC = re.compile(METRIC_PATTERN)
+# Separators str.split() breaks on but bytes.split() does not
+_STR_ONLY_SPACES = (b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+
+
+def distinct_tokens(text):
+    """
+    (word count, distinct whitespace-separated tokens joined by newlines): the same as
+    len(text.split()) and "\n".join(set(text.split())), up to the order of the tokens.
+    ASCII text (a check that costs nothing) is split as bytes, which are quicker to
+    create and hash than str.
+    """
+    if text.isascii():
+        data = text.encode("ascii")
+        if not any(sep in data for sep in _STR_ONLY_SPACES):
+            tokens = data.split()
+            return len(tokens), b"\n".join(set(tokens)).decode("ascii")
+    tokens = text.split()
+    return len(tokens), "\n".join(set(tokens))
+
+
+def fused_analysis(text, skills, action_verbs):
+    """
+    Computes every input of ResumeParser.build_result() with a single tokenizing pass.
+
+    distinct_tokens() is the only tokenizing traversal of the full text: it yields the
+    word count and the set of distinct tokens. Everything that cannot span whitespace (metrics, single-token
+    skills and keywords, verbs) is then checked against a buffer of those distinct tokens,
+    which is a few KB even for very long resumes. The lowered full text is only searched
+    with str.find to order skills and for multi-word terms. Contacts (phone numbers may
+    contain spaces) come from extract_contacts(), itself linear in the text length; the
+    token buffer tells it which email/profile scans can stop at the first match.
+
+    `skills` is a SkillMatcher (e.g. a Taxonomy's, so aliases count) or a plain vocabulary.
+    Returns (contacts, found_sections, missing_sections, skills, quality_check, word_count),
+    identical to running the individual ResumeParser checks. Each phase is recorded under
+    the span name of the check it replaces, plus resume.tokenize for the shared pass.
+    """
+    with span("resume.tokenize"):
+        word_count, blob = distinct_tokens(text)
+        blob_lower = blob.lower()
+        text_lower = text.lower()
+
+    with span("resume.contacts"):
+        contacts = extract_contacts(text, text_lower, token_blob_lower=blob_lower)
+
+    # Sections: keywords with spaces need the full text, the rest only the token buffer
+    with span("resume.sections"):
+        found_sections, missing_sections = [], []
+        for section, keywords in SECTION_GROUPS.items():
+            hit = False
+            for k in keywords:
+                if " " in k:
+                    hit = all(part in blob_lower for part in k.split()) and k in text_lower
+                else:
+                    hit = k in blob_lower
+                if hit:
+                    break
+            (found_sections if hit else missing_sections).append(section)
+
+    with span("resume.skills"):
+        found_skills = as_matcher(skills).find_tokenized(blob_lower, text_lower)
+
+    # Content quality (same literal check as check_content_quality)
+    with span("resume.content_quality"):
+        verbs = []
+        if "\\b" in blob_lower:
+            verbs = [v for v in action_verbs if "\\b" + v + "\\b" in blob_lower and v in blob_lower]
+        quality_check = {
+            "action_verbs": verbs,
+            "metrics": _METRIC.search(blob) is not None,
+            "verb_count": len(verbs),
+        }
+
+    return contacts, found_sections, missing_sections, found_skills, quality_check, word_count